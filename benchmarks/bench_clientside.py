@@ -0,0 +1,116 @@
+"""Compare filter latency of server-side and in-browser filtering.
+
+    python -m benchmarks.bench_clientside --rows 1000 10000 50000
+
+Server mode: the time for one script rerun after a category is toggled,
+driven through AppTest against a synthetic catalog with aggregation off,
+plus the figure JSON re-sent per change. Browser mode: the time the page's
+own filter code takes to rebuild the technology trace, run under Node, plus
+the page size sent once. Drawing the chart costs the same in both modes and
+is not included; neither is the network round-trip server mode adds.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import plotly.io as pio
+
+from benchmarks.common import synthetic_catalog
+from techradar.clientside import SCRIPT_PATH, client_radar_html, columnar_payload
+from techradar.config import CATEGORIES
+from techradar.figure import create_radar_plot
+from techradar.layout import prepare_radar_frame
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs the page's filter code over a payload file once per selection
+NODE_HARNESS = """
+const radar = require(process.argv[1]);
+const payload = JSON.parse(require('fs').readFileSync(process.argv[2]));
+const selections = JSON.parse(process.argv[3]);
+const catalog = radar.loadCatalog(payload);
+const samples = [];
+for (let round = 0; round < 3; round++) {
+  for (const selection of selections) {
+    const start = process.hrtime.bigint();
+    radar.technologyTrace(catalog, radar.filterPositions(catalog, selection));
+    samples.push(Number(process.hrtime.bigint() - start) / 1e6);
+  }
+}
+samples.sort((a, b) => a - b);
+console.log(samples[Math.floor(samples.length / 2)]);
+"""
+
+
+def toggled_selections():
+    """Filter selections with one category switched off in turn."""
+    return [dict(category=[c for c in CATEGORIES if c != dropped], trl=[1, 9],
+                 business=['LOW', 'MEDIUM', 'HIGH'], time=['NOW', '1', '3', '5', '10', 'NEVER'],
+                 desirability=['LOW', 'MEDIUM', 'HIGH'])
+            for dropped in CATEGORIES]
+
+
+def server_rerun_ms(csv_path, reruns):
+    """Median script rerun time after toggling a category, in ms."""
+    from streamlit.testing.v1 import AppTest
+
+    os.environ['TECH_RADAR_SOURCE'] = csv_path
+    app = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=600)
+    app.run()
+    app.sidebar.checkbox[0].uncheck().run()
+    samples = []
+    for i in range(reruns):
+        dropped = CATEGORIES[i % len(CATEGORIES)]
+        app.sidebar.multiselect[0].set_value([c for c in CATEGORIES if c != dropped])
+        start = time.perf_counter()
+        app.run()
+        samples.append(time.perf_counter() - start)
+    if app.exception:
+        raise RuntimeError(app.exception)
+    return statistics.median(samples) * 1e3
+
+
+def browser_filter_ms(df, workdir):
+    """Median in-browser filter time under Node, in ms."""
+    path = os.path.join(workdir, 'payload.json')
+    with open(path, 'w') as handle:
+        json.dump(columnar_payload(df), handle)
+    out = subprocess.run(['node', '-e', NODE_HARNESS, SCRIPT_PATH, path,
+                          json.dumps(toggled_selections())],
+                         capture_output=True, text=True, check=True).stdout
+    return float(out.strip())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000, 10_000, 50_000])
+    parser.add_argument('--reruns', type=int, default=6)
+    args = parser.parse_args()
+    if shutil.which('node') is None:
+        sys.exit("Node.js is required to time the in-browser filter code")
+
+    print(f"{'rows':>7} {'server rerun ms':>16} {'figure KB/change':>17} "
+          f"{'browser filter ms':>18} {'page KB once':>13}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in args.rows:
+            catalog = synthetic_catalog(n)
+            csv_path = os.path.join(workdir, f'catalog_{n}.csv')
+            catalog.to_csv(csv_path, index=False)
+            df = prepare_radar_frame(catalog, pack=True)
+
+            server = server_rerun_ms(csv_path, args.reruns)
+            figure_kb = len(pio.to_json(create_radar_plot(df), validate=False)) / 1024
+            browser = browser_filter_ms(df, workdir)
+            page_kb = len(client_radar_html(df)) / 1024
+            print(f"{n:>7} {server:>16.1f} {figure_kb:>17.0f} {browser:>18.2f} {page_kb:>13.0f}")
+
+
+if __name__ == '__main__':
+    main()
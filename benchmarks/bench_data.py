@@ -0,0 +1,63 @@
+"""Measure catalog load time and peak memory per row for each file format.
+
+    python -m benchmarks.bench_data --rows 10000 100000 500000
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from techradar.data import load_technology_data
+
+
+def write_sources(frame, directory):
+    """Write ``frame`` as CSV, Parquet and SQLite files and return their paths."""
+    raw = frame.astype(object)
+    paths = {
+        'csv': os.path.join(directory, 'catalog.csv'),
+        'parquet': os.path.join(directory, 'catalog.parquet'),
+        'sqlite': os.path.join(directory, 'catalog.db'),
+    }
+    raw.to_csv(paths['csv'], index=False)
+    try:
+        raw.to_parquet(paths['parquet'], index=False)
+    except ImportError:
+        del paths['parquet']
+    with sqlite3.connect(paths['sqlite']) as con:
+        raw.to_sql('technologies', con, index=False)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 500_000])
+    args = parser.parse_args()
+
+    sample = load_technology_data()
+    print(f"{'rows':>8} {'format':>8} {'load s':>8} {'us/row':>8} {'peak MB':>8} {'bytes/row':>10}")
+    for n in args.rows:
+        repeats = -(-n // len(sample))
+        frame = pd.concat([sample] * repeats, ignore_index=True).iloc[:n]
+        with tempfile.TemporaryDirectory() as directory:
+            for fmt, path in write_sources(frame, directory).items():
+                start = time.perf_counter()
+                load_technology_data(path)
+                seconds = time.perf_counter() - start
+
+                # Trace allocations in a separate run so tracing overhead
+                # does not distort the timing
+                tracemalloc.start()
+                load_technology_data(path)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(f"{n:>8} {fmt:>8} {seconds:>8.2f} {seconds / n * 1e6:>8.2f} "
+                      f"{peak / 1e6:>8.1f} {peak / n:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
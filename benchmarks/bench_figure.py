@@ -0,0 +1,119 @@
+"""Measure radar figure build time and JSON payload size against row count.
+
+Compares the data trace used by ``create_radar_plot`` (typed arrays, color
+codes and a hover template over customdata) with the previous batched trace
+carrying one HTML hover label and color string per bubble, and with the
+original one-trace-per-technology construction. Figures are built from the
+compact catalog, as in the app. The payload is the JSON ``st.plotly_chart``
+sends; "deflated" is its size with websocket compression turned on.
+
+    python -m benchmarks.bench_figure --rows 100 1000 5000 20000
+"""
+
+import argparse
+import zlib
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from benchmarks.common import best_of, synthetic_radar_frame
+from techradar.figure import create_radar_plot
+from techradar.layout import compact_radar_frame
+
+
+def build_hover_text(data):
+    """Build the previous per-bubble HTML hover labels, vectorized over rows."""
+    if data.empty:
+        return np.array([], dtype=object)
+    text = (
+        '<b>' + data['name'].astype(str) + '</b><br>'
+        + 'Category: ' + data['category'].astype(str) + '<br>'
+        + 'TRL: ' + data['trl'].astype(str) + '<br>'
+        + 'Business Potential: ' + data['business'].astype(str) + '<br>'
+        + 'Time to Market: ' + data['time'].astype(str) + '<br>'
+        + 'Customer Desirability: ' + data['desirability'].astype(str)
+    )
+    return text.to_numpy(dtype=object)
+
+
+def hovertext_radar_plot(filtered_data):
+    """The previous batched data trace: per-bubble hover labels and color strings."""
+    fig = create_radar_plot(filtered_data.iloc[:0])
+    fig.add_trace(go.Scatter(
+        x=filtered_data['x'].to_numpy(dtype=float), y=filtered_data['y'].to_numpy(dtype=float),
+        mode='markers',
+        marker=dict(
+            size=filtered_data['size'].to_numpy(dtype=float),
+            color=filtered_data['color'].to_numpy(dtype=object),
+            line=dict(width=filtered_data['line_width'].to_numpy(dtype=float), color='black'),
+            opacity=0.5
+        ),
+        name='Technologies',
+        hovertext=build_hover_text(filtered_data),
+        hoverinfo='text',
+        customdata=filtered_data.index.to_numpy(),
+        showlegend=False
+    ))
+    return fig
+
+
+def legacy_radar_plot(filtered_data):
+    """The pre-batching data trace construction: one Scatter per row."""
+    fig = create_radar_plot(filtered_data.iloc[:0])
+    for i, row in filtered_data.iterrows():
+        fig.add_trace(go.Scatter(
+            x=[row['x']], y=[row['y']],
+            mode='markers',
+            marker=dict(
+                size=row['size'],
+                color=row['color'],
+                line=dict(width=row['line_width'], color='black'),
+                opacity=0.5
+            ),
+            name=row['name'],
+            text=row['name'],
+            hovertext=f"<b>{row['name']}</b><br>" +
+                     f"Category: {row['category']}<br>" +
+                     f"TRL: {row['trl']}<br>" +
+                     f"Business Potential: {row['business']}<br>" +
+                     f"Time to Market: {row['time']}<br>" +
+                     f"Customer Desirability: {row['desirability']}",
+            hoverinfo='text',
+            customdata=[i]
+        ))
+    return fig
+
+
+def measure(builder, df, repeat):
+    seconds = best_of(lambda: builder(df), repeat=repeat)
+    payload = pio.to_json(builder(df), validate=False).encode()
+    return seconds, len(payload), len(zlib.compress(payload))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100, 1000, 5000, 20000])
+    parser.add_argument('--legacy-max-rows', type=int, default=5000,
+                        help='skip the per-row baseline above this many rows')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'mode':>12} {'build ms':>10} {'payload KB':>11} {'deflated KB':>12}")
+    for n in args.rows:
+        df = compact_radar_frame(synthetic_radar_frame(n))
+        modes = [
+            ('batched', create_radar_plot),
+            ('by-category', lambda d: create_radar_plot(d, group_by='category')),
+            ('hovertext', hovertext_radar_plot),
+        ]
+        if n <= args.legacy_max_rows:
+            modes.append(('per-row', legacy_radar_plot))
+        for label, builder in modes:
+            seconds, payload, deflated = measure(builder, df, args.repeat)
+            print(f"{n:>8} {label:>12} {seconds * 1000:>10.1f} {payload / 1024:>11.1f} "
+                  f"{deflated / 1024:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Compare the sidebar boolean-mask filter with the precomputed FilterIndex.
+
+    python -m benchmarks.bench_filters --rows 10000 100000 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.common import best_of, synthetic_catalog
+from techradar.config import BUSINESS_OPTIONS, CATEGORIES, DESIRABILITY_OPTIONS, TIME_OPTIONS
+from techradar.filters import FilterIndex
+
+
+def random_filters(rng, count):
+    """Return ``count`` random sidebar selections."""
+    def subset(options):
+        size = rng.integers(1, len(options) + 1)
+        return list(rng.choice(options, size=size, replace=False))
+
+    filters = []
+    for _ in range(count):
+        low, high = sorted(rng.integers(1, 10, size=2))
+        filters.append((subset(CATEGORIES), (int(low), int(high)), subset(BUSINESS_OPTIONS),
+                        subset(TIME_OPTIONS), subset(DESIRABILITY_OPTIONS)))
+    return filters
+
+
+def boolean_mask(df, categories, trl_range, business, time, desirability):
+    """The sidebar's original full-scan filter."""
+    return df[
+        df['category'].isin(categories) &
+        (df['trl'] >= trl_range[0]) & (df['trl'] <= trl_range[1]) &
+        df['business'].isin(business) &
+        df['time'].isin(time) &
+        df['desirability'].isin(desirability)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--queries', type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>9} {'build ms':>9} {'mask ms':>9} {'index ms':>9} {'memo hit us':>12}")
+    for n in args.rows:
+        df = synthetic_catalog(n)
+        filters = random_filters(rng, args.queries)
+
+        start = time.perf_counter()
+        # Room for every result, so the memo timing below only sees hits
+        index = FilterIndex(df, cache_bytes=len(filters) * 4 * n)
+        build = time.perf_counter() - start
+
+        mask_time = best_of(lambda: [boolean_mask(df, *f) for f in filters], repeat=1)
+        start = time.perf_counter()
+        for f in filters:
+            df.iloc[index.positions(*f)]
+        index_time = time.perf_counter() - start
+        hit_time = best_of(lambda: [index.positions(*f) for f in filters], repeat=3)
+
+        for f in filters[:5]:
+            assert boolean_mask(df, *f).index.equals(df.index[index.positions(*f)])
+
+        print(f"{n:>9} {build * 1e3:>9.1f} {mask_time / len(filters) * 1e3:>9.2f} "
+              f"{index_time / len(filters) * 1e3:>9.2f} {hit_time / len(filters) * 1e6:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
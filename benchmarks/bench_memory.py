@@ -0,0 +1,82 @@
+"""Measure the shared catalog and the memory each session holds on to.
+
+    python -m benchmarks.bench_memory --rows 100000 500000
+
+"before" is the plain ``prepare_radar_frame`` result with every session
+keeping its own ``df.iloc[positions]`` copy next to its figure; "after" is
+the compact catalog from ``layout.compact_radar_frame`` with sessions keeping
+only the figure and the filter index's shared positions. Session bytes are
+traced with ``tracemalloc`` while the objects a session retains are alive.
+Bubble packing is skipped, as it does not change the columns' dtypes.
+"""
+
+import argparse
+import tracemalloc
+
+from benchmarks.common import synthetic_catalog
+from techradar.config import BUSINESS_OPTIONS, DESIRABILITY_OPTIONS, TIME_OPTIONS
+from techradar.figure import create_radar_plot
+from techradar.filters import FilterIndex, select_rows
+from techradar.layout import compact_radar_frame, prepare_radar_frame
+
+
+def frame_bytes(df):
+    return int(df.memory_usage(deep=True).sum())
+
+
+def retained_bytes(build):
+    """Return the bytes still allocated by ``build()``'s result."""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del kept
+    return retained
+
+
+def legacy_session(frame, positions, with_figure):
+    filtered = frame.iloc[positions]
+    return filtered, create_radar_plot(filtered) if with_figure else None
+
+
+def compact_session(frame, positions, with_figure):
+    # The session keeps the shared positions; rows are only taken for the figure
+    return positions, create_radar_plot(select_rows(frame, positions)) if with_figure else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 500_000])
+    parser.add_argument('--words', type=int, default=20, help="words per description")
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'catalog MB':>11} {'compact MB':>11} {'descr. MB':>10} "
+          f"{'selection':>10} {'session MB':>11} {'now MB':>7}")
+    # Import Plotly and cache the base figure before tracing anything
+    create_radar_plot(prepare_radar_frame(synthetic_catalog(10)))
+    for n in args.rows:
+        catalog = synthetic_catalog(n, description_words=args.words)
+        legacy = prepare_radar_frame(catalog)
+        compact = compact_radar_frame(legacy)
+        descriptions = frame_bytes(catalog[['description']])
+        index = FilterIndex(compact)
+        categories = list(compact['category'].cat.categories)
+        rest = ((1, 9), BUSINESS_OPTIONS, TIME_OPTIONS, DESIRABILITY_OPTIONS)
+        selections = [
+            # Aggregated in the app, so the session holds only the filtered rows
+            ('all', index.positions(categories, *rest), False),
+            # One category is drawn bubble by bubble
+            ('category', index.positions(categories[:1], *rest), True),
+        ]
+        for label, positions, with_figure in selections:
+            before = retained_bytes(lambda: legacy_session(legacy, positions, with_figure))
+            after = retained_bytes(lambda: compact_session(compact, positions, with_figure))
+            print(f"{n:>8} {frame_bytes(legacy) / 2 ** 20:>11.1f} "
+                  f"{frame_bytes(compact) / 2 ** 20:>11.1f} {descriptions / 2 ** 20:>10.1f} "
+                  f"{label:>10} {before / 2 ** 20:>11.1f} {after / 2 ** 20:>7.1f}")
+        del legacy, compact, catalog
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Time collision-aware bubble packing and count remaining overlaps.
+
+    python -m benchmarks.bench_packing --rows 1000 10000 50000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.common import synthetic_radar_frame
+from techradar.packing import PIXELS_PER_UNIT, pack_layout
+
+
+def count_overlaps(x, y, radius, tolerance=1e-9):
+    """Count overlapping bubble pairs using a uniform grid."""
+    cell = 2 * radius.max()
+    keys = np.floor(np.column_stack([x, y]) / cell).astype(np.int64)
+    buckets = {}
+    for i, key in enumerate(map(tuple, keys)):
+        buckets.setdefault(key, []).append(i)
+
+    overlaps = 0
+    for (gx, gy), members in buckets.items():
+        members = np.array(members)
+        nearby = np.array([j for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                           for j in buckets.get((gx + dx, gy + dy), ())])
+        dist = np.hypot(x[members, None] - x[nearby], y[members, None] - y[nearby])
+        hit = dist < radius[members, None] + radius[nearby] - tolerance
+        overlaps += int(np.sum(hit & (members[:, None] < nearby)))
+    return overlaps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000, 10_000, 50_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>7} {'pack s':>8} {'us/row':>8} {'overlaps before':>16} {'overlaps after':>15} "
+          f"{'min scale':>10}")
+    for n in args.rows:
+        df = synthetic_radar_frame(n)
+        radius = df['size'].to_numpy() / 2 / PIXELS_PER_UNIT
+        before = count_overlaps(df['x'].to_numpy(), df['y'].to_numpy(), radius)
+
+        start = time.perf_counter()
+        packed = pack_layout(df)
+        seconds = time.perf_counter() - start
+
+        packed_radius = packed['size'].to_numpy() / 2 / PIXELS_PER_UNIT
+        after = count_overlaps(packed['x'].to_numpy(), packed['y'].to_numpy(), packed_radius)
+        scale = (packed['size'] / df['size']).min()
+        print(f"{n:>7} {seconds:>8.2f} {seconds / n * 1e6:>8.1f} {before:>16} {after:>15} "
+              f"{scale:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Compare str.contains search with the inverted SearchIndex.
+
+    python -m benchmarks.bench_search --rows 10000 100000 --words 20
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.bench_filters import random_filters
+from benchmarks.common import best_of, synthetic_catalog
+from techradar.filters import FilterIndex
+from techradar.search import SearchIndex
+
+QUERIES = ['crispr', 'lateral flow', 'lat flo', 'sensor', 'term1', 'term12 term3', 'te', 'biomarker assay']
+
+
+def contains_search(df, query):
+    """Substring search over name and description, as the list used to do."""
+    mask = df['name'].str.contains(query, case=False, regex=False).to_numpy()
+    mask |= df['description'].str.contains(query, case=False, regex=False).to_numpy()
+    return np.flatnonzero(mask)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--words', type=int, default=20, help="words per description")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>8} {'build s':>8} {'contains ms':>12} {'index ms':>9} {'max ms':>7} "
+          f"{'+facets ms':>11}")
+    for n in args.rows:
+        df = synthetic_catalog(n, description_words=args.words)
+        start = time.perf_counter()
+        index = SearchIndex(df)
+        build = time.perf_counter() - start
+
+        filter_index = FilterIndex(df)
+        facets = [filter_index.positions(*f) for f in random_filters(rng, len(QUERIES))]
+
+        contains = best_of(lambda: [contains_search(df, q) for q in QUERIES]) / len(QUERIES)
+        per_query = [best_of(lambda q=q: index.search(q)) for q in QUERIES]
+        faceted = best_of(lambda: [index.search(q, positions=p)
+                                   for q, p in zip(QUERIES, facets)]) / len(QUERIES)
+        print(f"{n:>8} {build:>8.2f} {contains * 1e3:>12.2f} {np.mean(per_query) * 1e3:>9.2f} "
+              f"{max(per_query) * 1e3:>7.2f} {faceted * 1e3:>11.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Measure cold-start import cost and per-rerun script time of the app.
+
+Each module is imported in a fresh interpreter so the numbers include every
+transitive import. Script reruns are driven through Streamlit's AppTest
+harness: the first run pays for imports and cache misses, later runs show
+the steady-state cost of a rerun.
+
+    python -m benchmarks.bench_startup
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    'techradar.config',
+    'techradar.data',
+    'techradar.filters',
+    'techradar.layout',
+    'techradar.figure',
+    'techradar.ui',
+    'plotly.graph_objects',
+    'streamlit',
+]
+
+
+def cold_import_ms(module, repeat):
+    """Best-of-``repeat`` wall time to import ``module`` in a fresh interpreter."""
+    code = f"import time; s = time.perf_counter(); import {module}; print(time.perf_counter() - s)"
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                             env=env, cwd=ROOT, check=True).stdout
+        times.append(float(out.strip().splitlines()[-1]))
+    return min(times) * 1e3
+
+
+def rerun_ms(script, reruns):
+    """Return (first run, median rerun) script times in ms via AppTest."""
+    from streamlit.testing.v1 import AppTest
+
+    sys.path.insert(0, ROOT)
+    app = AppTest.from_file(script, default_timeout=300)
+    start = time.perf_counter()
+    app.run()
+    first = time.perf_counter() - start
+    samples = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        app.run()
+        samples.append(time.perf_counter() - start)
+    return first * 1e3, statistics.median(samples) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--reruns', type=int, default=10)
+    parser.add_argument('--script', default=os.path.join(ROOT, 'app.py'),
+                        help="Streamlit script to rerun (default: app.py)")
+    args = parser.parse_args()
+
+    print(f"{'module':<24} {'cold import ms':>15}")
+    for module in MODULES:
+        try:
+            print(f"{module:<24} {cold_import_ms(module, args.repeat):>15.1f}")
+        except subprocess.CalledProcessError:
+            print(f"{module:<24} {'n/a':>15}")
+
+    first, rerun = rerun_ms(args.script, args.reruns)
+    print(f"\n{os.path.basename(args.script)} first run {first:.1f} ms, median rerun {rerun:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
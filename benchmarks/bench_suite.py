@@ -0,0 +1,260 @@
+"""Time every stage of the app over growing synthetic catalogs and save JSON.
+
+Each size is generated with ``realistic_catalog`` (fixed seed), written to a
+Parquet file (CSV without pyarrow) and pushed through the same steps the app
+takes: loading, layout, index builds, filtering, figure building, the
+sidebar list and the prioritisation shortlists. Script-run latency is
+measured through Streamlit's AppTest harness with the app pointed at the
+generated file. Results are saved with the commit and library versions, so
+two runs can be compared:
+
+    python -m benchmarks.bench_suite --rows 100 1000 10000 100000 1000000 --out after.json
+    python -m benchmarks.bench_suite --compare before.json after.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.bench_filters import boolean_mask, random_filters
+from benchmarks.common import realistic_catalog
+from techradar.data import load_descriptions, load_technology_data
+from techradar.filters import FilterIndex, select_rows
+from techradar.layout import compact_radar_frame, prepare_radar_frame
+from techradar.listing import paginate, render_cards
+from techradar.scoring import ScoringIndex
+from techradar.search import SearchIndex
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_ROWS = [100, 1_000, 10_000, 100_000, 1_000_000]
+
+# Ratio above which --compare reports a regression
+DEFAULT_TOLERANCE = 1.10
+
+
+def timed(func, repeat):
+    """Return the best wall time of ``repeat`` calls and the last result."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _git(*args):
+    try:
+        return subprocess.run(['git', *args], capture_output=True, text=True, cwd=ROOT,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment(args):
+    """Describe the code, libraries and machine the results come from."""
+    import pandas as pd
+    import plotly
+    import streamlit
+
+    status = _git('status', '--porcelain', '--untracked-files=no')
+    return dict(
+        commit=_git('rev-parse', 'HEAD'),
+        dirty=bool(status) if status is not None else None,
+        python=platform.python_version(),
+        numpy=np.__version__,
+        pandas=pd.__version__,
+        plotly=plotly.__version__,
+        streamlit=streamlit.__version__,
+        platform=platform.platform(),
+        cpus=os.cpu_count(),
+        started=time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        seed=args.seed,
+        repeat=args.repeat,
+    )
+
+
+def write_source(catalog, directory):
+    """Write ``catalog`` as Parquet (or CSV without pyarrow) and return the path."""
+    raw = catalog.astype(object)
+    try:
+        path = os.path.join(directory, 'catalog.parquet')
+        raw.to_parquet(path, index=False)
+    except ImportError:
+        path = os.path.join(directory, 'catalog.csv')
+        raw.to_csv(path, index=False)
+    return path
+
+
+def pipeline_results(n, path, args):
+    """Time the app's data, filter, figure and list steps on ``path``."""
+    from techradar.figure import create_radar_plot
+
+    repeat = args.repeat if n <= 100_000 else 1
+    results = []
+
+    def record(name, seconds, **extra):
+        results.append(dict(rows=n, name=name, seconds=seconds, **extra))
+        print(f"{n:>9} {name:<20} {seconds * 1e3:>11.2f}"
+              + ''.join(f"  {key}={value:,}" for key, value in extra.items()), flush=True)
+
+    seconds, df = timed(lambda: load_technology_data(path, descriptions=False), repeat)
+    record('load', seconds)
+    seconds, descriptions = timed(lambda: load_descriptions(path), repeat)
+    record('load_descriptions', seconds)
+    seconds, frame = timed(lambda: compact_radar_frame(prepare_radar_frame(df, pack=True)),
+                           repeat)
+    record('layout', seconds)
+    seconds, filter_index = timed(lambda: FilterIndex(frame), repeat)
+    record('filter_index_build', seconds)
+    seconds, search_index = timed(lambda: SearchIndex(frame, descriptions=descriptions), repeat)
+    record('search_index_build', seconds)
+
+    # Fresh filters every call, so the filter index's memo never answers
+    rng = np.random.default_rng(args.seed)
+    filters = random_filters(rng, args.queries)
+    record('filter_mask', timed(lambda: [boolean_mask(frame, *f) for f in filters],
+                                repeat)[0] / len(filters))
+    queries = iter(random_filters(rng, args.queries * repeat))
+    record('filter_index', timed(lambda: [select_rows(frame, filter_index.positions(*next(queries)))
+                                          for _ in range(args.queries)], repeat)[0] / args.queries)
+
+    # One category is drawn bubble by bubble; the whole catalog as aggregates
+    categories = list(frame['category'].cat.categories)
+    positions = filter_index.positions(categories[:1], (1, 9), *filters[0][2:])
+    if len(positions) <= args.figure_max_rows:
+        import plotly.io as pio
+
+        seconds, fig = timed(lambda: create_radar_plot(select_rows(frame, positions)), repeat)
+        record('figure', seconds, points=len(positions),
+               payload_bytes=len(pio.to_json(fig, validate=False)))
+    record('figure_lod', timed(lambda: create_radar_plot(frame, aggregate=True), repeat)[0])
+
+    def list_page():
+        listed = search_index.search('', positions=positions)
+        return render_cards(paginate(frame, 1, 25, positions=listed)[0])
+
+    record('list_page', timed(list_page, repeat)[0])
+    record('search', timed(lambda: search_index.search('sensor', positions=positions), repeat)[0])
+
+    # Fresh weights every call, so the scoring memo never answers
+    seconds, scoring = timed(lambda: ScoringIndex(frame), repeat)
+    record('scoring_index_build', seconds)
+    weights = iter(rng.integers(0, 6, size=(repeat * 2, 4)) + rng.random((repeat * 2, 4)))
+    record('top_k', timed(lambda: scoring.top_k(next(weights), 3), repeat)[0])
+    # A fresh positions array every call, as the memo is keyed by identity
+    record('pareto_front', timed(lambda: scoring.pareto_front(np.arange(n)), repeat)[0])
+    return results
+
+
+def app_results(n, path, args):
+    """Time app.py runs through AppTest with the catalog at ``path``."""
+    from streamlit.testing.v1 import AppTest
+
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    previous = os.environ.get('TECH_RADAR_SOURCE')
+    os.environ['TECH_RADAR_SOURCE'] = path
+    try:
+        app = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=600)
+        first, _ = timed(app.run, 1)
+        rerun = statistics.median(timed(app.run, 1)[0] for _ in range(args.reruns))
+
+        # Alternate between all categories and all but the first
+        categories = app.multiselect[0]
+        options = list(categories.options)
+        changes = []
+        for i in range(args.reruns):
+            categories.set_value(options[1:] if i % 2 == 0 else options)
+            changes.append(timed(app.run, 1)[0])
+            categories = app.multiselect[0]
+        if app.exception:
+            raise RuntimeError(f"app.py failed: {app.exception[0].message}")
+    finally:
+        if previous is None:
+            os.environ.pop('TECH_RADAR_SOURCE', None)
+        else:
+            os.environ['TECH_RADAR_SOURCE'] = previous
+
+    results = []
+    for name, seconds in [('app_first_run', first), ('app_rerun', rerun),
+                          ('app_filter_change', statistics.median(changes))]:
+        results.append(dict(rows=n, name=name, seconds=seconds))
+        print(f"{n:>9} {name:<20} {seconds * 1e3:>11.2f}", flush=True)
+    return results
+
+
+def compare(before_path, after_path, tolerance):
+    """Print the ratio of every shared measurement; return 1 on regressions."""
+    with open(before_path) as handle:
+        before = json.load(handle)
+    with open(after_path) as handle:
+        after = json.load(handle)
+    old = {(r['rows'], r['name']): r['seconds'] for r in before['results']}
+
+    print(f"before {before['environment']['commit']}, after {after['environment']['commit']}")
+    print(f"{'rows':>9} {'stage':<20} {'before ms':>11} {'after ms':>11} {'ratio':>7}")
+    regressions = 0
+    for result in after['results']:
+        key = (result['rows'], result['name'])
+        if key not in old:
+            continue
+        ratio = result['seconds'] / old[key] if old[key] else float('inf')
+        flag = ' !' if ratio > tolerance else ''
+        regressions += bool(flag)
+        print(f"{key[0]:>9} {key[1]:<20} {old[key] * 1e3:>11.2f} "
+              f"{result['seconds'] * 1e3:>11.2f} {ratio:>7.2f}{flag}")
+    if regressions:
+        print(f"{regressions} measurement(s) slower than {tolerance:.2f}x")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="best-of repeats (one above 100k rows)")
+    parser.add_argument('--queries', type=int, default=20, help="random filters per size")
+    parser.add_argument('--figure-max-rows', type=int, default=200_000,
+                        help="skip the bubble-by-bubble figure above this many points")
+    parser.add_argument('--app-max-rows', type=int, default=100_000,
+                        help="skip the AppTest runs above this many rows")
+    parser.add_argument('--reruns', type=int, default=5)
+    parser.add_argument('--out', help="write the results to this JSON file")
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'),
+                        help="compare two result files instead of running")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="ratio reported as a regression by --compare")
+    args = parser.parse_args()
+
+    if args.compare:
+        return compare(*args.compare, args.tolerance)
+
+    report = dict(environment=environment(args), results=[])
+    print(f"{'rows':>9} {'stage':<20} {'ms':>11}")
+    for n in args.rows:
+        catalog = realistic_catalog(n, seed=args.seed)
+        with tempfile.TemporaryDirectory() as directory:
+            path = write_source(catalog, directory)
+            del catalog
+            report['results'] += pipeline_results(n, path, args)
+            if n <= args.app_max_rows:
+                report['results'] += app_results(n, path, args)
+
+    if args.out:
+        with open(args.out, 'w') as handle:
+            json.dump(report, handle, indent=1)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Helpers shared by the benchmark scripts."""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from techradar.config import BUSINESS_OPTIONS, CATEGORIES, DESIRABILITY_OPTIONS, TIME_OPTIONS
+from techradar.data import ENUM_DTYPES, load_technology_data
+from techradar.layout import prepare_radar_frame
+from techradar.search import tokenize
+
+
+# Vocabulary for synthetic descriptions; a Zipf draw makes a few words common
+WORDS = np.array(['assay', 'sensor', 'imaging', 'biomarker', 'lateral', 'flow', 'crispr']
+                 + [f'term{i}' for i in range(20_000)], dtype=object)
+
+
+def synthetic_descriptions(n, words_per_row, rng):
+    """Return ``n`` random descriptions of ``words_per_row`` words each."""
+    if not words_per_row:
+        return np.full(n, '', dtype=object)
+    picks = (rng.zipf(1.3, size=(n, words_per_row)) - 1) % len(WORDS)
+    return pd.DataFrame(WORDS[picks]).agg(' '.join, axis=1).to_numpy(dtype=object)
+
+
+def synthetic_catalog(n, seed=0, description_words=0):
+    """Return ``n`` random technologies with the dtypes of a loaded catalog."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'name': np.array([f'Technology {i}' for i in range(n)], dtype=object),
+        'category': pd.Categorical(rng.choice(CATEGORIES, size=n)),
+        'trl': rng.integers(1, 10, size=n).astype('int8'),
+        'business': pd.Categorical(rng.choice(BUSINESS_OPTIONS, size=n),
+                                   dtype=ENUM_DTYPES['business']),
+        'time': pd.Categorical(rng.choice(TIME_OPTIONS, size=n),
+                               dtype=ENUM_DTYPES['time']),
+        'desirability': pd.Categorical(rng.choice(DESIRABILITY_OPTIONS, size=n),
+                                       dtype=ENUM_DTYPES['desirability']),
+        'description': synthetic_descriptions(n, description_words, rng),
+    })
+
+
+def _frequencies(column, values, smoothing=1.0):
+    """Return the share of each of ``values`` in ``column``, smoothed so none is zero."""
+    counts = column.astype(object).value_counts().reindex(values, fill_value=0).to_numpy()
+    counts = counts + smoothing
+    return counts / counts.sum()
+
+
+def join_words(words, lengths):
+    """Join consecutive runs of ``lengths`` words from ``words`` into strings."""
+    ends = np.cumsum(lengths)
+    return np.array([' '.join(words[end - length:end]) for end, length in zip(ends, lengths)],
+                    dtype=object)
+
+
+def realistic_catalog(n, seed=0):
+    """Return ``n`` technologies shaped like the built-in catalog.
+
+    Categories, TRL levels and the business, time and desirability values
+    are drawn with the built-in catalog's frequencies (smoothed, so levels
+    it lacks, such as TRL 1-3 or LOW, still occur). Descriptions have its
+    word-count spread and reuse its vocabulary, with a long tail of rarer
+    terms. The dtypes are those of ``load_technology_data``.
+    """
+    rng = np.random.default_rng(seed)
+    sample = load_technology_data()
+    trl_levels = np.arange(1, 10)
+
+    vocabulary = list(dict.fromkeys(
+        token for text in sample['description'] for token in tokenize(text)))
+    vocabulary = np.array(vocabulary + list(WORDS), dtype=object)
+    sample_lengths = sample['description'].str.split().str.len().to_numpy()
+    lengths = np.maximum(rng.choice(sample_lengths, size=n) + rng.integers(-4, 5, size=n), 1)
+    picks = (rng.zipf(1.3, size=int(lengths.sum())) - 1) % len(vocabulary)
+
+    def enum(column, options):
+        return pd.Categorical(rng.choice(options, size=n, p=_frequencies(sample[column], options)),
+                              dtype=ENUM_DTYPES[column])
+
+    return pd.DataFrame({
+        'name': np.array([f'Technology {i}' for i in range(n)], dtype=object),
+        'category': pd.Categorical(rng.choice(CATEGORIES, size=n,
+                                              p=_frequencies(sample['category'], CATEGORIES))),
+        'trl': rng.choice(trl_levels, size=n,
+                          p=_frequencies(sample['trl'], trl_levels)).astype('int8'),
+        'business': enum('business', BUSINESS_OPTIONS),
+        'time': enum('time', TIME_OPTIONS),
+        'desirability': enum('desirability', DESIRABILITY_OPTIONS),
+        'description': join_words(vocabulary[picks], lengths),
+    })
+
+
+def synthetic_radar_frame(n, seed=0):
+    """Return ``n`` random technologies with all plotting columns filled in."""
+    return prepare_radar_frame(synthetic_catalog(n, seed=seed))
+
+
+def best_of(func, repeat=3):
+    """Return the fastest wall-clock time of ``repeat`` calls to ``func``."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
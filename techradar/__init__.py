@@ -0,0 +1 @@
+"""Core building blocks for the Healthcare Technology Radar app."""
@@ -0,0 +1,22 @@
+"""Command-line entry point: ``python -m techradar <command> ...``."""
+
+import sys
+
+COMMANDS = {
+    'export': 'techradar.export',
+    'history': 'techradar.history',
+    'perf': 'techradar.perf',
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMMANDS:
+        print(f"usage: python -m techradar {{{','.join(COMMANDS)}}} ...", file=sys.stderr)
+        return 2
+    module = __import__(COMMANDS[argv[0]], fromlist=['main'])
+    return module.main(argv[1:])
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""Process-wide, memory-bounded LRU cache shared by every radar.
+
+One server can host many radars (see ``techradar.radars``). Their loaded
+catalogs, layouts, indexes and base figures all go into ``SHARED_CACHE``,
+which evicts the least recently used entries once their estimated size
+exceeds a byte budget. Memory therefore follows the radars people are
+actually looking at, not how many are defined.
+
+The budget defaults to 1 GiB and can be changed with ``TECH_RADAR_CACHE_MB``.
+"""
+
+import collections
+import functools
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_BYTES = int(float(os.environ.get('TECH_RADAR_CACHE_MB', 1024)) * 2 ** 20)
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'entries', 'bytes', 'max_bytes'])
+
+
+def estimate_size(obj, _seen=None, memos=None):
+    """Return an estimate of the bytes held by ``obj`` and what it references.
+
+    A ``MemoryLRU`` inside ``obj`` (such as an index's memo) counts its
+    current bytes. When ``memos`` is a list, such caches are appended to it
+    instead and left out of the total, so their growth can be charged later.
+    """
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, MemoryLRU):
+        if memos is None:
+            return obj.nbytes
+        memos.append(obj)
+        return 0
+    if isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(obj, np.ndarray):
+        if obj.dtype == object:
+            return obj.nbytes + sum(sys.getsizeof(item) for item in obj.ravel())
+        return obj.nbytes
+    if isinstance(obj, (str, bytes, int, float, bool, type(None))):
+        return sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            estimate_size(key, seen, memos) + estimate_size(value, seen, memos)
+            for key, value in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(estimate_size(item, seen, memos) for item in obj)
+    if hasattr(obj, '__dict__'):
+        return sys.getsizeof(obj) + estimate_size(vars(obj), seen, memos)
+    return sys.getsizeof(obj)
+
+
+class MemoryLRU:
+    """Thread-safe LRU cache bounded by the estimated size of its values.
+
+    Values may hold memos of their own (a ``MemoryLRU`` each, bounded by its
+    own budget). Those grow after the value is cached, so an entry's size is
+    its size when built plus the current bytes of its memos, re-counted
+    every time the entry is returned.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        # One lock per key being built, so concurrent sessions build it once
+        self._building = {}
+
+    def get_or_create(self, key, factory):
+        """Return the cached value for ``key``, calling ``factory()`` on a miss."""
+        with self._lock:
+            if key in self._entries:
+                return self._hit(key)
+            build_lock = self._building.setdefault(key, threading.Lock())
+
+        with build_lock:
+            with self._lock:
+                if key in self._entries:
+                    return self._hit(key)
+            try:
+                value = factory()
+                memos = []
+                base = estimate_size(value, memos=memos)
+                size = base + sum(memo.nbytes for memo in memos)
+                with self._lock:
+                    self._misses += 1
+                    self._entries[key] = (value, size, base, memos)
+                    self._bytes += size
+                    self._evict()
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+            return value
+
+    def _hit(self, key):
+        # Called with the lock held
+        value, size, base, memos = self._entries[key]
+        self._entries.move_to_end(key)
+        self._hits += 1
+        if memos:
+            resized = base + sum(memo.nbytes for memo in memos)
+            if resized != size:
+                self._entries[key] = (value, resized, base, memos)
+                self._bytes += resized - size
+                self._evict()
+        return value
+
+    def _evict(self):
+        # Evict the oldest entries, but never the most recent one
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted[1]
+
+    def memoize(self, namespace):
+        """Decorator caching a function's results by its (hashable) arguments."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = (namespace, args, tuple(sorted(kwargs.items())))
+                return self.get_or_create(key, lambda: func(*args, **kwargs))
+            wrapper.cache = self
+            return wrapper
+        return decorator
+
+    def discard(self, predicate):
+        """Drop every entry whose key satisfies ``predicate``; return how many."""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self._bytes -= self._entries.pop(key)[1]
+        return len(keys)
+
+    @property
+    def nbytes(self):
+        """The estimated bytes of the cached values."""
+        return self._bytes
+
+    def cache_info(self):
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, len(self._entries), self._bytes,
+                             self.max_bytes)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+SHARED_CACHE = MemoryLRU()
@@ -0,0 +1,161 @@
+"""Client-side filtering mode for the radar.
+
+In the default mode every sidebar change reruns the Streamlit script and
+sends a new figure. In client-side mode the whole catalog is embedded in the
+page once as columnar arrays: small integer codes for the enumerated
+columns, ``float32`` positions and sizes, and one list of names. Filter
+controls inside the page update the chart in the browser (see
+``static/client_radar.js``), so the server is only involved when the
+catalog itself changes.
+
+Plotly's own ``transforms`` would have been the natural fit, but they were
+removed in plotly.js 3, hence the small custom page. The page inlines the
+plotly.js bundle shipped with the installed ``plotly`` package (about 4.6 MB,
+1.4 MB compressed) rather than loading it from a CDN, so it works on
+networks without internet access. The page changes only with the catalog,
+so Streamlit sends it once and then refers to it by hash on reruns.
+"""
+
+import base64
+import functools
+import html
+import os
+
+import numpy as np
+import pandas as pd
+
+from techradar.config import BUSINESS_OPTIONS, DESIRABILITY_OPTIONS, TIME_OPTIONS
+from techradar.packing import marker_scale
+from techradar.radars import DEFAULT_RADAR
+
+# Above this many technologies the page gets too heavy to ship in one go
+CLIENT_MAX_ROWS = 50_000
+
+# Height of the filter controls above the chart, in pixels
+CONTROLS_HEIGHT = 150
+
+MISSING_COLOR = 'gray'
+
+SCRIPT_PATH = os.path.join(os.path.dirname(__file__), 'static', 'client_radar.js')
+
+_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<script>{plotlyjs}</script>
+<style>
+  body {{ margin: 0; font-family: "Source Sans Pro", Arial, sans-serif; font-size: 14px; }}
+  form {{ display: flex; flex-wrap: wrap; gap: 6px 24px; height: {controls_height}px;
+          align-content: flex-start; overflow-y: auto; }}
+  fieldset {{ border: 1px solid #ddd; border-radius: 5px; padding: 4px 8px; margin: 0; }}
+  label {{ margin-right: 8px; white-space: nowrap; }}
+  #status {{ color: #666; font-size: 12px; }}
+</style>
+</head>
+<body>
+<form id="filters" onsubmit="return false">
+{controls}
+</form>
+<div id="status"></div>
+<div id="radar"></div>
+<script>{script}</script>
+<script>
+ClientRadar.mount(document.getElementById('radar'), document.getElementById('filters'),
+                  document.getElementById('status'), {payload});
+</script>
+</body>
+</html>
+"""
+
+
+def _b64(array, dtype):
+    """Encode ``array`` as a base64 typed-array column."""
+    array = np.ascontiguousarray(array, dtype=dtype)
+    return {'dtype': array.dtype.str[1:], 'bdata': base64.b64encode(array.tobytes()).decode('ascii')}
+
+
+def _codes(column, labels):
+    """Return int8 codes of ``column`` against ``labels``, -1 where missing."""
+    return pd.Categorical(column, categories=labels).codes.astype(np.int8)
+
+
+def columnar_payload(df, radar=DEFAULT_RADAR):
+    """Return the catalog as compact columns for the in-browser filters.
+
+    ``df`` must carry the columns added by ``prepare_radar_frame``.
+    """
+    time_to_color = dict(radar.time_to_color)
+    labels = {
+        'category': list(radar.categories),
+        'business': BUSINESS_OPTIONS,
+        'time': TIME_OPTIONS,
+        'desirability': DESIRABILITY_OPTIONS,
+    }
+    columns = {facet: _b64(_codes(df[facet], values), np.int8) for facet, values in labels.items()}
+    columns['trl'] = _b64(df['trl'].to_numpy(), np.int8)
+    for name in ('x', 'y', 'size', 'line_width'):
+        columns[name] = _b64(df[name].to_numpy(dtype=float), np.float32)
+    return {
+        'num_rows': len(df),
+        'columns': columns,
+        'labels': labels,
+        'names': df['name'].astype(str).tolist(),
+        'time_colors': [time_to_color.get(value, MISSING_COLOR) for value in TIME_OPTIONS],
+        'missing_color': MISSING_COLOR,
+    }
+
+
+def _checkboxes(facet, legend, values, captions=None):
+    boxes = ''.join(
+        f'<label><input type="checkbox" name="{facet}" value="{html.escape(value)}" checked> '
+        f'{html.escape(caption)}</label>'
+        for value, caption in zip(values, captions or values)
+    )
+    return f'<fieldset><legend>{legend}</legend>{boxes}</fieldset>'
+
+
+def _trl_inputs():
+    options = ''.join(f'<option>{level}</option>' for level in range(1, 10))
+    selected_max = options.replace('<option>9</option>', '<option selected>9</option>')
+    return ('<fieldset><legend>TRL Range</legend>'
+            f'<select name="trl_min">{options}</select> to '
+            f'<select name="trl_max">{selected_max}</select></fieldset>')
+
+
+@functools.lru_cache(maxsize=1)
+def _plotlyjs():
+    """Return the plotly.js bundle of the installed plotly package."""
+    from plotly.offline import get_plotlyjs
+
+    return get_plotlyjs().replace('</script', '<\\/script')
+
+
+def client_radar_html(df, radar=DEFAULT_RADAR, config=None):
+    """Return a self-contained page that filters and draws the radar in the browser."""
+    import plotly.io as pio
+
+    from techradar.figure import base_figure_spec
+
+    spec, num_background = base_figure_spec(
+        *radar.figure_config, size_scale=marker_scale(df, radar.business_to_size))
+    payload = columnar_payload(df, radar)
+    payload.update(figure=spec, num_background=num_background, config=config or {})
+
+    controls = ''.join([
+        _checkboxes('category', 'Categories', list(radar.categories)),
+        _trl_inputs(),
+        _checkboxes('business', 'Business Potential', BUSINESS_OPTIONS),
+        _checkboxes('time', 'Time to Market', TIME_OPTIONS),
+        _checkboxes('desirability', 'Customer Desirability', DESIRABILITY_OPTIONS),
+    ])
+    with open(SCRIPT_PATH) as handle:
+        script = handle.read()
+    # Plotly's encoder turns the figure's numpy arrays into typed arrays too
+    payload_json = pio.to_json(payload, validate=False).replace('</', '<\\/')
+    return _PAGE.format(plotlyjs=_plotlyjs(), controls_height=CONTROLS_HEIGHT,
+                        controls=controls, script=script, payload=payload_json)
+
+
+def page_height(figure_height=700):
+    """Return the iframe height needed to show the controls and the chart."""
+    return CONTROLS_HEIGHT + 20 + figure_height + 10
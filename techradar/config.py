@@ -0,0 +1,48 @@
+"""Shared constants describing the radar's categories and visual encodings."""
+
+# Categories, drawn as spokes across the half circle in this order
+CATEGORIES = ['Cardiology', 'Neurology', 'Infectious Diseases',
+              'Continuous Monitoring', 'Oncology', 'Near Patient Care']
+
+# Filter options in display order
+BUSINESS_OPTIONS = ['LOW', 'MEDIUM', 'HIGH']
+TIME_OPTIONS = ['NOW', '1', '3', '5', '10', 'NEVER']
+DESIRABILITY_OPTIONS = ['LOW', 'MEDIUM', 'HIGH']
+
+# Map business potential to marker size using log scale for better visibility
+BUSINESS_TO_SIZE = {'LOW': 20, 'MEDIUM': 40, 'HIGH': 80}
+
+# Map time to market to color with higher contrast
+TIME_TO_COLOR = {
+    'NOW': '#00441b',  # Dark green
+    '1': '#2c7fb8',    # Blue
+    '3': '#7fcdbb',    # Teal
+    '5': '#fdae61',    # Orange
+    '10': '#d7301f',   # Red
+    'NEVER': '#7f0000' # Dark red
+}
+
+# Map customer desirability to marker edge width using log scale for better visibility
+# Using logarithmic scale to amplify differences
+DESIRABILITY_TO_WIDTH = {'LOW': 1, 'MEDIUM': 3, 'HIGH': 9}
+
+# TRL rings as (name, outer radius, fill color), innermost first
+RINGS = (
+    ('Research (TRL 1-3)', 0.3, 'rgba(255,204,204,0.3)'),
+    ('Development (TRL 4-6)', 0.6, 'rgba(204,238,255,0.3)'),
+    ('Deployment (TRL 7-9)', 0.9, 'rgba(204,255,204,0.3)'),
+)
+
+# Ring radii, innermost first; each ring holds three TRL levels
+RING_RADII = tuple(radius for _, radius, _ in RINGS)
+
+# Legend entries drawn next to the radar
+TIME_LEGEND = (
+    ('NOW', '#00441b'),
+    ('1 Year', '#2c7fb8'),
+    ('3 Years', '#7fcdbb'),
+    ('5 Years', '#fdae61'),
+    ('10 Years', '#d7301f'),
+)
+BUSINESS_LEGEND = (('LOW', 20), ('MEDIUM', 40), ('HIGH', 80))
+DESIRABILITY_LEGEND = (('LOW', 1), ('MEDIUM', 3), ('HIGH', 9))
@@ -0,0 +1,321 @@
+"""Technology catalog loading.
+
+The radar reads its catalog from the built-in sample list or from an external
+CSV, Parquet or SQLite file. External files are streamed in chunks and every
+chunk is converted to compact dtypes before the next one is read, so peak
+memory stays proportional to the final frame plus one chunk.
+"""
+
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype, union_categoricals
+
+from techradar.config import BUSINESS_OPTIONS, DESIRABILITY_OPTIONS, TIME_OPTIONS
+
+# Columns every catalog must provide; ``description`` is optional
+REQUIRED_COLUMNS = ['name', 'category', 'trl', 'business', 'time', 'desirability']
+COLUMNS = REQUIRED_COLUMNS + ['description']
+
+# Enumerated columns use fixed categories so chunks concatenate cheaply.
+# Values outside these lists load as missing.
+ENUM_DTYPES = {
+    'business': CategoricalDtype(BUSINESS_OPTIONS, ordered=True),
+    'time': CategoricalDtype(TIME_OPTIONS, ordered=True),
+    'desirability': CategoricalDtype(DESIRABILITY_OPTIONS, ordered=True),
+}
+
+# TRL of rows whose TRL is blank, not a whole number or outside 1-9. Like a
+# missing enum value, it keeps the row out of every TRL filter and ring.
+MISSING_TRL = 0
+
+# Raw dtypes used while parsing text sources, before categorical conversion
+READ_DTYPES = {'name': str, 'category': str, 'trl': str, 'business': str,
+               'time': str, 'desirability': str, 'description': str}
+
+CSV_SUFFIXES = ('.csv', '.csv.gz', '.tsv')
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+DEFAULT_CHUNKSIZE = 50_000
+
+# Built-in sample catalog used when no external source is configured
+SAMPLE_TECHNOLOGIES = [
+    # Cardiology
+    {'name': 'AI-Powered ECG Analysis', 'category': 'Cardiology', 'trl': 8,
+     'business': 'HIGH', 'time': 'NOW', 'desirability': 'HIGH',
+     'description': 'Machine learning algorithms that interpret ECG data with greater accuracy and speed than traditional methods, detecting subtle patterns and anomalies.'},
+    {'name': 'Wearable Cardiac Monitoring', 'category': 'Cardiology', 'trl': 9,
+     'business': 'HIGH', 'time': 'NOW', 'desirability': 'HIGH',
+     'description': 'Advanced wearable monitors providing comprehensive cardiac assessment, including rhythm analysis, heart rate variability, and single-lead ECG capabilities.'},
+    {'name': 'Miniaturized Implantable Devices', 'category': 'Cardiology', 'trl': 7,
+     'business': 'HIGH', 'time': '1', 'desirability': 'HIGH',
+     'description': 'Leadless pacemakers and insertable cardiac monitors that are much smaller than traditional implantables, reducing procedural complexity and patient discomfort.'},
+    {'name': 'Biomarker-Based Risk Assessment', 'category': 'Cardiology', 'trl': 6,
+     'business': 'MEDIUM', 'time': '3', 'desirability': 'MEDIUM',
+     'description': 'Novel biomarker panels that go beyond traditional markers to include genetic markers, inflammatory indicators, and metabolic signatures for personalized risk stratification.'},
+    {'name': '3D Bioprinted Cardiac Tissues', 'category': 'Cardiology', 'trl': 4,
+     'business': 'HIGH', 'time': '10', 'desirability': 'HIGH',
+     'description': 'Engineered tissues that can serve as personalized testing platforms for drug efficacy and toxicity, enabling more precise treatment selection.'},
+
+    # Neurology
+    {'name': 'Advanced Neuroimaging', 'category': 'Neurology', 'trl': 7,
+     'business': 'HIGH', 'time': '1', 'desirability': 'HIGH',
+     'description': 'Next-generation technologies including advanced MRI techniques, PET tracers, and hybrid imaging approaches for unprecedented visualization of brain structure and function.'},
+    {'name': 'AI Neurological Diagnostics', 'category': 'Neurology', 'trl': 6,
+     'business': 'HIGH', 'time': '3', 'desirability': 'HIGH',
+     'description': 'AI systems that analyze complex datasets to detect subtle patterns associated with conditions like Parkinson\'s disease, Alzheimer\'s disease, and multiple sclerosis.'},
+    {'name': 'Brain-Computer Interfaces', 'category': 'Neurology', 'trl': 5,
+     'business': 'MEDIUM', 'time': '5', 'desirability': 'MEDIUM',
+     'description': 'Direct communication pathways between the brain and external devices, enabling both diagnostic assessment and therapeutic intervention.'},
+    {'name': 'Neuromodulation Technologies', 'category': 'Neurology', 'trl': 7,
+     'business': 'HIGH', 'time': '1', 'desirability': 'HIGH',
+     'description': 'Advanced systems that combine therapeutic capabilities with diagnostic functions, enabling real-time monitoring of neural activity and treatment response.'},
+    {'name': 'Digital Neurological Biomarkers', 'category': 'Neurology', 'trl': 5,
+     'business': 'MEDIUM', 'time': '3', 'desirability': 'MEDIUM',
+     'description': 'Objective, quantifiable measures derived from smartphone interactions, wearable sensors, and specialized assessment tools to capture subtle changes in neurological function.'},
+
+    # Infectious Diseases
+    {'name': 'Rapid Molecular Diagnostics', 'category': 'Infectious Diseases', 'trl': 9,
+     'business': 'HIGH', 'time': 'NOW', 'desirability': 'HIGH',
+     'description': 'Advanced platforms enabling rapid, accurate detection of infectious agents through PCR, isothermal amplification, and next-generation sequencing technologies.'},
+    {'name': 'AI Pathogen Detection', 'category': 'Infectious Diseases', 'trl': 6,
+     'business': 'HIGH', 'time': '3', 'desirability': 'HIGH',
+     'description': 'Machine learning algorithms that analyze complex diagnostic data to identify subtle patterns associated with specific infections and predict antimicrobial resistance.'},
+    {'name': 'CRISPR Diagnostic Tools', 'category': 'Infectious Diseases', 'trl': 7,
+     'business': 'HIGH', 'time': '1', 'desirability': 'HIGH',
+     'description': 'Technologies utilizing the specific targeting capabilities of CRISPR systems to detect pathogen genetic material with exceptional sensitivity and specificity.'},
+    {'name': 'Digital Epidemiology', 'category': 'Infectious Diseases', 'trl': 8,
+     'business': 'MEDIUM', 'time': 'NOW', 'desirability': 'MEDIUM',
+     'description': 'Platforms that integrate diverse data sources to track and predict infectious disease spread, enabling earlier detection of outbreaks and more targeted interventions.'},
+    {'name': 'Genomic Surveillance', 'category': 'Infectious Diseases', 'trl': 7,
+     'business': 'MEDIUM', 'time': '1', 'desirability': 'MEDIUM',
+     'description': 'Systems enabling continuous monitoring of pathogen evolution through regular sequencing and analysis of clinical isolates to detect emerging variants.'},
+
+    # Continuous Monitoring
+    {'name': 'Advanced CGM', 'category': 'Continuous Monitoring', 'trl': 9,
+     'business': 'HIGH', 'time': 'NOW', 'desirability': 'HIGH',
+     'description': 'Continuous glucose monitoring systems providing real-time, dynamic information about glucose levels with improved accuracy, longer sensor life, and predictive alerts.'},
+    {'name': 'Multi-Parameter Wearables', 'category': 'Continuous Monitoring', 'trl': 7,
+     'business': 'HIGH', 'time': '1', 'desirability': 'HIGH',
+     'description': 'Advanced wearable systems that simultaneously track multiple physiological parameters for more holistic assessment of health status.'},
+    {'name': 'Smart Clothing Sensors', 'category': 'Continuous Monitoring', 'trl': 5,
+     'business': 'MEDIUM', 'time': '3', 'desirability': 'MEDIUM',
+     'description': 'Garments with integrated sensors that enable unobtrusive, continuous monitoring during daily activities, tracking parameters like heart activity and respiratory patterns.'},
+    {'name': 'Implantable Monitors', 'category': 'Continuous Monitoring', 'trl': 6,
+     'business': 'HIGH', 'time': '3', 'desirability': 'MEDIUM',
+     'description': 'Devices that provide continuous assessment of specific physiological parameters from within the body, offering exceptional data quality for long-term monitoring.'},
+    {'name': 'Remote Patient Monitoring', 'category': 'Continuous Monitoring', 'trl': 8,
+     'business': 'HIGH', 'time': 'NOW', 'desirability': 'HIGH',
+     'description': 'Comprehensive platforms that integrate data from various monitoring devices, provide clinical decision support, and facilitate communication between patients and providers.'},
+
+    # Oncology
+    {'name': 'Liquid Biopsy', 'category': 'Oncology', 'trl': 7,
+     'business': 'HIGH', 'time': '1', 'desirability': 'HIGH',
+     'description': 'Non-invasive cancer detection and monitoring through analysis of circulating tumor DNA, cells, exosomes, and other biomarkers in blood or other bodily fluids.'},
+    {'name': 'AI Cancer Diagnostics', 'category': 'Oncology', 'trl': 6,
+     'business': 'HIGH', 'time': '3', 'desirability': 'HIGH',
+     'description': 'Machine learning systems that analyze complex data to detect subtle patterns associated with malignancy, often with greater sensitivity than human interpretation.'},
+    {'name': 'Precision Oncology', 'category': 'Oncology', 'trl': 8,
+     'business': 'HIGH', 'time': 'NOW', 'desirability': 'HIGH',
+     'description': 'Diagnostic tools that analyze the genetic and molecular characteristics of tumors to guide personalized treatment decisions and identify actionable mutations.'},
+    {'name': 'Digital Pathology', 'category': 'Oncology', 'trl': 7,
+     'business': 'HIGH', 'time': '1', 'desirability': 'MEDIUM',
+     'description': 'Systems that digitize pathology slides and enable computational analysis to enhance diagnostic accuracy and efficiency, addressing challenges of subjective interpretation.'},
+    {'name': 'POC Cancer Diagnostics', 'category': 'Oncology', 'trl': 5,
+     'business': 'MEDIUM', 'time': '3', 'desirability': 'HIGH',
+     'description': 'Point-of-care tools enabling rapid, on-site testing for cancer biomarkers, reducing time to diagnosis and expanding access to cancer screening in resource-limited settings.'},
+
+    # Near Patient Care
+    {'name': 'Portable Molecular Diagnostics', 'category': 'Near Patient Care', 'trl': 8,
+     'business': 'HIGH', 'time': 'NOW', 'desirability': 'HIGH',
+     'description': 'Systems performing sophisticated molecular testing outside traditional laboratory settings, detecting specific pathogens and genetic markers with laboratory-grade accuracy.'},
+    {'name': 'Microfluidic Lab-on-Chip', 'category': 'Near Patient Care', 'trl': 6,
+     'business': 'HIGH', 'time': '3', 'desirability': 'HIGH',
+     'description': 'Technologies that integrate multiple laboratory functions on a single chip, performing complex assays with minimal sample volumes and high levels of automation.'},
+    {'name': 'Smartphone Diagnostics', 'category': 'Near Patient Care', 'trl': 7,
+     'business': 'HIGH', 'time': '1', 'desirability': 'HIGH',
+     'description': 'Systems leveraging the computing power, connectivity, and imaging capabilities of mobile phones to enable sophisticated testing in diverse settings.'},
+    {'name': 'Rapid Diagnostic Tests', 'category': 'Near Patient Care', 'trl': 9,
+     'business': 'HIGH', 'time': 'NOW', 'desirability': 'HIGH',
+     'description': 'Simple, disposable tests providing visual results without complex instrumentation, typically using lateral flow technologies with results available in minutes.'},
+    {'name': 'AI-Enhanced Diagnostics', 'category': 'Near Patient Care', 'trl': 6,
+     'business': 'HIGH', 'time': '3', 'desirability': 'HIGH',
+     'description': 'Point-of-care systems incorporating artificial intelligence to improve test interpretation, quality control, and clinical decision support.'},
+]
+
+
+def _to_enum(values, dtype):
+    """Convert raw labels to a fixed categorical, case-insensitively.
+
+    Labels are normalized once per distinct value rather than once per row.
+    """
+    codes, uniques = pd.factorize(values)
+    labels = pd.Index(uniques.astype(str)).str.strip().str.upper()
+    remap = dtype.categories.get_indexer(labels)
+    codes = np.where(codes >= 0, remap[codes], -1)
+    return pd.Categorical.from_codes(codes, dtype=dtype)
+
+
+def _to_trl(values):
+    """Convert raw TRLs to int8, ``MISSING_TRL`` where invalid."""
+    trl = pd.to_numeric(values, errors='coerce').astype(float).to_numpy()
+    with np.errstate(invalid='ignore'):
+        valid = (trl >= 1) & (trl <= 9) & (trl == np.floor(trl))
+    return np.where(valid, trl, MISSING_TRL).astype(np.int8)
+
+
+def _to_category(values):
+    """Convert raw category names to a categorical, missing where blank."""
+    names = pd.Series(values, dtype=object)
+    names = names.where(names.isna(), names.astype(str).str.strip())
+    return names.replace('', np.nan).astype('category')
+
+
+def _descriptions(chunk):
+    """Return a chunk's descriptions as an object array, '' where missing."""
+    if 'description' not in chunk.columns:
+        return np.full(len(chunk), '', dtype=object)
+    return chunk['description'].fillna('').astype(str).to_numpy(dtype=object)
+
+
+def _normalize_chunk(chunk, descriptions=True):
+    """Coerce one chunk of raw rows to the catalog's compact dtypes."""
+    missing = [col for col in REQUIRED_COLUMNS if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"Technology catalog is missing columns: {', '.join(missing)}")
+
+    columns = {
+        'name': chunk['name'].astype(str).to_numpy(dtype=object),
+        'category': _to_category(chunk['category']),
+        'trl': _to_trl(chunk['trl']),
+        'business': _to_enum(chunk['business'], ENUM_DTYPES['business']),
+        'time': _to_enum(chunk['time'], ENUM_DTYPES['time']),
+        'desirability': _to_enum(chunk['desirability'], ENUM_DTYPES['desirability']),
+    }
+    if descriptions:
+        columns['description'] = _descriptions(chunk)
+    return pd.DataFrame(columns)
+
+
+def _concat_chunks(chunks, descriptions=True):
+    """Concatenate normalized chunks, unifying the open-ended category column."""
+    if not chunks:
+        return _normalize_chunk(pd.DataFrame(columns=COLUMNS), descriptions)
+    categories = union_categoricals([chunk['category'] for chunk in chunks]).categories
+    chunks = [chunk.assign(category=chunk['category'].cat.set_categories(categories))
+              for chunk in chunks]
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _iter_csv(path, chunksize, columns):
+    sep = '\t' if path.lower().endswith('.tsv') else ','
+    header = pd.read_csv(path, sep=sep, nrows=0).columns
+    usecols = [col for col in columns if col in header]
+    yield from pd.read_csv(path, sep=sep, usecols=usecols, chunksize=chunksize,
+                           dtype={col: READ_DTYPES[col] for col in usecols})
+
+
+def _iter_parquet(path, chunksize, columns):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Reading Parquet catalogs requires pyarrow "
+                          "(pip install pyarrow)") from exc
+
+    parquet_file = pq.ParquetFile(path)
+    columns = [col for col in columns if col in parquet_file.schema_arrow.names]
+    for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+        yield batch.to_pandas()
+
+
+def _iter_sqlite(path, chunksize, table, columns):
+    import sqlite3
+
+    with sqlite3.connect(f'file:{path}?mode=ro', uri=True) as con:
+        available = [row[1] for row in con.execute(f'PRAGMA table_info("{table}")')]
+        if not available:
+            raise ValueError(f"SQLite catalog {path} has no table named {table!r}")
+        selected = ', '.join(f'"{col}"' for col in columns if col in available)
+        yield from pd.read_sql_query(f'SELECT {selected} FROM "{table}"', con,
+                                     chunksize=chunksize)
+
+
+def iter_source_chunks(source, chunksize=DEFAULT_CHUNKSIZE, table='technologies',
+                       columns=COLUMNS):
+    """Yield raw DataFrame chunks from a CSV, Parquet or SQLite catalog file.
+
+    Only the listed ``columns`` that the file actually has are read.
+    """
+    path = os.fspath(source)
+    lower = path.lower()
+    if lower.endswith(CSV_SUFFIXES):
+        return _iter_csv(path, chunksize, columns)
+    if lower.endswith(PARQUET_SUFFIXES):
+        return _iter_parquet(path, chunksize, columns)
+    if lower.endswith(SQLITE_SUFFIXES):
+        return _iter_sqlite(path, chunksize, table, columns)
+    raise ValueError(f"Unsupported technology catalog format: {path}")
+
+
+def load_technology_data(source=None, chunksize=DEFAULT_CHUNKSIZE, table='technologies',
+                         descriptions=True):
+    """Load the technology catalog as a DataFrame.
+
+    With no ``source`` the built-in sample catalog is returned. Otherwise
+    ``source`` is a path to a CSV, Parquet or SQLite file (``table`` names the
+    SQLite table). ``category``, ``business``, ``time`` and ``desirability``
+    are returned as pandas Categoricals and ``trl`` as int8. With
+    ``descriptions=False`` the ``description`` column is neither read nor
+    returned; see ``load_descriptions``.
+    """
+    if source is None:
+        return _concat_chunks([_normalize_chunk(pd.DataFrame(SAMPLE_TECHNOLOGIES), descriptions)],
+                              descriptions)
+
+    columns = COLUMNS if descriptions else REQUIRED_COLUMNS
+    chunks = [_normalize_chunk(chunk, descriptions)
+              for chunk in iter_source_chunks(source, chunksize=chunksize, table=table,
+                                              columns=columns)]
+    return _concat_chunks(chunks, descriptions)
+
+
+def load_descriptions(source=None, chunksize=DEFAULT_CHUNKSIZE, table='technologies'):
+    """Return the catalog's descriptions as an object array in row order.
+
+    Only the ``name`` and ``description`` columns are read (``name`` keeps
+    the row count right for files without descriptions), so the radar can
+    keep descriptions out of its in-memory catalog and fetch them when
+    first needed. Missing descriptions are returned as ''.
+    """
+    if source is None:
+        chunks = [pd.DataFrame(SAMPLE_TECHNOLOGIES)]
+    else:
+        chunks = iter_source_chunks(source, chunksize=chunksize, table=table,
+                                    columns=['name', 'description'])
+    parts = [_descriptions(chunk) for chunk in chunks]
+    return np.concatenate(parts) if parts else np.array([], dtype=object)
+
+
+def source_fingerprint(source, hash_contents=False):
+    """Return a value that changes whenever the catalog file changes.
+
+    Used as a cache key so edits to the file are picked up without a server
+    restart. By default the file's modification time and size are used;
+    ``hash_contents=True`` hashes the bytes instead, which also survives
+    copies that preserve mtime.
+    """
+    if source is None:
+        return None
+    path = os.fspath(source)
+    if not hash_contents:
+        stat = os.stat(path)
+        return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(1 << 20), b''):
+            digest.update(block)
+    return (os.path.abspath(path), digest.hexdigest())
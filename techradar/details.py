@@ -0,0 +1,85 @@
+"""Detail panel for the technology selected on the radar.
+
+The radar's technology bubbles carry their catalog index as ``customdata``.
+When a bubble is selected, the panel above the chart shows that
+technology's description. The HTML for each index is rendered once and kept
+in a per-catalog cache bounded by bytes, so repeated selections cost a dict
+lookup.
+"""
+
+import html
+
+from techradar.cache import MemoryLRU
+
+# Phase names for the TRL rings, innermost first
+PHASES = ('Research', 'Development', 'Deployment')
+
+# Bytes of rendered panels kept per catalog; a panel is about 1 kB
+DEFAULT_CACHE_BYTES = 2 ** 20
+
+
+def render_detail(tech, description=None):
+    """Render one technology (a row of the radar frame) as the panel HTML.
+
+    ``description`` is used when the row carries no description column.
+    """
+    fields = {key: html.escape(str(tech[key]))
+              for key in ('name', 'category', 'trl', 'business', 'time', 'desirability')}
+    phase = PHASES[min(max((int(tech['trl']) - 1) // 3, 0), len(PHASES) - 1)]
+    if description is None:
+        description = tech.get('description', '')
+    description = html.escape(str(description or ''))
+    return f"""
+        <div class="hover-info">
+            <h3>{fields['name']}</h3>
+            <p><strong>Category:</strong> {fields['category']}</p>
+            <p><strong>TRL:</strong> {fields['trl']} ({phase} Phase)</p>
+            <p><strong>Business Potential:</strong> {fields['business']}</p>
+            <p><strong>Time to Market:</strong> {fields['time']}</p>
+            <p><strong>Customer Desirability:</strong> {fields['desirability']}</p>
+            <p><strong>Description:</strong> {description}</p>
+        </div>
+        """
+
+
+def selected_indices(event):
+    """Return the catalog indices of the technologies in a chart selection.
+
+    ``event`` is the value returned by ``st.plotly_chart(on_select=...)``.
+    Level-of-detail aggregates carry ``-1`` and are skipped.
+    """
+    points = (event or {}).get('selection', {}).get('points', [])
+    indices = []
+    for point in points:
+        value = point.get('customdata')
+        if isinstance(value, (list, tuple)):
+            value = value[0] if value else None
+        if value is not None and value >= 0:
+            indices.append(int(value))
+    return indices
+
+
+class DetailCache:
+    """Pre-rendered detail panels for one version of a catalog.
+
+    The catalog DataFrame, and its descriptions when they are kept out of
+    the DataFrame (one per row), are passed to ``html`` rather than kept
+    here, so this holds only the rendered HTML.
+    """
+
+    def __init__(self, cache_bytes=DEFAULT_CACHE_BYTES):
+        self._cached_html = MemoryLRU(cache_bytes)
+
+    @staticmethod
+    def _render(df, index, descriptions):
+        description = None if descriptions is None else descriptions[df.index.get_loc(index)]
+        return render_detail(df.loc[index], description)
+
+    def html(self, index, df, descriptions=None):
+        """Return the panel HTML for catalog ``index`` of ``df``, or None if unknown."""
+        if index not in df.index:
+            return None
+        return self._cached_html.get_or_create(index, lambda: self._render(df, index, descriptions))
+
+    def cache_info(self):
+        return self._cached_html.cache_info()
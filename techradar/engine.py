@@ -0,0 +1,164 @@
+"""Shared data engine: load a radar's catalog and indexes on demand.
+
+Everything a radar needs to answer requests (the laid-out frame, the filter,
+detail and search indexes, and the in-browser page) is built on first use
+and kept in ``techradar.cache.SHARED_CACHE``. Entries are keyed by the data
+source, its fingerprint and the layout settings rather than by radar, so
+radars that share a catalog and categories share one copy.
+
+The catalog is kept in the compact form of ``layout.compact_radar_frame``:
+int8 codes for the enumerated columns, float32 layout columns and read-only
+arrays. Descriptions are not part of it: they are read with each version,
+since the search index needs them, and cached as their own entry. A
+``RadarData`` keeps its version's descriptions, so detail panels never read
+them again from a file that has since changed. A version whose entries were
+evicted is only rebuilt if the file still has its fingerprint; otherwise the
+current file is loaded instead.
+
+Catalogs read from a file are watched by ``REFRESHER`` (see
+``techradar.refresh``): when the file changes, the new version is built in a
+background thread and swapped in once ready, and the superseded entries are
+dropped from the cache. Sessions already holding the old catalog keep it
+until their next rerun.
+"""
+
+import collections
+import functools
+
+from techradar import perf
+from techradar.cache import SHARED_CACHE
+from techradar.clientside import client_radar_html
+from techradar.data import load_descriptions, load_technology_data, source_fingerprint
+from techradar.details import DetailCache
+from techradar.filters import FilterIndex
+from techradar.layout import compact_radar_frame, prepare_radar_frame
+from techradar.refresh import Refresher
+from techradar.scoring import ScoringIndex
+from techradar.search import SearchIndex
+
+# A loaded catalog together with the indexes built over it
+RadarData = collections.namedtuple('RadarData', ['df', 'descriptions', 'filter_index', 'details',
+                                                 'search_index', 'scoring'])
+
+
+class SourceChangedError(RuntimeError):
+    """The catalog file no longer has the fingerprint of the version being built."""
+
+
+def _check_fingerprint(source, fingerprint):
+    # Called after reading, so a file replaced before or during the read is caught
+    if source is not None and source_fingerprint(source) != fingerprint:
+        raise SourceChangedError(f"{source} no longer matches the version being loaded")
+
+
+def _source_key(radar):
+    """Return the key identifying a radar's catalog, whatever version of the file."""
+    return (radar.source, radar.table, radar.categories, radar.ring_radii,
+            radar.business_to_size, radar.time_to_color, radar.desirability_to_width)
+
+
+def _frame_key(radar, fingerprint):
+    """Return the cache key identifying one version of a radar's laid-out catalog."""
+    source, table, *layout = _source_key(radar)
+    return (source, table, fingerprint, *layout)
+
+
+# Load the technology data together with its marker encodings and packed,
+# non-overlapping bubble positions. The fingerprint is part of the key, so
+# edits to the source file are picked up without a restart.
+@SHARED_CACHE.memoize('radar_frame')
+def _radar_frame(source, table, fingerprint, categories, ring_radii, business_to_size,
+                 time_to_color, desirability_to_width):
+    encodings = dict(business_to_size=dict(business_to_size), time_to_color=dict(time_to_color),
+                     desirability_to_width=dict(desirability_to_width))
+    with perf.stage('read'):
+        df = load_technology_data(source, table=table, descriptions=False)
+        _check_fingerprint(source, fingerprint)
+    with perf.stage('layout'):
+        return compact_radar_frame(prepare_radar_frame(df, categories, pack=True,
+                                                       encodings=encodings,
+                                                       ring_radii=ring_radii))
+
+
+@SHARED_CACHE.memoize('descriptions')
+def _descriptions(source, table, fingerprint):
+    descriptions = load_descriptions(source, table=table)
+    _check_fingerprint(source, fingerprint)
+    return descriptions
+
+
+@SHARED_CACHE.memoize('filter_index')
+def _filter_index(*key):
+    return FilterIndex(_radar_frame(*key))
+
+
+@SHARED_CACHE.memoize('details')
+def _detail_cache(*key):
+    return DetailCache()
+
+
+@SHARED_CACHE.memoize('search_index')
+def _search_index(*key):
+    return SearchIndex(_radar_frame(*key), descriptions=_descriptions(*key[:3]))
+
+
+@SHARED_CACHE.memoize('scoring')
+def _scoring_index(*key):
+    return ScoringIndex(_radar_frame(*key))
+
+
+def _load_version(radar, fingerprint):
+    key = _frame_key(radar, fingerprint)
+    return RadarData(_radar_frame(*key), _descriptions(*key[:3]), _filter_index(*key),
+                     _detail_cache(*key), _search_index(*key), _scoring_index(*key))
+
+
+def _retire_version(source_key, fingerprint):
+    """Drop the cache entries built from a superseded version of a catalog.
+
+    That includes its descriptions: sessions still on the old catalog hold
+    them in their ``RadarData`` until their next rerun.
+    """
+    source, table, *layout = source_key
+    old_key = (source, table, fingerprint, *layout)
+    SHARED_CACHE.discard(lambda key: key[1] in (old_key, (source, table, fingerprint)) or (
+        key[0] == 'client_page' and key[1][1] == fingerprint))
+
+
+REFRESHER = Refresher(on_swap=_retire_version)
+
+
+def current_fingerprint(radar):
+    """Return the fingerprint of the catalog version ``radar`` is served from."""
+    version = REFRESHER.version(_source_key(radar)) if REFRESHER.enabled else None
+    return version.fingerprint if version else source_fingerprint(radar.source)
+
+
+def load_radar(radar):
+    """Return the laid-out catalog of ``radar`` and its indexes as a ``RadarData``.
+
+    Without the refresher (or for the built-in list) the source is
+    fingerprinted on every call and a changed file is reloaded here. So is
+    one that changed after the current version was evicted.
+    """
+    if radar.source is not None and REFRESHER.enabled:
+        try:
+            return REFRESHER.get(_source_key(radar), radar.source,
+                                 functools.partial(_load_version, radar))
+        except SourceChangedError:
+            pass
+    try:
+        return _load_version(radar, source_fingerprint(radar.source))
+    except SourceChangedError:
+        # Replaced while we read it; the next fingerprint is of the finished file
+        return _load_version(radar, source_fingerprint(radar.source))
+
+
+@SHARED_CACHE.memoize('client_page')
+def _client_page(radar, fingerprint, config):
+    return client_radar_html(_load_version(radar, fingerprint).df, radar, config=dict(config))
+
+
+def client_page(radar, config=None):
+    """Return the in-browser filtering page for ``radar`` (see ``techradar.clientside``)."""
+    return _client_page(radar, current_fingerprint(radar), tuple(sorted((config or {}).items())))
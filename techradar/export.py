@@ -0,0 +1,237 @@
+"""Headless batch export of radar snapshots.
+
+Renders one PNG, SVG and/or HTML snapshot per filter preset without a
+Streamlit runtime, reusing the app's data loading, filter index and figure
+code. Presets are rendered in parallel across a process pool. A snapshot
+whose preset and catalog are unchanged since the last export is skipped,
+based on an on-disk manifest in the output directory.
+
+Presets are read from a JSON file holding a list of objects such as::
+
+    [
+        {"name": "oncology-2025q1", "title": "Oncology radar",
+         "source": "data/2025q1.parquet",
+         "categories": ["Oncology"], "trl": [4, 9]},
+        {"name": "near-term", "time": ["NOW", "1"], "aggregate": true}
+    ]
+
+Only ``name`` is required; it names the output files, so it may not contain
+path separators. Omitted filters select everything. ``source``
+falls back to the ``--source`` option and then to the built-in catalog.
+``aggregate`` is ``"auto"`` (the default, same rule as the app), ``true``
+or ``false``. HTML snapshots embed plotly.js, so they open without internet
+access.
+"""
+
+import argparse
+import concurrent.futures
+import functools
+import hashlib
+import json
+import os
+import sys
+
+import pandas as pd
+
+from techradar.config import (
+    BUSINESS_OPTIONS,
+    BUSINESS_TO_SIZE,
+    CATEGORIES,
+    DESIRABILITY_OPTIONS,
+    TIME_OPTIONS,
+)
+from techradar.data import load_technology_data, source_fingerprint
+from techradar.figure import create_radar_plot
+from techradar.filters import FilterIndex
+from techradar.layout import prepare_radar_frame
+from techradar.lod import should_aggregate
+from techradar.packing import marker_scale
+
+FORMATS = ('png', 'svg', 'html')
+
+# Bump when the rendering changes so cached snapshots are regenerated
+EXPORT_VERSION = 2
+
+MANIFEST_NAME = '.export-manifest.json'
+
+
+def normalize_preset(preset, default_source=None):
+    """Fill in defaults and return a preset with every filter spelled out."""
+    if 'name' not in preset:
+        raise ValueError(f"Export preset is missing a name: {preset!r}")
+    name = str(preset['name'])
+    if (not name or name in ('.', '..') or os.path.isabs(name)
+            or any(sep in name for sep in ('/', '\\', os.sep))):
+        raise ValueError(f"Preset name {name!r} must be a plain file name")
+    aggregate = preset.get('aggregate', 'auto')
+    if aggregate not in ('auto', True, False):
+        raise ValueError(f"Preset {preset['name']!r}: aggregate must be 'auto', true or false")
+    return {
+        'name': name,
+        'title': preset.get('title'),
+        'source': preset.get('source', default_source),
+        'categories': list(preset.get('categories', CATEGORIES)),
+        'trl': [int(value) for value in preset.get('trl', (1, 9))],
+        'business': list(preset.get('business', BUSINESS_OPTIONS)),
+        'time': list(preset.get('time', TIME_OPTIONS)),
+        'desirability': list(preset.get('desirability', DESIRABILITY_OPTIONS)),
+        'aggregate': aggregate,
+    }
+
+
+def catalog_hash(source):
+    """Return a hash of the catalog's contents, for the export cache key."""
+    if source is None:
+        hashes = pd.util.hash_pandas_object(load_technology_data(), index=False)
+        return hashlib.blake2b(hashes.to_numpy().tobytes(), digest_size=16).hexdigest()
+    return source_fingerprint(source, hash_contents=True)[1]
+
+
+def snapshot_key(preset, data_hash, fmt):
+    """Return the cache key identifying one rendered snapshot."""
+    payload = json.dumps([EXPORT_VERSION, preset, data_hash, fmt], sort_keys=True)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=4)
+def _catalog(source, data_hash):
+    """Load, lay out and index a catalog once per worker process."""
+    df = prepare_radar_frame(load_technology_data(source), pack=True)
+    return df, FilterIndex(df)
+
+
+def render_preset(preset, data_hash, formats, out_dir):
+    """Render one preset to ``formats`` and return the files written."""
+    df, index = _catalog(preset['source'], data_hash)
+    filtered = df.iloc[index.positions(
+        preset['categories'], preset['trl'], preset['business'], preset['time'],
+        preset['desirability'],
+    )]
+    if preset['aggregate'] == 'auto':
+        aggregate = should_aggregate(len(filtered), preset['categories'], preset['trl'])
+    else:
+        aggregate = preset['aggregate']
+
+    fig = create_radar_plot(filtered, aggregate=aggregate,
+                            size_scale=marker_scale(df, BUSINESS_TO_SIZE))
+    if preset['title']:
+        fig.update_layout(title_text=preset['title'])
+
+    written = []
+    for fmt in formats:
+        path = os.path.join(out_dir, f"{preset['name']}.{fmt}")
+        if fmt == 'html':
+            fig.write_html(path, include_plotlyjs=True)
+        else:
+            fig.write_image(path, format=fmt, width=1200, height=700)
+        written.append(path)
+    return written
+
+
+def _load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME)) as handle:
+            return json.load(handle)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_manifest(out_dir, manifest):
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    with open(path + '.tmp', 'w') as handle:
+        json.dump(manifest, handle, indent=2, sort_keys=True)
+    os.replace(path + '.tmp', path)
+
+
+def export_snapshots(presets, out_dir, formats=FORMATS, source=None, jobs=None, force=False):
+    """Render every preset and return ``(written paths, skipped paths)``."""
+    formats = tuple(formats)
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Unsupported export formats: {', '.join(sorted(unknown))}")
+    if set(formats) - {'html'}:
+        try:
+            import kaleido  # noqa: F401
+        except ImportError as exc:
+            raise ImportError("PNG and SVG export requires kaleido "
+                              "(pip install kaleido)") from exc
+
+    presets = [normalize_preset(preset, default_source=source) for preset in presets]
+    names = [preset['name'] for preset in presets]
+    if len(set(names)) != len(names):
+        raise ValueError("Export preset names must be unique")
+
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = _load_manifest(out_dir)
+    data_hashes = {src: catalog_hash(src) for src in {preset['source'] for preset in presets}}
+
+    # Work out which snapshots are stale before starting any workers
+    pending, skipped = [], []
+    for preset in presets:
+        data_hash = data_hashes[preset['source']]
+        stale = []
+        for fmt in formats:
+            path = os.path.join(out_dir, f"{preset['name']}.{fmt}")
+            key = snapshot_key(preset, data_hash, fmt)
+            if not force and manifest.get(os.path.basename(path)) == key and os.path.exists(path):
+                skipped.append(path)
+            else:
+                stale.append((fmt, key))
+        if stale:
+            pending.append((preset, data_hash, stale))
+
+    written, failed = [], []
+    if pending:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                pool.submit(render_preset, preset, data_hash, [fmt for fmt, _ in stale], out_dir):
+                    (preset['name'], stale)
+                for preset, data_hash, stale in pending
+            }
+            for future in concurrent.futures.as_completed(futures):
+                name, stale = futures[future]
+                try:
+                    paths = future.result()
+                except Exception as exc:
+                    failed.append((name, exc))
+                    continue
+                for path, (_, key) in zip(paths, stale):
+                    manifest[os.path.basename(path)] = key
+                written.extend(paths)
+                # Saved after every preset, so a later failure keeps finished snapshots cached
+                _save_manifest(out_dir, manifest)
+    if failed:
+        names = ', '.join(sorted(name for name, _ in failed))
+        raise RuntimeError(f"{len(failed)} preset(s) failed: {names}") from failed[0][1]
+    return written, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m techradar export',
+        description="Render radar snapshots for a list of filter presets.")
+    parser.add_argument('presets', help="JSON file with a list of filter presets")
+    parser.add_argument('--out', default='exports', help="output directory (default: exports)")
+    parser.add_argument('--format', dest='formats', nargs='+', choices=FORMATS, default=list(FORMATS),
+                        help="snapshot formats to render (default: all)")
+    parser.add_argument('--source', default=os.environ.get('TECH_RADAR_SOURCE'),
+                        help="catalog file used by presets without a source "
+                             "(default: $TECH_RADAR_SOURCE or the built-in catalog)")
+    parser.add_argument('--jobs', type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument('--force', action='store_true', help="re-render even if cached")
+    args = parser.parse_args(argv)
+
+    with open(args.presets) as handle:
+        presets = json.load(handle)
+
+    try:
+        written, skipped = export_snapshots(presets, args.out, formats=args.formats,
+                                            source=args.source, jobs=args.jobs, force=args.force)
+    except (ImportError, ValueError) as exc:
+        parser.exit(2, f"error: {exc}\n")
+    except RuntimeError as exc:
+        parser.exit(1, f"error: {exc}: {exc.__cause__}\n")
+    print(f"Rendered {len(written)} snapshot(s), {len(skipped)} unchanged, in {args.out}",
+          file=sys.stderr)
+    return 0
@@ -0,0 +1,367 @@
+"""Plotly figure construction for the technology radar.
+
+Plotly is imported inside the functions that build figures, so importing
+this module (or the modules that depend on it) stays cheap for callers that
+never draw a radar.
+"""
+
+import copy
+
+import numpy as np
+import pandas as pd
+
+from techradar.cache import SHARED_CACHE
+from techradar.config import (
+    BUSINESS_LEGEND,
+    CATEGORIES,
+    DESIRABILITY_LEGEND,
+    RINGS,
+    TIME_LEGEND,
+)
+from techradar.layout import category_angles
+from techradar.lod import aggregate_hover_text, aggregate_lod
+from techradar.radars import DEFAULT_RADAR
+
+# Ring color of highlighted (shortlisted) technologies
+HIGHLIGHT_COLOR = '#d62728'
+
+# Bubbles whose color is missing (an unknown time to market)
+MISSING_COLOR = 'gray'
+
+# Columns after the catalog index in a technology's customdata, shown on hover
+HOVER_COLUMNS = ('name', 'category', 'trl', 'business', 'time', 'desirability')
+
+HOVER_TEMPLATE = (
+    '<b>%{customdata[1]}</b><br>'
+    'Category: %{customdata[2]}<br>'
+    'TRL: %{customdata[3]}<br>'
+    'Business Potential: %{customdata[4]}<br>'
+    'Time to Market: %{customdata[5]}<br>'
+    'Customer Desirability: %{customdata[6]}'
+    '<extra></extra>'
+)
+
+# Added to the hover template of shortlisted technologies, after the hover columns
+SCORE_TEMPLATE = f'<br>Score: %{{customdata[{len(HOVER_COLUMNS) + 1}]:.2f}}'
+
+
+def hover_customdata(data, *extra):
+    """Return one customdata row per technology: its index, then ``HOVER_COLUMNS``.
+
+    Plotly.js fills ``HOVER_TEMPLATE`` in the browser, so the payload carries
+    the values once instead of a full HTML label per bubble. ``extra``
+    columns are appended after the hover columns.
+    """
+    columns = [data.index.to_numpy()]
+    columns += [data[name].to_numpy(dtype=object) for name in HOVER_COLUMNS + extra]
+    return np.column_stack(columns).astype(object)
+
+
+def color_codes(column):
+    """Return a color column as int8 codes and the marker attributes drawing them.
+
+    A numeric color array is sent as a base64 typed array; the step
+    colorscale maps code ``i`` back to the ``i``-th color, and missing
+    colors to ``MISSING_COLOR``.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes, colors = column.cat.codes.to_numpy(), list(column.cat.categories)
+    else:
+        codes, colors = pd.factorize(column)
+        colors = list(colors)
+    codes = codes.astype(np.int8)
+    if (codes < 0).any() or not colors:
+        codes = np.where(codes < 0, len(colors), codes).astype(np.int8)
+        colors.append(MISSING_COLOR)
+    steps = len(colors)
+    colorscale = [[bound / steps, color] for i, color in enumerate(colors) for bound in (i, i + 1)]
+    return codes, dict(colorscale=colorscale, cmin=-0.5, cmax=steps - 0.5, showscale=False)
+
+
+def technology_traces(filtered_data, group_by=None):
+    """Return the scatter trace(s) holding the technology bubbles.
+
+    All bubbles are emitted as a single trace with array-valued marker
+    attributes. When ``group_by`` names a column (e.g. ``'category'``), one
+    trace per group is emitted instead, which keeps the payload small while
+    allowing per-group styling or toggling.
+    """
+    import plotly.graph_objects as go
+
+    if filtered_data.empty:
+        return []
+
+    if group_by is None:
+        groups = [('Technologies', filtered_data)]
+    else:
+        groups = filtered_data.groupby(group_by, sort=False, observed=True)
+
+    traces = []
+    for group_name, group in groups:
+        colors, color_scale = color_codes(group['color'])
+        traces.append(go.Scatter(
+            x=group['x'].to_numpy(), y=group['y'].to_numpy(),
+            mode='markers',
+            marker=dict(
+                size=group['size'].to_numpy(),
+                color=colors,
+                line=dict(width=group['line_width'].to_numpy(), color='black'),
+                opacity=0.5,  # Semi-transparent bubbles for better visibility when overlapping
+                **color_scale
+            ),
+            name=str(group_name),
+            # The index comes first, for the selection callback
+            customdata=hover_customdata(group),
+            hovertemplate=HOVER_TEMPLATE,
+            showlegend=False
+        ))
+    return traces
+
+
+def highlight_traces(highlighted):
+    """Return one trace ringing the highlighted technologies.
+
+    The rings are drawn over the regular bubbles (or the aggregates) with a
+    transparent fill. A ``score`` column, when present, is added to the
+    hover label.
+    """
+    import plotly.graph_objects as go
+
+    if highlighted.empty:
+        return []
+    extra, template = (), HOVER_TEMPLATE
+    if 'score' in highlighted.columns:
+        extra, template = ('score',), HOVER_TEMPLATE.replace('<extra>', SCORE_TEMPLATE + '<extra>')
+    return [go.Scatter(
+        x=highlighted['x'].to_numpy(), y=highlighted['y'].to_numpy(),
+        mode='markers',
+        marker=dict(
+            size=highlighted['size'].to_numpy() + 6,
+            color='rgba(0, 0, 0, 0)',
+            line=dict(width=3, color=HIGHLIGHT_COLOR)
+        ),
+        name='Shortlist',
+        customdata=hover_customdata(highlighted, *extra),
+        hovertemplate=template,
+        showlegend=False
+    )]
+
+
+def aggregate_traces(filtered_data, radar=DEFAULT_RADAR):
+    """Return one trace of level-of-detail aggregate bubbles.
+
+    Aggregates carry ``-1`` as customdata so they can be told apart from
+    individual technologies.
+    """
+    import plotly.graph_objects as go
+
+    encodings = radar.encodings
+    agg = aggregate_lod(filtered_data, radar.categories, encodings['time_to_color'],
+                        encodings['desirability_to_width'], radar.ring_radii)
+    if agg.empty:
+        return []
+    return [go.Scatter(
+        x=agg['x'].to_numpy(), y=agg['y'].to_numpy(),
+        mode='markers',
+        marker=dict(
+            size=agg['size'].to_numpy(),
+            color=agg['color'].to_numpy(dtype=object),
+            line=dict(width=agg['line_width'].to_numpy(), color='black'),
+            opacity=0.6
+        ),
+        name='Aggregates',
+        hovertext=aggregate_hover_text(agg, radar.rings),
+        hoverinfo='text',
+        customdata=np.full(len(agg), -1),
+        showlegend=False
+    )]
+
+
+def _add_legend(fig, traces, title, title_x, title_y):
+    fig.add_traces(traces)
+    fig.add_annotation(
+        x=title_x, y=title_y,
+        text=title,
+        showarrow=False,
+        font=dict(size=14, color='black', family='Arial, sans-serif'),
+        xanchor='center'
+    )
+
+
+@SHARED_CACHE.memoize('base_figure')
+def base_figure_spec(categories=tuple(CATEGORIES), rings=RINGS,
+                     time_legend=TIME_LEGEND, business_legend=BUSINESS_LEGEND,
+                     desirability_legend=DESIRABILITY_LEGEND, title='Healthcare Technology Radar',
+                     size_scale=1.0):
+    """Build the static radar background once and return it as a plain dict.
+
+    Rings, category spokes, category labels and the three legends do not
+    depend on the filtered data, so they are built and validated once per
+    configuration and shared by every session and radar in the process
+    (see ``techradar.cache``). Returns the figure dict and the number of
+    background traces; technology traces are inserted after those so the
+    legends stay drawn on top. ``size_scale`` is the marker scale applied by
+    packing (``packing.marker_scale``), so the Business Potential legend
+    shows the sizes actually drawn.
+    """
+    import plotly.graph_objects as go
+
+    category_to_angle = category_angles(categories)
+
+    # Create figure with fixed aspect ratio
+    fig = go.Figure()
+
+    # Add rings for TRL levels
+    for i, (ring_name, radius, ring_color) in enumerate(rings):
+        # Create a large number of points to approximate a circle
+        theta = np.linspace(0, np.pi, 100)
+        x = radius * np.cos(theta)
+        y = radius * np.sin(theta)
+
+        # Add the ring as a scatter trace with fill
+        fig.add_trace(go.Scatter(
+            x=x, y=y,
+            mode='lines',
+            line=dict(color='gray', width=1, dash='dash'),
+            fill='tozeroy' if i == 0 else 'tonexty',
+            fillcolor=ring_color,
+            name=ring_name,
+            hoverinfo='skip'
+        ))
+
+    # Add category lines
+    for category, angle in category_to_angle.items():
+        x = [0, 1 * np.cos(angle)]
+        y = [0, 1 * np.sin(angle)]
+        fig.add_trace(go.Scatter(
+            x=x, y=y,
+            mode='lines',
+            line=dict(color='gray', width=1),
+            hoverinfo='skip',
+            showlegend=False
+        ))
+
+        # Add category labels
+        fig.add_annotation(
+            x=1.1 * np.cos(angle),
+            y=1.1 * np.sin(angle),
+            text=category,
+            showarrow=False,
+            font=dict(size=14, color='black', family='Arial, sans-serif'),
+            bgcolor='white',
+            bordercolor='gray',
+            borderwidth=1,
+            borderpad=4,
+            opacity=0.8
+        )
+
+    num_background = len(fig.data)
+
+    # Update layout with fixed aspect ratio to maintain semicircle shape
+    fig.update_layout(
+        showlegend=False,
+        margin=dict(l=20, r=20, t=60, b=20),
+        paper_bgcolor='white',
+        plot_bgcolor='white',
+        title=dict(
+            text=title,
+            font=dict(size=24, family='Arial, sans-serif'),
+            x=0.5
+        ),
+        xaxis=dict(
+            range=[-1.2, 1.2],
+            showgrid=False,
+            zeroline=False,
+            showticklabels=False,
+            scaleanchor="y",  # This ensures the aspect ratio is maintained
+            scaleratio=1      # Equal scaling for x and y axes
+        ),
+        yaxis=dict(
+            range=[0, 1.2],
+            showgrid=False,
+            zeroline=False,
+            showticklabels=False
+        ),
+        height=700,
+        hovermode='closest',
+        autosize=True
+    )
+
+    # Add legends positioned to avoid overlap with the radar plot
+    # Position legends outside the plot area
+    legend_x_right = 1.3
+    legend_x_left = -1.3
+
+    # Time to Market legend - positioned on the right side
+    _add_legend(fig, [
+        go.Scatter(
+            x=[legend_x_right], y=[0.9 - i*0.1],
+            mode='markers',
+            marker=dict(size=15, color=color, opacity=0.5),
+            name=name,
+            showlegend=True,
+            hoverinfo='skip'
+        )
+        for i, (name, color) in enumerate(time_legend)
+    ], "Time to Market", legend_x_right, 1.0)
+
+    # Business Potential legend - positioned on the left side
+    _add_legend(fig, [
+        go.Scatter(
+            x=[legend_x_left], y=[0.9 - i*0.12],
+            mode='markers',
+            marker=dict(size=size * size_scale, color='gray', opacity=0.5),
+            name=name,
+            showlegend=True,
+            hoverinfo='skip'
+        )
+        for i, (name, size) in enumerate(business_legend)
+    ], "Business Potential", legend_x_left, 1.0)
+
+    # Customer Desirability legend - positioned at the bottom
+    _add_legend(fig, [
+        go.Scatter(
+            x=[-0.4 + i*0.4], y=[0.1],
+            mode='markers',
+            marker=dict(
+                size=30,
+                color='white',
+                opacity=0.5,
+                line=dict(width=width, color='black')
+            ),
+            name=name,
+            showlegend=True,
+            hoverinfo='skip'
+        )
+        for i, (name, width) in enumerate(desirability_legend)
+    ], "Customer Desirability", 0, 0.2)
+
+    return fig.to_dict(), num_background
+
+
+# Create the interactive radar plot with filtered data. With aggregate=True
+# the technologies are drawn as level-of-detail aggregates (see techradar.lod).
+# ``radar`` is a RadarDefinition; the healthcare radar is used by default.
+# ``highlight`` is an optional frame of technologies to ring (see techradar.scoring).
+# ``size_scale`` is the marker scale of the packed catalog, for the size legend.
+def create_radar_plot(filtered_data, group_by=None, aggregate=False, radar=DEFAULT_RADAR,
+                      highlight=None, size_scale=1.0):
+    import plotly.graph_objects as go
+
+    spec, num_background = base_figure_spec(*radar.figure_config, size_scale=size_scale)
+
+    if aggregate:
+        traces = aggregate_traces(filtered_data, radar)
+    else:
+        traces = technology_traces(filtered_data, group_by=group_by)
+    if highlight is not None:
+        traces += highlight_traces(highlight)
+
+    # Copy the cached background so callers can safely mutate the result
+    data = copy.deepcopy(spec['data'])
+    data[num_background:num_background] = [trace.to_plotly_json() for trace in traces]
+
+    # The background was validated when it was cached and the technology
+    # traces were validated on construction, so skip a second validation pass
+    return go.Figure(dict(data=data, layout=copy.deepcopy(spec['layout'])),
+                     _validate=False)
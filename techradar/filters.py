@@ -0,0 +1,126 @@
+"""Precomputed index for the sidebar filters.
+
+Every rerun used to rebuild the filter mask with one full-column scan per
+filter. ``FilterIndex`` does that work once per loaded catalog: it keeps a
+packed bitmap per value of each enumerated column and a TRL-sorted position
+array, so a filter request becomes a few bitwise operations over
+``len(df) / 8`` bytes. Results are int32 positions, memoized per filter
+tuple up to a byte budget.
+"""
+
+import numpy as np
+
+from techradar.cache import MemoryLRU
+
+# Enumerated columns answered from per-value bitmaps
+FACETS = ('category', 'business', 'time', 'desirability')
+
+# Bytes of filter results memoized per index; a full result at 1M rows is 4 MB
+DEFAULT_CACHE_BYTES = 32 * 2 ** 20
+
+
+def _value_bitmaps(column):
+    """Return ``{value: packed bitmap}`` for every distinct value of ``column``."""
+    if hasattr(column, 'cat'):
+        codes, values = column.cat.codes.to_numpy(), column.cat.categories
+    else:
+        codes, values = column.factorize()
+    return {value: np.packbits(codes == code) for code, value in enumerate(values)}
+
+
+class FilterIndex:
+    """Answer sidebar filter queries against a fixed catalog DataFrame."""
+
+    def __init__(self, df, cache_bytes=DEFAULT_CACHE_BYTES):
+        self.num_rows = len(df)
+        self._position_dtype = np.int32 if self.num_rows < 2 ** 31 else np.int64
+        self._bitmaps = {facet: _value_bitmaps(df[facet]) for facet in FACETS}
+        # Rows with a value in each facet; None when no value is missing
+        self._present = {
+            facet: np.packbits(df[facet].notna().to_numpy()) if df[facet].hasnans else None
+            for facet in FACETS
+        }
+        self._empty = np.zeros((self.num_rows + 7) // 8, dtype=np.uint8)
+        self._full = np.packbits(np.ones(self.num_rows, dtype=bool))
+
+        # Positions sorted by TRL so a range is two binary searches
+        trl = df['trl'].to_numpy()
+        self._trl_order = np.argsort(trl, kind='stable')
+        self._trl_sorted = trl[self._trl_order]
+
+        # LRU memo keyed on the normalized filter tuple, bounded by result bytes
+        self._cached_positions = MemoryLRU(cache_bytes)
+
+    def _facet_bitmap(self, facet, values):
+        bitmaps = self._bitmaps[facet]
+        if bitmaps.keys() <= values:
+            # Every value selected: only rows missing this facet are excluded
+            return self._present[facet]
+        selected = [bitmaps[value] for value in values if value in bitmaps]
+        if not selected:
+            return self._empty
+        return np.bitwise_or.reduce(selected)
+
+    def _trl_bitmap(self, trl_min, trl_max):
+        start = np.searchsorted(self._trl_sorted, trl_min, side='left')
+        stop = np.searchsorted(self._trl_sorted, trl_max, side='right')
+        if start == 0 and stop == self.num_rows:
+            return None
+        mask = np.zeros(self.num_rows, dtype=bool)
+        mask[self._trl_order[start:stop]] = True
+        return np.packbits(mask)
+
+    def _compute_positions(self, categories, trl_range, business, time, desirability):
+        bitmaps = [
+            self._facet_bitmap('category', categories),
+            self._trl_bitmap(*trl_range),
+            self._facet_bitmap('business', business),
+            self._facet_bitmap('time', time),
+            self._facet_bitmap('desirability', desirability),
+        ]
+        bitmaps = [bitmap for bitmap in bitmaps if bitmap is not None]
+        combined = np.bitwise_and.reduce(bitmaps) if bitmaps else self._full
+        positions = np.flatnonzero(np.unpackbits(combined, count=self.num_rows))
+        positions = positions.astype(self._position_dtype, copy=False)
+        positions.flags.writeable = False  # Shared between sessions via the memo
+        return positions
+
+    def positions(self, categories, trl_range, business, time, desirability):
+        """Return the sorted row positions matching the sidebar selections."""
+        key = (
+            frozenset(categories),
+            (int(trl_range[0]), int(trl_range[1])),
+            frozenset(business),
+            frozenset(time),
+            frozenset(desirability),
+        )
+        return self._cached_positions.get_or_create(key, lambda: self._compute_positions(*key))
+
+    def mask(self, categories, trl_range, business, time, desirability):
+        """Return the matching rows as a boolean mask."""
+        mask = np.zeros(self.num_rows, dtype=bool)
+        mask[self.positions(categories, trl_range, business, time, desirability)] = True
+        return mask
+
+    def cache_info(self):
+        return self._cached_positions.cache_info()
+
+
+def select_rows(df, positions):
+    """Return the rows of ``df`` at ``positions``, without a copy when possible.
+
+    When ``positions`` is every row in order (no filter applies) ``df``
+    itself is returned, so sessions share the catalog instead of each
+    holding a copy.
+    """
+    positions = np.asarray(positions)
+    if len(positions) == len(df) and (len(df) == 0 or (
+            positions[0] == 0 and np.all(positions[1:] > positions[:-1]))):
+        return df
+    return df.iloc[positions]
+
+
+def contains_position(positions, position):
+    """Return True if the sorted ``positions`` include ``position``."""
+    at = np.searchsorted(positions, position)
+    return bool(at < len(positions) and positions[at] == position)
@@ -0,0 +1,312 @@
+"""Versioned radar history stored as deltas.
+
+Each published radar (say, one per quarter) is recorded as a version in a
+``HistoryStore`` directory. Only the first version is stored in full; every
+later one stores just the technologies that were added or changed since the
+previous version, plus the names of those removed. Names are the key, so
+they must be unique within a version.
+
+Versions are rebuilt lazily by replaying deltas, and recently rebuilt
+versions are memoized. ``diff_versions`` compares two versions column by
+column in a handful of vectorized operations, and ``movement_timeline``
+animates how technologies moved between rings and time-to-market bands.
+
+The store is a directory with a ``history.json`` manifest and one CSV per
+version::
+
+    python -m techradar history add radar-history 2025Q1 data/2025q1.parquet
+    python -m techradar history list radar-history
+    python -m techradar history diff radar-history 2025Q1 2025Q2
+"""
+
+import argparse
+import copy
+import functools
+import json
+import os
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+from techradar.config import CATEGORIES, RINGS, TIME_OPTIONS
+from techradar.data import COLUMNS, _concat_chunks, load_technology_data
+from techradar.layout import prepare_radar_frame, trl_to_radius
+
+MANIFEST_NAME = 'history.json'
+
+HISTORY_FORMAT = 1
+
+# Compared when looking for changes; ``name`` is the key
+VALUE_COLUMNS = [col for col in COLUMNS if col != 'name']
+
+STATUSES = ('added', 'removed', 'changed', 'unchanged')
+
+_RING_RADII = np.array([radius for _, radius, _ in RINGS])
+
+
+def _differs(old, new):
+    """Elementwise "values differ", treating two missing values as equal."""
+    old = old.astype(object).to_numpy()
+    new = new.astype(object).to_numpy()
+    missing_old, missing_new = pd.isna(old), pd.isna(new)
+    return np.where(missing_old | missing_new, missing_old != missing_new, old != new)
+
+
+def _check_unique(df):
+    duplicated = df['name'][df['name'].duplicated()]
+    if len(duplicated):
+        raise ValueError(f"Technology names must be unique; duplicated: "
+                         f"{', '.join(map(str, duplicated.unique()[:5]))}")
+
+
+def catalog_delta(old, new):
+    """Return ``(upserts, removed)`` turning catalog ``old`` into ``new``.
+
+    ``upserts`` holds the rows of ``new`` that are new or differ from
+    ``old``; ``removed`` the names only present in ``old``.
+    """
+    merged = old[COLUMNS].merge(new[COLUMNS], on='name', how='outer',
+                                suffixes=('_old', '_new'), indicator=True)
+    both = (merged['_merge'] == 'both').to_numpy()
+    changed = np.zeros(len(merged), dtype=bool)
+    for col in VALUE_COLUMNS:
+        changed |= _differs(merged[f'{col}_old'], merged[f'{col}_new'])
+    upsert_names = merged['name'][(merged['_merge'] == 'right_only').to_numpy() | (both & changed)]
+    removed = merged['name'][(merged['_merge'] == 'left_only').to_numpy()].to_numpy(dtype=object)
+    return new[new['name'].isin(upsert_names)].reset_index(drop=True), removed
+
+
+def apply_delta(old, upserts, removed):
+    """Return catalog ``old`` with ``upserts`` applied and ``removed`` dropped."""
+    replaced = np.concatenate([np.asarray(removed, dtype=object),
+                               upserts['name'].to_numpy(dtype=object)])
+    kept = old[~old['name'].isin(replaced)]
+    return _concat_chunks([kept[COLUMNS], upserts[COLUMNS]])
+
+
+def _ring(trl):
+    """Return the 0-based ring of each TRL value, -1 where missing."""
+    radius = trl_to_radius(np.nan_to_num(trl, nan=0))
+    ring = np.searchsorted(_RING_RADII, radius)
+    return np.where(np.isnan(radius), -1, ring)
+
+
+def diff_versions(old, new):
+    """Compare two catalog versions by technology name.
+
+    Returns one row per technology in either version with its ``status``
+    (added, removed, changed or unchanged), old and new TRL ring and time to
+    market, and how far it moved: ``ring_shift`` in rings (positive means
+    closer to deployment) and ``time_shift`` in time-to-market bands
+    (negative means sooner).
+    """
+    merged = old[COLUMNS].merge(new[COLUMNS], on='name', how='outer',
+                                suffixes=('_old', '_new'), indicator=True)
+    changed = np.zeros(len(merged), dtype=bool)
+    for col in VALUE_COLUMNS:
+        changed |= _differs(merged[f'{col}_old'], merged[f'{col}_new'])
+    status = np.select(
+        [merged['_merge'] == 'right_only', merged['_merge'] == 'left_only', changed],
+        ['added', 'removed', 'changed'], default='unchanged')
+
+    time_old = pd.Categorical(merged['time_old'], categories=TIME_OPTIONS, ordered=True)
+    time_new = pd.Categorical(merged['time_new'], categories=TIME_OPTIONS, ordered=True)
+    ring_old = _ring(merged['trl_old'].to_numpy(dtype=float))
+    ring_new = _ring(merged['trl_new'].to_numpy(dtype=float))
+    both = (merged['_merge'] == 'both').to_numpy()
+    time_codes = (time_old.codes >= 0) & (time_new.codes >= 0)
+
+    category = merged['category_new'].astype(object).where(
+        merged['category_new'].notna(), merged['category_old'].astype(object))
+    return pd.DataFrame({
+        'name': merged['name'],
+        'status': pd.Categorical(status, categories=STATUSES),
+        'category': category,
+        'trl_old': merged['trl_old'].astype('Int8'),
+        'trl_new': merged['trl_new'].astype('Int8'),
+        'time_old': time_old,
+        'time_new': time_new,
+        'ring_shift': pd.array(np.where(both & (ring_old >= 0) & (ring_new >= 0),
+                                        ring_new - ring_old, 0), dtype='Int8'),
+        'time_shift': pd.array(np.where(both & time_codes, time_new.codes - time_old.codes, 0),
+                               dtype='Int8'),
+    })
+
+
+def _safe_label(label):
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', label)
+
+
+class HistoryStore:
+    """Radar versions stored as deltas in a directory."""
+
+    def __init__(self, path, cache_size=8):
+        self.path = os.fspath(path)
+        self._manifest = self._load_manifest()
+        self._cached_snapshot = functools.lru_cache(maxsize=cache_size)(self._build_snapshot)
+
+    def _load_manifest(self):
+        try:
+            with open(os.path.join(self.path, MANIFEST_NAME)) as handle:
+                manifest = json.load(handle)
+        except FileNotFoundError:
+            return {'format': HISTORY_FORMAT, 'versions': []}
+        if manifest.get('format') != HISTORY_FORMAT:
+            raise ValueError(f"Unsupported history format in {self.path}: {manifest.get('format')}")
+        return manifest
+
+    def _save_manifest(self):
+        path = os.path.join(self.path, MANIFEST_NAME)
+        with open(path + '.tmp', 'w') as handle:
+            json.dump(self._manifest, handle, indent=2)
+        os.replace(path + '.tmp', path)
+
+    @property
+    def versions(self):
+        """Version labels, oldest first."""
+        return [version['label'] for version in self._manifest['versions']]
+
+    def version_sizes(self):
+        """Return ``{label: number of technologies}`` without rebuilding versions."""
+        return {version['label']: version['rows'] for version in self._manifest['versions']}
+
+    def _position(self, label):
+        try:
+            return self.versions.index(label)
+        except ValueError:
+            raise KeyError(f"No radar version {label!r} in {self.path}") from None
+
+    def _build_snapshot(self, position):
+        version = self._manifest['versions'][position]
+        previous = (self._cached_snapshot(position - 1) if position
+                    else _concat_chunks([]))
+        upserts = load_technology_data(os.path.join(self.path, version['delta']))
+        return apply_delta(previous, upserts, version['removed'])
+
+    def snapshot(self, label):
+        """Return the catalog as it was at version ``label``.
+
+        The frame is shared with later calls; do not modify it in place.
+        """
+        return self._cached_snapshot(self._position(label))
+
+    def add_version(self, label, df):
+        """Record catalog ``df`` as a new latest version named ``label``.
+
+        Returns the number of added or changed and of removed technologies.
+        """
+        if label in self.versions:
+            raise ValueError(f"Radar version {label!r} already exists in {self.path}")
+        _check_unique(df)
+        previous = self.snapshot(self.versions[-1]) if self.versions else _concat_chunks([])
+        upserts, removed = catalog_delta(previous, df)
+
+        os.makedirs(self.path, exist_ok=True)
+        delta_name = f"{len(self.versions) + 1:04d}-{_safe_label(label)}.csv"
+        upserts[COLUMNS].to_csv(os.path.join(self.path, delta_name), index=False)
+        self._manifest['versions'].append({
+            'label': label, 'delta': delta_name, 'removed': [str(name) for name in removed],
+            'rows': int(len(df)),
+        })
+        self._save_manifest()
+        return len(upserts), len(removed)
+
+    def diff(self, old_label, new_label):
+        """Return ``diff_versions`` between two stored versions."""
+        return diff_versions(self.snapshot(old_label), self.snapshot(new_label))
+
+
+def movement_timeline(store, labels=None, categories=CATEGORIES, duration=800):
+    """Return a Plotly figure animating the radar across ``labels``.
+
+    Technologies that are identical in every version are drawn once as a
+    static trace. All others go in a second trace keyed by name, and each
+    animation frame carries only that trace, so the payload grows with the
+    number of technologies that changed rather than with the catalog.
+    Bubbles use the hashed layout without packing, so only technologies
+    that actually changed move.
+    """
+    import plotly.graph_objects as go
+
+    from techradar.figure import base_figure_spec, technology_traces
+
+    labels = list(labels or store.versions)
+    if not labels:
+        raise ValueError("No radar versions to animate")
+    snapshots = [store.snapshot(label) for label in labels]
+
+    moving = set()
+    for old, new in zip(snapshots, snapshots[1:]):
+        diff = diff_versions(old, new)
+        moving.update(diff['name'][diff['status'] != 'unchanged'])
+    moving = pd.Index(list(moving), dtype=object)
+
+    frames_data = [prepare_radar_frame(snapshot, categories) for snapshot in snapshots]
+    first = frames_data[0]
+    static = technology_traces(first[~first['name'].isin(moving)])
+
+    def moving_trace(frame):
+        frame = frame[frame['name'].isin(moving)]
+        traces = technology_traces(frame)
+        trace = traces[0] if traces else go.Scatter(x=[], y=[], mode='markers', showlegend=False)
+        trace.update(name='Changed', ids=frame['name'].astype(str).to_numpy())
+        return trace
+
+    spec, num_background = base_figure_spec(tuple(categories))
+    data = copy.deepcopy(spec['data'])
+    data[num_background:num_background] = static + [moving_trace(first)]
+    moving_index = num_background + len(static)
+
+    fig = go.Figure(dict(data=data, layout=copy.deepcopy(spec['layout'])))
+    fig.frames = [go.Frame(name=label, data=[moving_trace(frame)], traces=[moving_index])
+                  for label, frame in zip(labels, frames_data)]
+
+    step_args = dict(mode='immediate', frame=dict(duration=duration, redraw=False),
+                     transition=dict(duration=duration, easing='cubic-in-out'))
+    fig.update_layout(
+        updatemenus=[dict(type='buttons', showactive=False, x=0.0, y=0, xanchor='left',
+                          yanchor='top', pad=dict(t=40),
+                          buttons=[dict(label='Play', method='animate',
+                                        args=[None, dict(step_args, fromcurrent=True)])])],
+        sliders=[dict(active=0, x=0.1, len=0.9, y=0, yanchor='top', pad=dict(t=30),
+                      currentvalue=dict(prefix='Version: '),
+                      steps=[dict(label=label, method='animate', args=[[label], step_args])
+                             for label in labels])],
+    )
+    return fig
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m techradar history',
+                                     description="Record and compare radar versions.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    add = commands.add_parser('add', help="record a catalog as the latest version")
+    add.add_argument('store', help="history directory")
+    add.add_argument('label', help="version label, e.g. 2025Q1")
+    add.add_argument('source', nargs='?', default=os.environ.get('TECH_RADAR_SOURCE'),
+                     help="catalog file (default: $TECH_RADAR_SOURCE or the built-in catalog)")
+    listing = commands.add_parser('list', help="list recorded versions")
+    listing.add_argument('store', help="history directory")
+    diff = commands.add_parser('diff', help="print the technologies that changed as CSV")
+    diff.add_argument('store', help="history directory")
+    diff.add_argument('old', help="older version label")
+    diff.add_argument('new', help="newer version label")
+    args = parser.parse_args(argv)
+
+    try:
+        store = HistoryStore(args.store)
+        if args.command == 'add':
+            changed, removed = store.add_version(args.label, load_technology_data(args.source))
+            print(f"Recorded {args.label}: {changed} added or changed, {removed} removed",
+                  file=sys.stderr)
+        elif args.command == 'list':
+            for label, rows in store.version_sizes().items():
+                print(f"{label}\t{rows} technologies")
+        else:
+            moves = store.diff(args.old, args.new)
+            moves[moves['status'] != 'unchanged'].to_csv(sys.stdout, index=False)
+    except (KeyError, ValueError) as exc:
+        parser.exit(2, f"error: {exc}\n")
+    return 0
@@ -0,0 +1,147 @@
+"""Bubble positions and marker encodings for the radar.
+
+Everything here is vectorized and deterministic. A technology's jitter is
+derived from a stable hash of its name, so in the unpacked layout adding
+or removing one technology never moves the others, and new rows can be
+laid out on their own and appended.
+
+Packing (``pack=True``, as the app uses) trades some of that stability for
+bubbles that do not overlap. Bubbles that overlap nothing keep their hashed
+position, and other wedges and rings are untouched. But adding or removing
+a technology can move the overlapping bubbles of its own wedge and ring
+(all of its bubbles when that cell is dense enough to be packed in rows).
+It also rescales every bubble if the change moves the radar's marker scale
+across a step.
+"""
+
+import numpy as np
+import pandas as pd
+
+from techradar.config import (
+    BUSINESS_TO_SIZE,
+    CATEGORIES,
+    DESIRABILITY_TO_WIDTH,
+    RING_RADII,
+    TIME_TO_COLOR,
+)
+from techradar.packing import pack_layout
+
+# TRL levels per ring
+LEVELS_PER_RING = 3
+
+# Maximum jitter around the category spoke and the ring radius
+ANGLE_JITTER = 0.15
+RADIUS_JITTER = 0.05
+
+_UINT32_SCALE = float(2 ** 32)
+
+# Layout and encoding columns stored as float32 by ``compact_radar_frame``
+COMPACT_FLOAT_COLUMNS = ['radius', 'angle', 'x', 'y', 'size', 'line_width']
+
+
+def trl_to_radius(trl, ring_radii=RING_RADII):
+    """Map TRL values (scalar or array) to their ring radius; NaN for TRL 0."""
+    # Index = TRL; TRL 0 is not a valid level
+    radius_by_trl = np.concatenate([[np.nan], np.repeat(np.asarray(ring_radii, dtype=float),
+                                                        LEVELS_PER_RING)])
+    trl = np.asarray(trl, dtype=np.int64)
+    return radius_by_trl[np.clip(trl, 0, len(radius_by_trl) - 1)]
+
+
+def stable_uniforms(names):
+    """Return two arrays of uniform [0, 1) values derived from ``names``.
+
+    The values depend only on each name, not on its row position or on the
+    rest of the catalog, and are identical across processes and restarts.
+    """
+    hashes = pd.util.hash_pandas_object(pd.Series(names, dtype=object), index=False).to_numpy()
+    high = (hashes >> np.uint64(32)).astype(np.float64) / _UINT32_SCALE
+    low = (hashes & np.uint64(0xFFFFFFFF)).astype(np.float64) / _UINT32_SCALE
+    return high, low
+
+
+def category_angles(categories=CATEGORIES):
+    """Return ``{category: spoke angle}`` for a half-circle radar."""
+    return dict(zip(categories, np.linspace(0, np.pi, len(categories), endpoint=False)))
+
+
+def compute_layout(df, categories=CATEGORIES, ring_radii=RING_RADII):
+    """Return radius, angle and x/y coordinates for every row of ``df``."""
+    radius = trl_to_radius(df['trl'].to_numpy(), ring_radii)
+    angle = df['category'].map(category_angles(categories)).to_numpy(dtype=float)
+
+    u_angle, u_radius = stable_uniforms(df['name'].to_numpy())
+    angle_jitter = angle + (2 * u_angle - 1) * ANGLE_JITTER
+    radius_jitter = radius + (2 * u_radius - 1) * RADIUS_JITTER
+
+    # Convert polar coordinates to cartesian for plotting
+    return pd.DataFrame({
+        'radius': radius,
+        'angle': angle,
+        'x': radius_jitter * np.cos(angle_jitter),
+        'y': radius_jitter * np.sin(angle_jitter),
+    }, index=df.index)
+
+
+def compute_encodings(df, business_to_size=BUSINESS_TO_SIZE, time_to_color=TIME_TO_COLOR,
+                      desirability_to_width=DESIRABILITY_TO_WIDTH):
+    """Return marker size, color and edge width for every row of ``df``."""
+    return pd.DataFrame({
+        # Business potential -> marker size
+        'size': df['business'].map(business_to_size).to_numpy(dtype=float),
+        # Time to market -> color
+        'color': df['time'].map(time_to_color).to_numpy(dtype=object),
+        # Customer desirability -> marker edge width
+        'line_width': df['desirability'].map(desirability_to_width).to_numpy(dtype=float),
+    }, index=df.index)
+
+
+def prepare_radar_frame(df, categories=CATEGORIES, pack=False, encodings=None,
+                        ring_radii=RING_RADII):
+    """Return ``df`` with the encoding and layout columns the radar plots.
+
+    With ``pack=True`` overlapping bubbles are separated within each category
+    wedge and TRL ring (see ``techradar.packing``), and ``size`` holds the
+    marker diameter actually drawn, scaled alike across the radar.
+    ``encodings`` overrides the default marker maps (keyword arguments of
+    ``compute_encodings``) and ``ring_radii`` the radius of each TRL ring.
+    """
+    frame = pd.concat([df, compute_encodings(df, **(encodings or {})),
+                       compute_layout(df, categories, ring_radii)], axis=1)
+    if pack:
+        frame[['x', 'y', 'size']] = pack_layout(frame, categories, ring_radii)
+    return frame
+
+
+def _read_only(array):
+    array.flags.writeable = False
+    return array
+
+
+def compact_radar_frame(frame):
+    """Return a compact, read-only copy of a ``prepare_radar_frame`` result.
+
+    The layout columns become float32 and ``color`` a categorical, so every
+    enumerated column is stored as int8 codes. ``description`` is dropped;
+    load it on demand with ``data.load_descriptions``. Numeric arrays and
+    codes are marked read-only because the frame is shared by all sessions:
+    take rows with ``iloc`` or ``filters.select_rows`` instead of writing.
+    """
+    columns = {}
+    for name in frame.columns:
+        if name == 'description':
+            continue
+        column = frame[name]
+        if name == 'color':
+            column = column.astype('category')
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            codes = _read_only(column.cat.codes.to_numpy().copy())
+            columns[name] = pd.Categorical.from_codes(codes, dtype=column.dtype)
+        elif name in COMPACT_FLOAT_COLUMNS:
+            columns[name] = _read_only(column.to_numpy(dtype=np.float32))
+        elif column.dtype == object:
+            # Pandas' Cython helpers cannot take read-only object buffers
+            columns[name] = column.to_numpy().copy()
+        else:
+            columns[name] = _read_only(column.to_numpy().copy())
+    return pd.DataFrame(columns, index=frame.index, copy=False)
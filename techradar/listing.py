@@ -0,0 +1,55 @@
+"""Helpers for the paginated "Filtered Technologies" sidebar list.
+
+Searching the list is handled by ``techradar.search``.
+"""
+
+import html
+import math
+
+import numpy as np
+
+# Columns shown in the sidebar list, in display order
+LIST_COLUMNS = ['name', 'category', 'trl', 'business', 'time', 'desirability']
+
+PAGE_SIZES = [10, 25, 50, 100]
+
+
+def page_count(num_rows, page_size):
+    return max(1, math.ceil(num_rows / page_size))
+
+
+def paginate(df, page, page_size, positions=None):
+    """Return the rows on 1-based ``page`` and the page actually shown.
+
+    With ``positions``, the list is those rows of ``df`` in that order and
+    only the page's rows are taken from ``df``. Out-of-range pages are
+    clamped so a shrinking result set never shows an empty page.
+    """
+    num_rows = len(df) if positions is None else len(positions)
+    page = int(np.clip(page, 1, page_count(num_rows, page_size)))
+    start = (page - 1) * page_size
+    if positions is None:
+        return df.iloc[start:start + page_size], page
+    return df.iloc[positions[start:start + page_size]], page
+
+
+def render_cards(page_df):
+    """Render one page of technologies as a single HTML block.
+
+    Building the whole page as one string lets the sidebar send a single
+    markdown element per page instead of one element per technology.
+    """
+    if page_df.empty:
+        return ''
+    fields = {col: page_df[col].astype(str).map(html.escape) for col in LIST_COLUMNS}
+    cards = (
+        '<div style="margin-bottom: 10px; padding: 10px; border-radius: 5px; border: 1px solid #ddd;">'
+        + '<strong>' + fields['name'] + '</strong><br>'
+        + 'Category: ' + fields['category'] + '<br>'
+        + 'TRL: ' + fields['trl'] + '<br>'
+        + 'Business: ' + fields['business'] + '<br>'
+        + 'Time: ' + fields['time'] + '<br>'
+        + 'Desirability: ' + fields['desirability']
+        + '</div>'
+    )
+    return '\n'.join(cards)
@@ -0,0 +1,127 @@
+"""Level-of-detail aggregation for very large radars.
+
+Above a few thousand bubbles the radar is both slow to draw and unreadable.
+In level-of-detail (LOD) mode the technologies in each
+(category wedge, TRL ring, time to market) cell are replaced by a single
+aggregate bubble. It carries the cell's count and its mean business and
+desirability scores. There are at most
+``len(categories) * len(RINGS) * len(TIME_OPTIONS)`` aggregates, so the
+payload sent to the browser stays bounded however large the catalog is.
+"""
+
+import numpy as np
+import pandas as pd
+
+from techradar.config import (
+    CATEGORIES,
+    DESIRABILITY_TO_WIDTH,
+    RING_RADII,
+    RINGS,
+    TIME_OPTIONS,
+    TIME_TO_COLOR,
+)
+
+# Show aggregates instead of individual bubbles above this many technologies
+LOD_THRESHOLD = 2000
+
+# A TRL selection spanning at most this many levels counts as "narrow"
+NARROW_TRL_SPAN = 3
+
+# Marker diameter range for aggregate bubbles; area grows with the count
+AGGREGATE_MIN_SIZE = 15
+AGGREGATE_MAX_SIZE = 90
+
+# Score labels for the ordered LOW/MEDIUM/HIGH enums (score = position + 1)
+SCORE_LABELS = np.array(['LOW', 'MEDIUM', 'HIGH'])
+
+
+def should_aggregate(num_rows, selected_categories, trl_range, threshold=LOD_THRESHOLD):
+    """Return True when the radar should be drawn as aggregates.
+
+    Individual bubbles are shown for small selections and whenever the user
+    has zoomed in to a single category or a narrow TRL range.
+    """
+    if num_rows <= threshold:
+        return False
+    if len(selected_categories) == 1:
+        return False
+    return trl_range[1] - trl_range[0] + 1 > NARROW_TRL_SPAN
+
+
+def _enum_score(column):
+    """Return 1-based scores for an ordered categorical, NaN where missing."""
+    codes = column.cat.codes.to_numpy().astype(float)
+    codes[codes < 0] = np.nan
+    return codes + 1
+
+
+def aggregate_lod(df, categories=CATEGORIES, time_to_color=TIME_TO_COLOR,
+                  desirability_to_width=DESIRABILITY_TO_WIDTH, ring_radii=RING_RADII):
+    """Aggregate technologies per (category, TRL ring, time to market) cell.
+
+    ``df`` must carry the columns added by ``prepare_radar_frame`` with the
+    same ``ring_radii``. Returns one row per non-empty cell with its count,
+    mean scores, ring index and the position, size, color and edge width of
+    the aggregate bubble.
+    """
+    cells = pd.DataFrame({
+        'category': df['category'],
+        'angle': df['angle'],
+        'radius': df['radius'],
+        'time': df['time'],
+        'business_score': _enum_score(df['business']),
+        'desirability_score': _enum_score(df['desirability']),
+    })
+    agg = (cells.groupby(['category', 'radius', 'time'], observed=True, sort=True)
+           .agg(count=('angle', 'size'), angle=('angle', 'first'),
+                business_score=('business_score', 'mean'),
+                desirability_score=('desirability_score', 'mean'))
+           .reset_index())
+    agg = agg[agg['angle'].notna()].reset_index(drop=True)
+    # The compact catalog stores radii as float32, so match them to the nearest ring
+    radii = np.asarray(ring_radii, dtype=float)
+    agg['ring'] = np.abs(agg['radius'].to_numpy(dtype=float)[:, None] - radii).argmin(axis=1)
+
+    # Fan the time-to-market aggregates of a cell across its wedge and
+    # stagger them radially so they do not sit on top of each other
+    time_index = agg['time'].cat.codes.to_numpy()
+    half_wedge = np.pi / len(categories) / 2
+    wedge_lo = np.clip(agg['angle'].to_numpy() - half_wedge, 0, np.pi)
+    wedge_hi = np.clip(agg['angle'].to_numpy() + half_wedge, 0, np.pi)
+    fraction = np.linspace(0.2, 0.8, len(TIME_OPTIONS))[time_index]
+    angle = wedge_lo + (wedge_hi - wedge_lo) * fraction
+    radius = agg['radius'].to_numpy() + np.where(time_index % 2, 0.05, -0.05)
+    agg['x'] = radius * np.cos(angle)
+    agg['y'] = radius * np.sin(angle)
+
+    counts = agg['count'].to_numpy()
+    agg['size'] = AGGREGATE_MIN_SIZE + (AGGREGATE_MAX_SIZE - AGGREGATE_MIN_SIZE) * np.sqrt(
+        counts / counts.max() if len(counts) else counts)
+    agg['color'] = agg['time'].map(time_to_color).to_numpy(dtype=object)
+    widths = [desirability_to_width[label] for label in SCORE_LABELS]
+    agg['line_width'] = np.interp(agg['desirability_score'].fillna(1), [1, 2, 3], widths)
+    return agg
+
+
+def aggregate_hover_text(agg, rings=RINGS):
+    """Build hover labels for aggregate bubbles, column by column.
+
+    ``rings`` gives the ring names, as in ``RadarDefinition.rings``.
+    """
+    if agg.empty:
+        return np.array([], dtype=object)
+    ring_names = np.array([name for name, _, _ in rings], dtype=object)[agg['ring'].to_numpy()]
+    business = SCORE_LABELS[np.clip(np.rint(agg['business_score'].fillna(1)).astype(int) - 1, 0, 2)]
+    desirability = SCORE_LABELS[np.clip(np.rint(agg['desirability_score'].fillna(1)).astype(int) - 1, 0, 2)]
+    text = (
+        '<b>' + agg['count'].astype(str) + ' technologies</b><br>'
+        + 'Category: ' + agg['category'].astype(str) + '<br>'
+        + 'Ring: ' + ring_names + '<br>'
+        + 'Time to Market: ' + agg['time'].astype(str) + '<br>'
+        + 'Mean Business Potential: ' + agg['business_score'].round(2).astype(str)
+        + ' (' + business + ')<br>'
+        + 'Mean Customer Desirability: ' + agg['desirability_score'].round(2).astype(str)
+        + ' (' + desirability + ')<br>'
+        + '<i>Select a single category or a narrow TRL range to expand</i>'
+    )
+    return text.to_numpy(dtype=object)
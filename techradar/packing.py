@@ -0,0 +1,303 @@
+"""Collision-aware bubble placement.
+
+``compute_layout`` scatters each bubble around its category spoke and TRL
+ring with a small hashed jitter. That is cheap, but it cannot stop bubbles
+from overlapping, and dense sectors turn into a blob. ``pack_layout`` moves
+bubbles so they do not overlap within each (category wedge, TRL ring) cell.
+It takes each marker's pixel size into account.
+
+Small cells keep their hashed layout: bubbles that overlap no other bubble
+stay exactly where they were hashed, and only the others are moved, largest
+first, each walking outwards along a spiral from its hashed position until
+it finds a spot inside the cell and clear of the bubbles already placed.
+Placed bubbles are kept in a uniform spatial grid, so each collision test
+only looks at nearby bubbles. Dense cells, and small cells where the spiral
+fails, are packed in concentric rows instead. That costs one sort per cell,
+so the whole layout is O(n log n).
+
+If the bubbles of the densest cell cannot fit at their nominal size, every
+bubble on the radar is scaled down by the same factor, so one business
+potential is drawn at one size everywhere. The factor is rounded down to a
+fixed step, so a small change to the catalog rarely changes it.
+"""
+
+import numpy as np
+import pandas as pd
+
+from techradar.config import CATEGORIES, RING_RADII
+
+# Plot-area pixels per data unit: the 700 px figure minus its 80 px of
+# vertical margins spans a y range of 1.2
+PIXELS_PER_UNIT = (700 - 80) / 1.2
+
+# Fraction of a cell's area bubbles may cover before the radar is scaled down
+TARGET_DENSITY = 0.5
+
+# Ratio between consecutive marker scales; a scale is always a power of it
+SCALE_STEP = 2 ** -0.25
+
+# Unit Vogel spiral used to generate candidate positions around a seed
+_GOLDEN_ANGLE = np.pi * (3 - np.sqrt(5))
+_SPIRAL_STEPS = np.arange(512)
+SPIRAL = np.sqrt(_SPIRAL_STEPS)[:, None] * np.column_stack([
+    np.cos(_SPIRAL_STEPS * _GOLDEN_ANGLE), np.sin(_SPIRAL_STEPS * _GOLDEN_ANGLE)])
+
+# Candidates are tested in batches; most bubbles find a spot in the first one
+_BATCH_SIZES = (16, 112, 384)
+
+# Cells with at most this many bubbles try spiral placement before rows
+SPIRAL_LIMIT = 64
+
+
+class _Grid:
+    """Uniform grid of placed circles for fast neighbourhood queries."""
+
+    def __init__(self, cell_size, capacity):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.x = np.empty(capacity)
+        self.y = np.empty(capacity)
+        self.r = np.empty(capacity)
+        self.count = 0
+
+    def add(self, x, y, r):
+        key = (int(x // self.cell_size), int(y // self.cell_size))
+        self.cells.setdefault(key, []).append(self.count)
+        self.x[self.count], self.y[self.count], self.r[self.count] = x, y, r
+        self.count += 1
+
+    def query(self, x_min, y_min, x_max, y_max):
+        """Return positions and radii of circles whose cell overlaps the box."""
+        size = self.cell_size
+        found = []
+        for gx in range(int(x_min // size), int(x_max // size) + 1):
+            for gy in range(int(y_min // size), int(y_max // size) + 1):
+                found.extend(self.cells.get((gx, gy), ()))
+        if not found:
+            return None
+        return self.x[found], self.y[found], self.r[found]
+
+
+def _inside(cand, radius, bounds):
+    """Mask of candidate centres whose circle fits inside the polar cell."""
+    angle_lo, angle_hi, rho_lo, rho_hi = bounds
+    rho = np.hypot(cand[:, 0], cand[:, 1])
+    theta = np.arctan2(cand[:, 1], cand[:, 0])
+    margin = radius / np.maximum(rho, 1e-9)
+    return ((rho >= rho_lo + radius) & (rho <= rho_hi - radius)
+            & (theta >= angle_lo + margin) & (theta <= angle_hi - margin))
+
+
+def _place(seed, radius, bounds, grid, max_radius):
+    """Return the first clear position on the spiral around ``seed``, or None."""
+    step = 0.5 * radius
+    start = 0
+    for batch in _BATCH_SIZES:
+        cand = seed + step * SPIRAL[start:start + batch]
+        start += batch
+        cand = cand[_inside(cand, radius, bounds)]
+        if not len(cand):
+            continue
+
+        reach = radius + max_radius
+        neighbours = grid.query(cand[:, 0].min() - reach, cand[:, 1].min() - reach,
+                                cand[:, 0].max() + reach, cand[:, 1].max() + reach)
+        if neighbours is None:
+            return cand[0]
+        nx, ny, nr = neighbours
+        clearance = (np.hypot(cand[:, :1] - nx, cand[:, 1:] - ny) - (nr + radius)).min(axis=1)
+        clear = np.flatnonzero(clearance >= 0)
+        if len(clear):
+            return cand[clear[0]]
+    return None
+
+
+def _clear_at_seed(x, y, radius, bounds):
+    """Mask of bubbles inside the cell that overlap no other bubble where hashed."""
+    gap = np.hypot(x[:, None] - x, y[:, None] - y) - (radius[:, None] + radius)
+    np.fill_diagonal(gap, np.inf)
+    return _inside(np.column_stack([x, y]), radius, bounds) & (gap.min(axis=1) >= 0)
+
+
+def _spiral_pack(x, y, radius, bounds):
+    """Greedy spiral placement around the hashed seeds.
+
+    Bubbles clear at their seed keep it. Returns new coordinates, or None if
+    some bubble found no clear spot.
+    """
+    max_radius = radius.max()
+    grid = _Grid(cell_size=2 * max_radius, capacity=len(radius))
+    new_x, new_y = x.copy(), y.copy()
+    clear = _clear_at_seed(x, y, radius, bounds)
+    for i in np.flatnonzero(clear):
+        grid.add(x[i], y[i], radius[i])
+    for i in np.argsort(-radius, kind='stable'):
+        if clear[i]:
+            continue
+        position = _place(np.array([x[i], y[i]]), radius[i], bounds, grid, max_radius)
+        if position is None:
+            return None
+        new_x[i], new_y[i] = position
+        grid.add(new_x[i], new_y[i], radius[i])
+    return new_x, new_y
+
+
+def _shelf_pack(radius, seed_angle, bounds):
+    """Pack bubbles in concentric rows ("shelves") across the polar cell.
+
+    Bubbles are sorted by size, ties broken by their hashed angle, and laid
+    along arcs from the inner ring edge outwards. Neighbours on an arc are
+    spaced by their chord distance and rows by the sum of their largest
+    radii, so no two bubbles can overlap. Leftover space is spread evenly
+    between rows and between bubbles in a row. Returns polar coordinates,
+    or None if the bubbles do not fit.
+    """
+    angle_lo, angle_hi, rho_lo, rho_hi = bounds
+    order = np.lexsort((seed_angle, -radius))
+    rho_out = np.empty(len(radius))
+    theta_out = np.empty(len(radius))
+
+    rows = []
+    inner = rho_lo
+    i = 0
+    while i < len(order):
+        half_height = radius[order[i]]
+        centre = inner + half_height
+        if centre + half_height > rho_hi:
+            return None
+
+        members, angles = [], []
+        theta, previous = angle_lo, None
+        while i < len(order):
+            r = radius[order[i]]
+            if previous is None:
+                candidate = angle_lo + np.arcsin(min(1.0, r / centre))
+            else:
+                candidate = theta + 2 * np.arcsin(min(1.0, (previous + r) / (2 * centre)))
+            if candidate + np.arcsin(min(1.0, r / centre)) > angle_hi:
+                break
+            members.append(order[i])
+            angles.append(candidate)
+            theta, previous = candidate, r
+            i += 1
+        if not members:
+            return None
+
+        # Spread the row's unused arc evenly between its bubbles
+        end = theta + np.arcsin(min(1.0, previous / centre))
+        angles = np.array(angles) + (angle_hi - end) * np.arange(1, len(angles) + 1) / (len(angles) + 1)
+        rows.append((members, angles, centre))
+        inner = centre + half_height
+
+    # Spread the unused radial band evenly between rows
+    slack = rho_hi - inner
+    for k, (members, angles, centre) in enumerate(rows):
+        rho_out[members] = centre + slack * (k + 1) / (len(rows) + 1)
+        theta_out[members] = angles
+    return rho_out, theta_out
+
+
+def ring_bands(ring_radii=RING_RADII):
+    """Return the (inner, outer) radius of the band around each ring.
+
+    Bands meet halfway between neighbouring rings; the innermost and
+    outermost rings extend as far on their open side as on the other.
+    """
+    radii = np.asarray(ring_radii, dtype=float)
+    if len(radii) == 1:
+        return [(0.5 * radii[0], 1.5 * radii[0])]
+    half_gaps = np.diff(radii) / 2
+    below = np.concatenate([half_gaps[:1], half_gaps])
+    above = np.concatenate([half_gaps, half_gaps[-1:]])
+    return list(zip(radii - below, radii + above))
+
+
+def _cell_scale(radius, bounds, density):
+    """Return the largest scale at which a cell's bubbles are likely to fit."""
+    angle_lo, angle_hi, rho_lo, rho_hi = bounds
+    area = 0.5 * (angle_hi - angle_lo) * (rho_hi ** 2 - rho_lo ** 2)
+    scale = min(1.0, np.sqrt(density * area / np.sum(np.pi * radius ** 2)))
+    # A bubble can be no wider than the band between rings
+    return min(scale, (rho_hi - rho_lo) / 2 / radius.max())
+
+
+def _pack_cell(x, y, radius, bounds):
+    """Pack one cell of (already scaled) bubbles; return new coordinates or None.
+
+    Small cells keep their organic hashed layout and only nudge overlapping
+    bubbles apart; dense cells, or small ones where that fails, are packed
+    in rows.
+    """
+    if len(radius) <= SPIRAL_LIMIT:
+        packed = _spiral_pack(x, y, radius, bounds)
+        if packed is not None:
+            return packed
+
+    packed = _shelf_pack(radius, np.arctan2(y, x), bounds)
+    if packed is None:
+        return None
+    rho, theta = packed
+    return rho * np.cos(theta), rho * np.sin(theta)
+
+
+def pack_layout(df, categories=CATEGORIES, ring_radii=RING_RADII,
+                pixels_per_unit=PIXELS_PER_UNIT, density=TARGET_DENSITY):
+    """Return x, y and marker size columns with overlapping bubbles separated.
+
+    ``df`` must already carry the columns added by ``prepare_radar_frame``
+    with the same ``ring_radii``. The returned ``size`` is the marker diameter actually drawn: the
+    nominal size times one scale shared by the whole radar (see
+    ``marker_scale``). Rows whose category is not on the radar, or without a
+    marker size, keep their original position.
+    """
+    x = df['x'].to_numpy(dtype=float).copy()
+    y = df['y'].to_numpy(dtype=float).copy()
+    size = df['size'].to_numpy(dtype=float).copy()
+    radius = size / 2 / pixels_per_unit
+
+    half_wedge = np.pi / len(categories) / 2
+    bands = ring_bands(ring_radii)
+    cells = []
+    groups = pd.DataFrame({'angle': df['angle'].to_numpy(), 'ring': df['radius'].to_numpy()})
+    for (angle, ring), rows in groups.groupby(['angle', 'ring'], sort=False).indices.items():
+        if np.isnan(angle) or np.isnan(ring):
+            continue
+        # Bubbles without a size (missing business potential) are not drawn
+        rows = rows[np.isfinite(radius[rows])]
+        if len(rows):
+            band = bands[int(np.argmin(np.abs(np.asarray(ring_radii) - ring)))]
+            cells.append((rows, (max(0.0, angle - half_wedge), min(np.pi, angle + half_wedge),
+                                 *band)))
+    if not cells:
+        return pd.DataFrame({'x': x, 'y': y, 'size': size}, index=df.index)
+
+    # One scale for every cell, rounded down to a power of SCALE_STEP and
+    # lowered a step at a time until every cell packs
+    scale = min(_cell_scale(radius[rows], bounds, density) for rows, bounds in cells)
+    scale = SCALE_STEP ** np.ceil(np.log(scale) / np.log(SCALE_STEP) - 1e-9)
+    while True:
+        packed = []
+        for rows, bounds in cells:
+            cell = _pack_cell(x[rows], y[rows], radius[rows] * scale, bounds)
+            if cell is None:
+                break
+            packed.append(cell)
+        else:
+            break
+        scale *= SCALE_STEP
+
+    for (rows, _), (cell_x, cell_y) in zip(cells, packed):
+        x[rows], y[rows] = cell_x, cell_y
+    return pd.DataFrame({'x': x, 'y': y, 'size': size * scale}, index=df.index)
+
+
+def marker_scale(df, business_to_size):
+    """Return the scale ``pack_layout`` applied to the markers of ``df``.
+
+    1.0 for an unpacked frame, or one without any sized marker.
+    """
+    nominal = df['business'].map(dict(business_to_size)).to_numpy(dtype=float)
+    sized = np.flatnonzero(np.isfinite(nominal) & np.isfinite(df['size'].to_numpy(dtype=float)))
+    if not len(sized):
+        return 1.0
+    return float(df['size'].iloc[sized[0]]) / nominal[sized[0]]
@@ -0,0 +1,171 @@
+"""Per-rerun timing of the radar's pipeline stages.
+
+Every script run (and every rerun of the radar fragment) produces one
+record: how long each stage took, plus the size of what was drawn. The
+stages are:
+
+- ``catalog``: fetching the catalog and its indexes from the shared engine,
+  which includes ``read`` and ``layout`` when they were not cached yet
+- ``read``: loading the catalog file (cache misses only)
+- ``layout``: encodings, jitter, bubble packing and compaction (misses only)
+- ``filter``: the filter index lookup
+- ``figure``: building the Plotly figure (only when it changed)
+- ``chart``: ``st.plotly_chart``, i.e. serializing and sending the figure
+- ``list``: searching and drawing the sidebar list
+
+Records go into the process-wide ``PERF_LOG`` ring buffer, and are also
+appended as JSON lines to the file named by ``TECH_RADAR_PERF_LOG`` when it
+is set. ``PerfLog.summary`` aggregates p50/p95 latencies per stage; the app
+shows them in a debug panel (``?debug=1`` or ``TECH_RADAR_DEBUG=1``) and
+``python -m techradar perf summary <log>`` prints them for a log file.
+
+The hooks cost two ``perf_counter`` calls per stage and record nothing
+outside a run started with ``start_run``.
+"""
+
+import argparse
+import collections
+import contextlib
+import json
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+STAGES = ('catalog', 'read', 'layout', 'filter', 'figure', 'chart', 'list')
+
+# Records kept in memory, across all sessions
+DEFAULT_CAPACITY = 1000
+
+_current = threading.local()
+
+
+class PerfLog:
+    """Thread-safe ring buffer of run records, optionally mirrored to JSONL."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, path=None):
+        self._records = collections.deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self.path = path
+
+    def append(self, record):
+        with self._lock:
+            self._records.append(record)
+            if self.path:
+                with open(self.path, 'a') as handle:
+                    handle.write(json.dumps(record) + '\n')
+
+    def records(self):
+        with self._lock:
+            return list(self._records)
+
+    def summary(self, records=None):
+        """Return count, p50 and p95 milliseconds per stage as a DataFrame."""
+        return summarize(self.records() if records is None else records)
+
+
+def summarize(records):
+    """Return count, p50 and p95 milliseconds per stage of ``records``."""
+    durations = collections.defaultdict(list)
+    for record in records:
+        for name, ms in record['stages'].items():
+            durations[name].append(ms)
+        durations['total'].append(record['total_ms'])
+    order = [name for name in STAGES + ('total',) if name in durations]
+    rows = [(len(durations[name]), *np.percentile(durations[name], [50, 95]))
+            for name in order]
+    return pd.DataFrame(rows, index=pd.Index(order, name='stage'),
+                        columns=['count', 'p50_ms', 'p95_ms'])
+
+
+PERF_LOG = PerfLog(path=os.environ.get('TECH_RADAR_PERF_LOG') or None)
+
+
+def start_run(kind='run', **fields):
+    """Start timing a script run in this thread, replacing any unfinished one."""
+    _current.record = dict(time=time.time(), kind=kind, stages={}, **fields)
+    _current.started = time.perf_counter()
+
+
+def active():
+    """Return True while a run is being timed in this thread."""
+    return getattr(_current, 'record', None) is not None
+
+
+def note(**fields):
+    """Add fields (trace count, payload bytes, ...) to the current run."""
+    if active():
+        _current.record.update(fields)
+
+
+@contextlib.contextmanager
+def stage(name):
+    """Time the enclosed block as stage ``name`` of the current run.
+
+    Repeated stages within one run add up.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if active():
+            stages = _current.record['stages']
+            stages[name] = stages.get(name, 0.0) + (time.perf_counter() - start) * 1e3
+
+
+def finish_run(log=PERF_LOG):
+    """Finish the current run, append its record to ``log`` and return it."""
+    if not active():
+        return None
+    record = _current.record
+    record['total_ms'] = (time.perf_counter() - _current.started) * 1e3
+    _current.record = None
+    log.append(record)
+    return record
+
+
+@contextlib.contextmanager
+def run(kind='run', **fields):
+    """Time the enclosed block as a run, unless one is already being timed.
+
+    Used by fragments, which rerun on their own without the script around
+    them; inside a full run the block just contributes its stages.
+    """
+    if active():
+        yield
+        return
+    start_run(kind, **fields)
+    try:
+        yield
+    finally:
+        finish_run()
+
+
+def load_records(path):
+    """Read the records of a JSONL log written by ``PerfLog``."""
+    with open(path) as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m techradar perf',
+                                     description="Summarize a rerun timing log.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    summary = commands.add_parser('summary', help="print p50/p95 milliseconds per stage")
+    summary.add_argument('log', help="JSONL file written via TECH_RADAR_PERF_LOG")
+    summary.add_argument('--kind', choices=['run', 'fragment'],
+                         help="only runs of this kind (default: all)")
+    args = parser.parse_args(argv)
+
+    try:
+        records = load_records(args.log)
+    except (OSError, ValueError) as exc:
+        parser.exit(2, f"error: {exc}\n")
+    if args.kind:
+        records = [record for record in records if record['kind'] == args.kind]
+    if not records:
+        parser.exit(1, "no records\n")
+    print(summarize(records).round(2).to_string())
+    return 0
@@ -0,0 +1,199 @@
+"""Radar definitions and the registry of radars served by one app.
+
+A ``RadarDefinition`` describes everything that differs between radars: its
+title, categories, ring labels, radii and colors, marker encodings, legends and
+data source. ``DEFAULT_RADAR`` is the healthcare radar built from
+``techradar.config``.
+
+Further radars are listed in a JSON file named by ``TECH_RADAR_REGISTRY``::
+
+    [
+        {"key": "cardio", "title": "Cardiology Radar",
+         "categories": ["Imaging", "Wearables", "Diagnostics"],
+         "source": "data/cardio.parquet"},
+        {"key": "oncology", "title": "Oncology Radar",
+         "source": "data/oncology.csv",
+         "time_to_color": {"NOW": "#1b9e77", "1": "#d95f02"}}
+    ]
+
+Only ``key`` is required. Omitted fields, and omitted entries in the
+encoding maps, fall back to the default radar's. A legend that is not
+given follows the radar's encoding map, so overriding ``time_to_color``
+also recolors the time-to-market legend. Definitions are hashable,
+so they can key the shared cache directly.
+"""
+
+import collections
+import json
+import os
+
+from techradar.config import (
+    BUSINESS_LEGEND,
+    BUSINESS_TO_SIZE,
+    CATEGORIES,
+    DESIRABILITY_LEGEND,
+    DESIRABILITY_TO_WIDTH,
+    RINGS,
+    TIME_LEGEND,
+    TIME_TO_COLOR,
+)
+
+_FIELDS = ['key', 'title', 'subtitle', 'categories', 'rings', 'business_to_size',
+           'time_to_color', 'desirability_to_width', 'time_legend', 'business_legend',
+           'desirability_legend', 'source', 'table']
+
+# Encoding maps are stored as tuples of (value, encoding) pairs
+_MAPPING_FIELDS = ('business_to_size', 'time_to_color', 'desirability_to_width')
+
+# Legend fields and the encoding map each one shows
+_LEGEND_FIELDS = {
+    'time_legend': 'time_to_color',
+    'business_legend': 'business_to_size',
+    'desirability_legend': 'desirability_to_width',
+}
+
+
+class RadarDefinition(collections.namedtuple('RadarDefinition', _FIELDS)):
+    """Immutable description of one radar."""
+
+    __slots__ = ()
+
+    @property
+    def encodings(self):
+        """Keyword arguments for ``layout.compute_encodings``."""
+        return {field: dict(getattr(self, field)) for field in _MAPPING_FIELDS}
+
+    @property
+    def ring_radii(self):
+        """Radius of each TRL ring, innermost first."""
+        return tuple(radius for _, radius, _ in self.rings)
+
+    @property
+    def figure_config(self):
+        """Positional arguments for ``figure.base_figure_spec``."""
+        return (self.categories, self.rings, self.time_legend, self.business_legend,
+                self.desirability_legend, self.title)
+
+
+DEFAULT_RADAR = RadarDefinition(
+    key='healthcare',
+    title='Healthcare Technology Radar',
+    subtitle='Interactive visualization of innovative healthcare diagnostic technologies',
+    categories=tuple(CATEGORIES),
+    rings=RINGS,
+    business_to_size=tuple(BUSINESS_TO_SIZE.items()),
+    time_to_color=tuple(TIME_TO_COLOR.items()),
+    desirability_to_width=tuple(DESIRABILITY_TO_WIDTH.items()),
+    time_legend=TIME_LEGEND,
+    business_legend=BUSINESS_LEGEND,
+    desirability_legend=DESIRABILITY_LEGEND,
+    source=None,
+    table='technologies',
+)
+
+
+def _as_tuple(value):
+    """Convert nested JSON lists to nested tuples."""
+    if isinstance(value, list):
+        return tuple(_as_tuple(item) for item in value)
+    return value
+
+
+def _legend_label(value):
+    """Return the legend label of an encoded value ('3' -> '3 Years')."""
+    if value.isdigit():
+        return f"{value} Year" + ('' if value == '1' else 's')
+    return value
+
+
+def _legend_from_mapping(legend, mapping):
+    """Return ``legend`` with each entry's encoding taken from ``mapping``."""
+    encodings = {_legend_label(value): encoding for value, encoding in mapping}
+    return tuple((label, encodings.get(label, encoding)) for label, encoding in legend)
+
+
+def definition_from_dict(spec, default=DEFAULT_RADAR):
+    """Build a ``RadarDefinition`` from a JSON object, filling in defaults."""
+    if 'key' not in spec:
+        raise ValueError(f"Radar definition is missing a key: {spec!r}")
+    unknown = set(spec) - set(_FIELDS)
+    if unknown:
+        raise ValueError(f"Radar {spec['key']!r} has unknown fields: {', '.join(sorted(unknown))}")
+
+    fields = default._asdict()
+    for field, value in spec.items():
+        if field in _MAPPING_FIELDS:
+            value = tuple({**dict(fields[field]), **value}.items())
+        fields[field] = _as_tuple(value)
+    for legend, mapping in _LEGEND_FIELDS.items():
+        if mapping in spec and legend not in spec:
+            fields[legend] = _legend_from_mapping(fields[legend], fields[mapping])
+    fields['key'] = str(fields['key'])
+    if 'title' not in spec:
+        fields['title'] = f"{fields['key'].title()} Technology Radar"
+    if 'subtitle' not in spec:
+        fields['subtitle'] = default.subtitle if fields['title'] == default.title else ''
+    if len(fields['rings']) != len(RINGS):
+        raise ValueError(f"Radar {fields['key']!r} must define {len(RINGS)} rings "
+                         "(research, development, deployment)")
+    radii = [ring[1] for ring in fields['rings']]
+    if radii != sorted(set(radii)) or radii[0] <= 0 or radii[-1] > 1:
+        raise ValueError(f"Radar {fields['key']!r} ring radii must increase from the "
+                         f"centre and stay within 1: {radii}")
+    return RadarDefinition(**fields)
+
+
+class RadarRegistry:
+    """Ordered collection of radar definitions, looked up by key."""
+
+    def __init__(self, definitions=(DEFAULT_RADAR,)):
+        self._radars = {}
+        for definition in definitions:
+            self.register(definition)
+
+    def register(self, definition):
+        if definition.key in self._radars:
+            raise ValueError(f"Duplicate radar key {definition.key!r}")
+        self._radars[definition.key] = definition
+
+    def __getitem__(self, key):
+        return self._radars[key]
+
+    def __contains__(self, key):
+        return key in self._radars
+
+    def __iter__(self):
+        return iter(self._radars.values())
+
+    def __len__(self):
+        return len(self._radars)
+
+    @property
+    def keys(self):
+        return list(self._radars)
+
+    @property
+    def default(self):
+        return next(iter(self._radars.values()))
+
+
+def load_registry(path=None):
+    """Return the registry from the JSON file at ``path``.
+
+    With no ``path`` the registry holds only ``DEFAULT_RADAR``. Relative
+    ``source`` paths are resolved against the registry file's directory.
+    """
+    if path is None:
+        return RadarRegistry()
+    with open(path) as handle:
+        specs = json.load(handle)
+    base = os.path.dirname(os.path.abspath(path))
+    definitions = []
+    for spec in specs:
+        definition = definition_from_dict(spec)
+        if definition.source is not None and not os.path.isabs(definition.source):
+            definition = definition._replace(source=os.path.join(base, definition.source))
+        definitions.append(definition)
+    if not definitions:
+        raise ValueError(f"Radar registry {path} defines no radars")
+    return RadarRegistry(definitions)
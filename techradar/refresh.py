@@ -0,0 +1,131 @@
+"""Rebuild changed catalogs in the background and swap them in atomically.
+
+Without a refresher the engine fingerprints a radar's source on every
+request, and the first request after the file changes rebuilds the catalog,
+layout and indexes itself while every other session waits for it. With one,
+requests use the current fingerprint of each source, which only changes
+when a new version is ready. A daemon thread polls the watched sources every
+``interval`` seconds. When one changed, it builds the new version off the
+request path (warming the shared cache) and then swaps the fingerprint under
+a lock. A script run keeps the catalog it was handed, so sessions see the
+new one on their next rerun.
+
+A source is only rebuilt once its fingerprint is the same on two polls in a
+row, so a file that is still being written is not read half way. If a build
+fails, the old version stays current and the error is logged. That
+fingerprint is not retried until the file changes again.
+
+The interval defaults to 10 seconds and can be changed with
+``TECH_RADAR_REFRESH_SECONDS``; 0 turns the refresher off.
+"""
+
+import collections
+import logging
+import os
+import threading
+import time
+
+from techradar.data import source_fingerprint
+
+DEFAULT_INTERVAL = float(os.environ.get('TECH_RADAR_REFRESH_SECONDS', 10))
+
+logger = logging.getLogger(__name__)
+
+# The fingerprint of a watched source that requests currently use
+Version = collections.namedtuple('Version', ['fingerprint', 'loaded'])
+
+
+class Refresher:
+    """Track the current version of each watched source, rebuilt in a background thread."""
+
+    def __init__(self, interval=DEFAULT_INTERVAL, fingerprint=source_fingerprint, on_swap=None):
+        self.interval = interval
+        self._fingerprint = fingerprint
+        self._on_swap = on_swap
+        self._watched = {}
+        self._versions = {}
+        # Fingerprints seen on the last poll but not built yet, and ones that failed
+        self._pending = {}
+        self._failed = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def enabled(self):
+        return self.interval > 0
+
+    def get(self, key, source, build):
+        """Return ``build(fingerprint)`` for the current version of ``key``.
+
+        ``build`` must be cheap once a fingerprint has been built (e.g. a
+        memoized function). The first call for a key fingerprints ``source``
+        and starts watching it.
+        """
+        version = self.version(key)
+        if version is None:
+            with self._lock:
+                # Another session may have got here first; keep a single version
+                version = self._versions.setdefault(
+                    key, Version(self._fingerprint(source), time.time()))
+                self._watched[key] = (source, build)
+            self._start()
+        return build(version.fingerprint)
+
+    def version(self, key):
+        """Return the current ``Version`` of ``key``, or None if not loaded yet."""
+        with self._lock:
+            return self._versions.get(key)
+
+    def _start(self):
+        with self._lock:
+            if self._thread is not None or not self.enabled:
+                return
+            self._thread = threading.Thread(target=self._run, name='techradar-refresher',
+                                            daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the thread after its current poll."""
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def poll(self):
+        """Check every watched source once; return the keys that were swapped."""
+        with self._lock:
+            watched = list(self._watched.items())
+        return [key for key, (source, build) in watched if self._refresh(key, source, build)]
+
+    def _refresh(self, key, source, build):
+        try:
+            fingerprint = self._fingerprint(source)
+        except OSError:
+            # Missing while the pipeline replaces it; look again next time
+            return False
+        current = self.version(key)
+        if fingerprint == current.fingerprint or fingerprint == self._failed.get(key):
+            self._pending.pop(key, None)
+            return False
+        if self._pending.get(key) != fingerprint:
+            # Wait for one more poll with the same fingerprint
+            self._pending[key] = fingerprint
+            return False
+
+        del self._pending[key]
+        start = time.perf_counter()
+        try:
+            build(fingerprint)
+        except Exception:
+            logger.exception("Rebuilding %s failed; keeping the loaded version", source)
+            self._failed[key] = fingerprint
+            return False
+        self._failed.pop(key, None)
+        with self._lock:
+            self._versions[key] = Version(fingerprint, time.time())
+        logger.info("Reloaded %s in %.1f s", source, time.perf_counter() - start)
+        if self._on_swap is not None:
+            self._on_swap(key, current.fingerprint)
+        return True
@@ -0,0 +1,197 @@
+"""Weighted scores, per-category shortlists and Pareto fronts.
+
+``ScoringIndex`` turns the TRL and the three ratings of a fixed catalog
+into numeric arrays once. Every criterion is scaled to [0, 1] with higher
+meaning better: a higher TRL, a higher business potential, a shorter time to
+market and a higher customer desirability. Missing ratings count as the
+worst value.
+
+A weighted score is one matrix-vector product and is memoized per weight
+vector, up to a byte budget shared with the memoized shortlists.
+Per-category top-k uses ``argpartition``, so only the k winners of each
+category are sorted. Pareto fronts are found on the distinct rating
+combinations rather than on rows: there are at most ``9 * 3 * 6 * 3 = 486``
+per category however large the catalog is, and they are culled in one sorted
+pass.
+"""
+
+import numpy as np
+
+from techradar.cache import MemoryLRU
+
+CRITERIA = ('trl', 'business', 'time', 'desirability')
+
+# Labels for the sidebar and the shortlist table
+CRITERIA_LABELS = {
+    'trl': 'TRL',
+    'business': 'Business Potential',
+    'time': 'Time to Market',
+    'desirability': 'Customer Desirability',
+}
+
+# Bytes of scores and shortlists memoized per index; one score vector at 1M
+# rows is 4 MB
+DEFAULT_CACHE_BYTES = 32 * 2 ** 20
+
+
+def _levels(df):
+    """Return an (n, 4) int8 array of criterion levels, higher is better, -1 if missing."""
+    trl = df['trl'].to_numpy().astype(np.int8) - 1
+    business = df['business'].cat.codes.to_numpy()
+    time_codes = df['time'].cat.codes.to_numpy()
+    time = np.where(time_codes >= 0, len(df['time'].cat.categories) - 1 - time_codes, -1)
+    desirability = df['desirability'].cat.codes.to_numpy()
+    return np.column_stack([trl, business, time, desirability]).astype(np.int8)
+
+
+def pareto_mask(points):
+    """Return a mask of the distinct ``points`` that no other point dominates.
+
+    Every column is maximized. After a descending lexicographic sort a point
+    can only be dominated by one sorted before it, and only the front found
+    so far needs checking, so there is no all-pairs comparison.
+    """
+    keep = np.zeros(len(points), dtype=bool)
+    front = np.empty((0, points.shape[1]), dtype=points.dtype)
+    for i in np.lexsort(points.T[::-1])[::-1]:
+        point = points[i]
+        if not np.any(np.all(front >= point, axis=1)):
+            front = np.vstack([front, point])
+            keep[i] = True
+    return keep
+
+
+class ScoringIndex:
+    """Score and rank the technologies of a fixed catalog DataFrame."""
+
+    def __init__(self, df, cache_bytes=DEFAULT_CACHE_BYTES):
+        self.num_rows = len(df)
+        levels = _levels(df)
+        self._levels = levels
+        self._maxima = np.array([8, len(df['business'].cat.categories) - 1,
+                                 len(df['time'].cat.categories) - 1,
+                                 len(df['desirability'].cat.categories) - 1], dtype=np.float32)
+        self._criteria = np.clip(levels, 0, None).astype(np.float32) / self._maxima
+        # Radix per criterion used to pack a row's category and levels into
+        # one integer: every level from -1 (missing) to the highest present
+        self._radices = np.max(levels, axis=0, initial=-1).astype(np.int64) + 2
+
+        column = df['category']
+        if hasattr(column, 'cat'):
+            self._categories, self.categories = column.cat.codes.to_numpy(), column.cat.categories
+        else:
+            self._categories, self.categories = column.factorize()
+
+        # Scores are memoized per weight vector; shortlists per weight vector,
+        # k and filter result (the FilterIndex memo hands out shared arrays)
+        self._cached = MemoryLRU(cache_bytes)
+
+    @staticmethod
+    def _weights(weights):
+        if isinstance(weights, dict):
+            weights = [weights.get(name, 0) for name in CRITERIA]
+        return tuple(float(weight) for weight in weights)
+
+    def _compute_scores(self, weights):
+        weights = np.array(weights, dtype=np.float32)
+        total = weights.sum()
+        scores = self._criteria @ (weights / total) if total > 0 else np.zeros(
+            self.num_rows, dtype=np.float32)
+        scores.flags.writeable = False  # Shared between sessions via the memo
+        return scores
+
+    def scores(self, weights):
+        """Return the weighted mean of the criteria for every row, in [0, 1].
+
+        ``weights`` is a sequence in ``CRITERIA`` order or a dict by name.
+        """
+        weights = self._weights(weights)
+        return self._cached.get_or_create(('scores', weights),
+                                          lambda: self._compute_scores(weights))
+
+    def _memo(self, key, positions, compute):
+        # The entry keeps ``positions`` alive, so no other array can take its id
+        def build():
+            result = compute()
+            result.flags.writeable = False
+            return positions, result
+        return self._cached.get_or_create(key + (id(positions),), build)[1]
+
+    def cache_info(self):
+        return self._cached.cache_info()
+
+    def _rows(self, positions):
+        """Return the candidate rows, leaving out rows without a category."""
+        rows = np.arange(self.num_rows) if positions is None else np.asarray(positions)
+        return rows[self._categories[rows] >= 0]
+
+    def top_k(self, weights, k, positions=None):
+        """Return the positions of the ``k`` best-scoring rows of each category.
+
+        ``positions`` restricts the ranking to those rows (e.g. the output of
+        ``FilterIndex.positions``). Rows are grouped by category and ordered
+        best first within each; ties keep catalog order.
+        """
+        weights = self._weights(weights)
+        key = ('top_k', weights, int(k))
+        return self._memo(key, positions, lambda: self._top_k(weights, int(k), positions))
+
+    def _top_k(self, weights, k, positions):
+        rows = self._rows(positions)
+        scores = self.scores(weights)
+        codes = self._categories[rows]
+        # Rows grouped by category with one stable counting sort
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(len(self.categories) + 1))
+        picked = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            group = rows[order[start:stop]]
+            if len(group) > k:
+                group = self._best(group, scores[group], k)
+            # Best first; ties in catalog order
+            picked.append(group[np.lexsort((group, -scores[group]))])
+        return np.concatenate(picked) if picked else rows[:0]
+
+    @staticmethod
+    def _best(group, scores, k):
+        """Return the ``k`` best rows of ``group``; ties at the cutoff in catalog order."""
+        if k == 0:
+            return group[:0]
+        cutoff = -np.partition(-scores, k - 1)[k - 1]
+        above = group[scores > cutoff]
+        tied = np.sort(group[scores == cutoff])[:k - len(above)]
+        return np.concatenate([above, tied])
+
+    def pareto_front(self, positions=None, criteria=CRITERIA):
+        """Return the positions of each category's Pareto-optimal rows.
+
+        A row is on the front when no row of the same category is at least as
+        good on every one of ``criteria`` and better on one. Rows are grouped
+        by category, in catalog order within each.
+        """
+        dims = tuple(CRITERIA.index(name) for name in criteria)
+        key = ('pareto', dims)
+        return self._memo(key, positions, lambda: self._pareto_front(dims, positions))
+
+    def _pareto_front(self, dims, positions):
+        rows = self._rows(positions)
+        if not dims or not len(rows):
+            return rows[:0]
+        # Pack (category, levels) into one integer; -1 (missing) becomes 0
+        keys = self._categories[rows].astype(np.int64)
+        for dim in dims:
+            keys = keys * self._radices[dim] + self._levels[rows, dim] + 1
+        combos = np.flatnonzero(np.bincount(keys))
+
+        on_front = np.zeros(combos[-1] + 1, dtype=bool)
+        combo_levels = np.empty((len(combos), len(dims)), dtype=np.int16)
+        remainder = combos
+        for i in range(len(dims) - 1, -1, -1):
+            combo_levels[:, i] = remainder % self._radices[dims[i]]
+            remainder = remainder // self._radices[dims[i]]
+        for category in np.unique(remainder):
+            members = np.flatnonzero(remainder == category)
+            on_front[combos[members[pareto_mask(combo_levels[members])]]] = True
+
+        front = rows[on_front[keys]]
+        return front[np.argsort(self._categories[front], kind='stable')]
@@ -0,0 +1,158 @@
+"""Full-text search over technology names and descriptions.
+
+``SearchIndex`` tokenizes the ``name`` and ``description`` columns once per
+loaded catalog into an inverted index held in flat arrays: a sorted
+vocabulary and, for each term, a contiguous run of (row position, score)
+postings. Because the vocabulary is sorted, every term sharing a prefix is
+one contiguous slice, so a prefix query costs two binary searches plus a
+``bincount`` over its postings, with no per-row Python work.
+
+Query terms are matched as prefixes ("lat flo" finds "lateral flow") and
+all terms must match. Results are ranked by a TF-IDF style score in which a
+hit in the name counts more than one in the description. Facet filters are
+applied by intersecting with the positions from ``FilterIndex``.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+TOKEN_PATTERN = r'[^\W_]+'
+
+# A term occurrence in the name counts this many description occurrences
+NAME_WEIGHT = 3.0
+
+# Shorter query terms only match whole tokens, not every token they start
+MIN_PREFIX = 2
+
+# Prefixes up to this length that match more postings than there are rows
+# get their postings merged per row at build time
+MERGED_PREFIX_MAX = 4
+
+_TOKEN_RE = re.compile(TOKEN_PATTERN)
+
+# Sorts after any character, closing a prefix range
+_PREFIX_END = '\U0010ffff'
+
+
+def tokenize(text):
+    """Split ``text`` into lowercase alphanumeric tokens."""
+    return _TOKEN_RE.findall(str(text).lower())
+
+
+def _postings(texts, weight):
+    """Return (row position, token, weight) arrays for every token occurrence."""
+    tokens = pd.Series(texts, dtype=object).fillna('').str.lower().str.findall(TOKEN_PATTERN)
+    tokens = tokens.explode().dropna()
+    rows = tokens.index.to_numpy()
+    return rows, tokens.to_numpy(dtype=object), np.full(len(rows), weight)
+
+
+class SearchIndex:
+    """Inverted index over the ``name`` and ``description`` of a fixed catalog."""
+
+    def __init__(self, df, descriptions=None):
+        # ``descriptions`` (one per row) replaces a missing description column
+        self.num_rows = len(df)
+        parts = [_postings(df['name'].to_numpy(), NAME_WEIGHT)]
+        if descriptions is None and 'description' in df.columns:
+            descriptions = df['description'].to_numpy()
+        if descriptions is not None:
+            parts.append(_postings(np.asarray(descriptions, dtype=object), 1.0))
+        rows = np.concatenate([part[0] for part in parts])
+        tokens = np.concatenate([part[1] for part in parts])
+        weights = np.concatenate([part[2] for part in parts])
+
+        # Number tokens in sorted order and merge repeats within a row
+        codes, vocab = pd.factorize(tokens)
+        order = np.argsort(vocab)
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        keys, inverse = np.unique(rank[codes] * max(self.num_rows, 1) + rows, return_inverse=True)
+        term_weight = np.bincount(inverse, weights=weights)
+        term = keys // max(self.num_rows, 1)
+
+        self.vocab = np.array(vocab[order], dtype=str)
+        self.offsets = np.searchsorted(term, np.arange(len(self.vocab) + 1))
+        self.rows = (keys % max(self.num_rows, 1)).astype(np.int32)
+
+        # Precompute each posting's contribution to the ranking score
+        doc_freq = np.diff(self.offsets)
+        idf = np.log1p(self.num_rows / np.maximum(doc_freq, 1))
+        self.scores = (idf[term] * np.log1p(term_weight)).astype(np.float32)
+
+        # Short prefixes such as "co" can span a large share of all postings;
+        # merge those once so a keystroke never sums more than one per row
+        self._merged = {}
+        for length in range(MIN_PREFIX, MERGED_PREFIX_MAX + 1):
+            prefixes, starts = np.unique(self.vocab.astype(f'<U{length}'), return_index=True)
+            bounds = self.offsets[np.append(starts, len(self.vocab))]
+            for i in np.flatnonzero(np.diff(bounds) > self.num_rows):
+                if len(prefixes[i]) < length:
+                    continue
+                start, stop = bounds[i], bounds[i + 1]
+                score = np.bincount(self.rows[start:stop], weights=self.scores[start:stop],
+                                    minlength=self.num_rows)
+                rows = np.flatnonzero(score)
+                self._merged[str(prefixes[i])] = (rows.astype(np.int32), score[rows].astype(np.float32))
+
+    def _term_postings(self, term):
+        """Return (rows, scores) of the postings matching ``term`` as a prefix."""
+        if term in self._merged:
+            return self._merged[term]
+        start, stop = self._term_range(term)
+        return self.rows[start:stop], self.scores[start:stop]
+
+    def _term_range(self, term):
+        """Return the slice of postings for ``term`` used as a prefix."""
+        if len(term) < MIN_PREFIX:
+            lo = np.searchsorted(self.vocab, term, side='left')
+            hi = lo + int(lo < len(self.vocab) and self.vocab[lo] == term)
+        else:
+            lo = np.searchsorted(self.vocab, term, side='left')
+            hi = np.searchsorted(self.vocab, term + _PREFIX_END, side='left')
+        return self.offsets[lo], self.offsets[hi]
+
+    def search(self, query, positions=None, limit=None):
+        """Return row positions matching ``query``, best match first.
+
+        ``positions`` restricts the result to those rows (e.g. the output of
+        ``FilterIndex.positions``); rows keep that order when the query has
+        no terms. ``limit`` returns only the top matches.
+        """
+        terms = tokenize(query)
+        if not terms:
+            result = np.arange(self.num_rows) if positions is None else np.asarray(positions)
+            return result if limit is None else result[:limit]
+
+        total = np.zeros(self.num_rows)
+        matched = None
+        for term in dict.fromkeys(terms):
+            rows, scores = self._term_postings(term)
+            score = np.bincount(rows, weights=scores, minlength=self.num_rows)
+            hit = score > 0
+            matched = hit if matched is None else matched & hit
+            total += score
+
+        if positions is not None:
+            candidates = np.asarray(positions)
+            candidates = candidates[matched[candidates]]
+        else:
+            candidates = np.flatnonzero(matched)
+
+        scores = total[candidates].astype(np.float32)
+        if limit is not None and limit < len(candidates):
+            # Everything above the limit-th score, then the rows tied with it
+            # in catalog order
+            cutoff = -np.partition(-scores, limit - 1)[limit - 1]
+            above = np.flatnonzero(scores > cutoff)
+            tied = np.flatnonzero(scores == cutoff)
+            tied = tied[np.argsort(candidates[tied], kind='stable')][:limit - len(above)]
+            top = np.concatenate([above, tied])
+            candidates, scores = candidates[top], scores[top]
+        # Highest score first, ties in catalog order, as one integer sort:
+        # the bits of a positive float32 order the same way as its value
+        keys = (~scores.view(np.uint32)).astype(np.uint64) << np.uint64(32)
+        keys |= candidates.astype(np.uint64)
+        return (np.sort(keys) & np.uint64(0xFFFFFFFF)).astype(np.int64)
@@ -0,0 +1,158 @@
+// In-browser filtering for the technology radar.
+//
+// The page embeds the whole catalog once as columnar, base64-encoded typed
+// arrays (see techradar/clientside.py). Filter changes are applied here and
+// redrawn with Plotly.react, without a round-trip to the Streamlit server.
+// The module also loads under Node so the filter path can be benchmarked.
+
+(function (root) {
+  'use strict';
+
+  var FACETS = ['category', 'business', 'time', 'desirability'];
+
+  var TYPED_ARRAYS = {
+    i1: Int8Array, u1: Uint8Array, i2: Int16Array, u2: Uint16Array,
+    i4: Int32Array, u4: Uint32Array, f4: Float32Array, f8: Float64Array
+  };
+
+  function decode(column) {
+    var binary = typeof atob === 'function'
+      ? atob(column.bdata)
+      : Buffer.from(column.bdata, 'base64').toString('binary');
+    var bytes = new Uint8Array(binary.length);
+    for (var i = 0; i < binary.length; i++) {
+      bytes[i] = binary.charCodeAt(i);
+    }
+    return new TYPED_ARRAYS[column.dtype](bytes.buffer);
+  }
+
+  function escapeHtml(value) {
+    return String(value).replace(/[&<>"']/g, function (c) {
+      return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c];
+    });
+  }
+
+  // Decode the payload and precompute what does not depend on the filters
+  function loadCatalog(payload) {
+    var columns = {};
+    Object.keys(payload.columns).forEach(function (key) {
+      columns[key] = decode(payload.columns[key]);
+    });
+    var labels = payload.labels;
+    var n = payload.num_rows;
+    var hover = new Array(n);
+    var color = new Array(n);
+    for (var i = 0; i < n; i++) {
+      var label = function (facet) {
+        var code = columns[facet][i];
+        return code < 0 ? '' : labels[facet][code];
+      };
+      hover[i] = '<b>' + escapeHtml(payload.names[i]) + '</b><br>'
+        + 'Category: ' + escapeHtml(label('category')) + '<br>'
+        + 'TRL: ' + columns.trl[i] + '<br>'
+        + 'Business Potential: ' + label('business') + '<br>'
+        + 'Time to Market: ' + label('time') + '<br>'
+        + 'Customer Desirability: ' + label('desirability');
+      var time = columns.time[i];
+      color[i] = time < 0 ? payload.missing_color : payload.time_colors[time];
+    }
+    return {num_rows: n, columns: columns, labels: labels, hover: hover, color: color};
+  }
+
+  // Return the positions matching ``selection``: a list of selected labels
+  // per facet plus an inclusive [min, max] TRL range. As on the server, rows
+  // missing a facet value never match.
+  function filterPositions(catalog, selection) {
+    var allowed = {};
+    FACETS.forEach(function (facet) {
+      var lookup = new Uint8Array(catalog.labels[facet].length);
+      selection[facet].forEach(function (value) {
+        var code = catalog.labels[facet].indexOf(value);
+        if (code >= 0) {
+          lookup[code] = 1;
+        }
+      });
+      allowed[facet] = lookup;
+    });
+
+    var c = catalog.columns;
+    var trlMin = selection.trl[0];
+    var trlMax = selection.trl[1];
+    var positions = new Int32Array(catalog.num_rows);
+    var count = 0;
+    for (var i = 0; i < catalog.num_rows; i++) {
+      var trl = c.trl[i];
+      if (trl >= trlMin && trl <= trlMax
+          && allowed.category[c.category[i]] === 1
+          && allowed.business[c.business[i]] === 1
+          && allowed.time[c.time[i]] === 1
+          && allowed.desirability[c.desirability[i]] === 1) {
+        positions[count++] = i;
+      }
+    }
+    return positions.subarray(0, count);
+  }
+
+  // Build the technology scatter trace for the filtered positions
+  function technologyTrace(catalog, positions) {
+    var c = catalog.columns;
+    var n = positions.length;
+    var x = new Float32Array(n), y = new Float32Array(n);
+    var size = new Float32Array(n), width = new Float32Array(n);
+    var color = new Array(n), hover = new Array(n);
+    for (var k = 0; k < n; k++) {
+      var i = positions[k];
+      x[k] = c.x[i];
+      y[k] = c.y[i];
+      size[k] = c.size[i];
+      width[k] = c.line_width[i];
+      color[k] = catalog.color[i];
+      hover[k] = catalog.hover[i];
+    }
+    return {
+      type: 'scatter', mode: 'markers', name: 'Technologies', x: x, y: y,
+      marker: {size: size, color: color, opacity: 0.5, line: {width: width, color: 'black'}},
+      hovertext: hover, hoverinfo: 'text', customdata: positions, showlegend: false
+    };
+  }
+
+  function readSelection(form) {
+    var selection = {trl: [Number(form.elements.trl_min.value), Number(form.elements.trl_max.value)]};
+    FACETS.forEach(function (facet) {
+      selection[facet] = Array.prototype.filter.call(
+        form.querySelectorAll('input[name="' + facet + '"]'),
+        function (box) { return box.checked; }
+      ).map(function (box) { return box.value; });
+    });
+    return selection;
+  }
+
+  // Wire the filter form to the chart; called once when the page loads
+  function mount(chart, form, status, payload) {
+    var catalog = loadCatalog(payload);
+    var background = payload.figure.data.slice(0, payload.num_background);
+    var legends = payload.figure.data.slice(payload.num_background);
+    var layout = Object.assign({}, payload.figure.layout, {uirevision: 'radar'});
+
+    function redraw() {
+      var start = performance.now();
+      var positions = filterPositions(catalog, readSelection(form));
+      var data = background.concat(positions.length ? [technologyTrace(catalog, positions)] : [], legends);
+      Plotly.react(chart, data, layout, payload.config);
+      status.textContent = positions.length.toLocaleString() + ' of '
+        + catalog.num_rows.toLocaleString() + ' technologies, filtered in '
+        + (performance.now() - start).toFixed(1) + ' ms';
+    }
+
+    form.addEventListener('input', redraw);
+    redraw();
+  }
+
+  var api = {decode: decode, loadCatalog: loadCatalog, filterPositions: filterPositions,
+             technologyTrace: technologyTrace, mount: mount};
+  if (typeof module !== 'undefined' && module.exports) {
+    module.exports = api;
+  } else {
+    root.ClientRadar = api;
+  }
+})(this);
@@ -0,0 +1,535 @@
+"""Streamlit presentation layer for the radar app.
+
+This is the only module in the package that imports Streamlit; ``app.py``
+wires these pieces together. Catalogs and indexes are loaded through the
+shared engine (``techradar.engine``), so every radar and session served by
+the process draws from one memory-bounded cache.
+"""
+
+import html
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+import streamlit.components.v1 as components
+
+from techradar import engine, perf
+from techradar.clientside import CLIENT_MAX_ROWS, page_height
+from techradar.config import BUSINESS_OPTIONS, DESIRABILITY_OPTIONS, TIME_OPTIONS
+from techradar.data import source_fingerprint
+from techradar.details import selected_indices
+from techradar.filters import contains_position, select_rows
+from techradar.history import MANIFEST_NAME, HistoryStore, movement_timeline
+from techradar.listing import (
+    LIST_COLUMNS,
+    PAGE_SIZES,
+    page_count,
+    paginate,
+    render_cards,
+)
+from techradar.lod import LOD_THRESHOLD, should_aggregate
+from techradar.packing import marker_scale
+from techradar.radars import DEFAULT_RADAR, load_registry
+from techradar.scoring import CRITERIA, CRITERIA_LABELS
+
+# Custom CSS for styling
+PAGE_CSS = """
+<style>
+    .main-header {
+        font-size: 2.5rem;
+        font-weight: bold;
+        margin-bottom: 1rem;
+        text-align: center;
+    }
+    .sub-header {
+        font-size: 1.5rem;
+        font-weight: normal;
+        font-style: italic;
+        margin-bottom: 2rem;
+        text-align: center;
+        color: #666;
+    }
+    .stPlotlyChart {
+        height: 800px;
+    }
+    .hover-info {
+        background-color: white;
+        border-radius: 5px;
+        padding: 10px;
+        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+        margin-bottom: 20px;
+    }
+    /* Make sure the plot maintains aspect ratio */
+    [data-testid="stHorizontalBlock"] {
+        align-items: center;
+    }
+</style>
+"""
+
+# Plotly config for maintaining aspect ratio
+PLOT_CONFIG = {
+    'displayModeBar': False,
+    'responsive': True,
+    'staticPlot': False
+}
+
+SHORTLIST_MODES = ["Off", "Top by weighted score", "Pareto front"]
+
+# At most this many technologies are ringed on the radar and listed
+SHORTLIST_MAX = 500
+
+# Radar figures kept per session. Going back to a recent filter result
+# reuses its figure, so the chart message is byte-identical to one already
+# sent and Streamlit's message cache sends a reference instead of the JSON.
+FIGURE_HISTORY = 3
+
+# Filled in with the radar's title and number of categories
+ABOUT_TEXT = """
+    This interactive {title} visualizes technologies
+    across {num_categories} domains. Hover over the bubbles to see detailed information about each technology,
+    or click one to show its description above the chart.
+
+    The visualization uses:
+    - **Position**: Technology Readiness Level (TRL)
+    - **Size**: Business Potential
+    - **Color**: Time to Market
+    - **Border Width**: Customer Desirability (log scale)
+
+    Created by Manus AI
+    """
+
+
+def data_source():
+    """Return the configured catalog file, or None for the built-in list.
+
+    Set ``TECH_RADAR_SOURCE`` to a CSV, Parquet or SQLite file.
+    """
+    return os.environ.get('TECH_RADAR_SOURCE') or None
+
+
+def debug_enabled():
+    """Return True when the performance panel should be shown.
+
+    Enable it with ``?debug=1`` in the URL or ``TECH_RADAR_DEBUG=1``.
+    """
+    return bool(os.environ.get('TECH_RADAR_DEBUG')) or st.query_params.get('debug') == '1'
+
+
+def history_path():
+    """Return the radar history directory, or None when not configured.
+
+    Set ``TECH_RADAR_HISTORY`` to a directory written by
+    ``python -m techradar history add``.
+    """
+    return os.environ.get('TECH_RADAR_HISTORY') or None
+
+
+def registry_path():
+    """Return the radar registry file, or None to serve only the default radar.
+
+    Set ``TECH_RADAR_REGISTRY`` to a JSON file of radar definitions (see
+    ``techradar.radars``).
+    """
+    return os.environ.get('TECH_RADAR_REGISTRY') or None
+
+
+# The registry is reloaded whenever its file changes. No spinner: this runs
+# before set_page_config, which must be the first Streamlit command.
+@st.cache_resource(max_entries=2, show_spinner=False)
+def get_registry(path, fingerprint):
+    return load_registry(path)
+
+
+def current_radar():
+    """Return the definition of the radar selected with ``?radar=<key>``.
+
+    Without a registry the default radar is served, reading its catalog from
+    ``TECH_RADAR_SOURCE`` when set.
+    """
+    path = registry_path()
+    if path is None:
+        return DEFAULT_RADAR._replace(source=data_source())
+    registry = get_registry(path, source_fingerprint(path))
+    key = st.query_params.get('radar')
+    return registry[key] if key in registry else registry.default
+
+
+def _select_radar():
+    st.query_params['radar'] = st.session_state.radar_key
+
+
+def sidebar_radar_picker(radar_def):
+    """Draw the radar switcher when the registry holds more than one radar."""
+    path = registry_path()
+    if path is None:
+        return
+    registry = get_registry(path, source_fingerprint(path))
+    if len(registry) < 2:
+        return
+    st.session_state.radar_key = radar_def.key
+    titles = {definition.key: definition.title for definition in registry}
+    st.sidebar.selectbox("Radar", registry.keys, format_func=titles.get, key='radar_key',
+                         on_change=_select_radar)
+
+
+def setup_page(radar_def=DEFAULT_RADAR):
+    """Configure the page and draw the title block."""
+    st.set_page_config(
+        page_title=radar_def.title,
+        page_icon="🔬",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
+    st.markdown(f'<div class="main-header">{html.escape(radar_def.title)}</div>', unsafe_allow_html=True)
+    if radar_def.subtitle:
+        st.markdown(f'<div class="sub-header">{html.escape(radar_def.subtitle)}</div>', unsafe_allow_html=True)
+
+
+def load_radar(radar_def):
+    """Return the prepared catalog of ``radar_def`` and its indexes as a ``RadarData``."""
+    with st.spinner("Loading technology catalog..."), perf.stage('catalog'):
+        radar = engine.load_radar(radar_def)
+    perf.note(radar=radar_def.key, rows=len(radar.df))
+    return radar
+
+
+# The history store is reopened whenever its manifest changes
+@st.cache_resource(max_entries=2)
+def get_history_store(path, fingerprint):
+    return HistoryStore(path)
+
+
+@st.cache_resource(max_entries=8, show_spinner="Building the movement timeline...")
+def get_movement_timeline(_store, path, fingerprint, labels):
+    return movement_timeline(_store, labels)
+
+
+@st.cache_resource(max_entries=8)
+def get_version_diff(_store, path, fingerprint, old_label, new_label):
+    diff = _store.diff(old_label, new_label)
+    return diff[diff['status'] != 'unchanged'].reset_index(drop=True)
+
+
+def sidebar_filter_mode(num_rows):
+    """Draw the filtering mode switch and return True for in-browser filtering."""
+    too_large = num_rows > CLIENT_MAX_ROWS
+    mode = st.sidebar.radio(
+        "Filtering",
+        ["On the server", "In the browser"],
+        horizontal=True,
+        disabled=too_large,
+        help=f"In the browser, the catalog is sent once and filters apply without a "
+             f"round-trip to the server. Available up to {CLIENT_MAX_ROWS:,} technologies."
+    )
+    return mode == "In the browser" and not too_large
+
+
+def sidebar_filters(categories):
+    """Draw the sidebar filters and return the current selections."""
+    st.sidebar.title("Filters")
+
+    # Category filter
+    selected_categories = st.sidebar.multiselect(
+        "Select Categories",
+        options=categories,
+        default=categories
+    )
+
+    # TRL filter
+    trl_range = st.sidebar.slider(
+        "TRL Range",
+        min_value=1,
+        max_value=9,
+        value=(1, 9)
+    )
+
+    # Business Potential filter
+    selected_business = st.sidebar.multiselect(
+        "Business Potential",
+        options=BUSINESS_OPTIONS,
+        default=BUSINESS_OPTIONS
+    )
+
+    # Time to Market filter
+    selected_time = st.sidebar.multiselect(
+        "Time to Market",
+        options=TIME_OPTIONS,
+        default=TIME_OPTIONS
+    )
+
+    # Customer Desirability filter
+    selected_desirability = st.sidebar.multiselect(
+        "Customer Desirability",
+        options=DESIRABILITY_OPTIONS,
+        default=DESIRABILITY_OPTIONS
+    )
+
+    return dict(
+        categories=selected_categories,
+        trl_range=trl_range,
+        business=selected_business,
+        time=selected_time,
+        desirability=selected_desirability,
+    )
+
+
+def sidebar_display_options():
+    """Draw the display toggles and return whether LOD mode is enabled."""
+    # Level-of-detail mode: large selections are drawn as aggregate bubbles
+    return st.sidebar.checkbox(
+        "Aggregate large radars",
+        value=True,
+        help=f"Above {LOD_THRESHOLD:,} technologies, draw one bubble per category, TRL ring "
+             "and time to market. Select a single category or a narrow TRL range to see "
+             "individual technologies."
+    )
+
+
+def sidebar_prioritisation():
+    """Draw the shortlist controls and return them, or None when switched off."""
+    st.sidebar.title("Prioritise")
+    mode = st.sidebar.radio(
+        "Highlight",
+        SHORTLIST_MODES,
+        help="Ring the best technologies of each category on the radar and list them "
+             "below it. The Pareto front holds the technologies no other one in their "
+             "category beats on every weighted criterion."
+    )
+    if mode == "Off":
+        return None
+    weights = {name: st.sidebar.slider(f"{label} weight", 0, 5, 1)
+               for name, label in CRITERIA_LABELS.items()}
+    k = st.sidebar.number_input("Top per category", min_value=1, max_value=50, value=3) \
+        if mode == "Top by weighted score" else None
+    return dict(mode=mode, weights=weights, k=k)
+
+
+def _has_weights(weights):
+    return any(weight > 0 for weight in weights.values())
+
+
+def shortlist(radar, positions, prioritisation):
+    """Return the positions to highlight and how many qualified, or (None, 0).
+
+    Fronts of large catalogs can hold thousands of technologies; only the
+    ``SHORTLIST_MAX`` best-scoring are kept.
+    """
+    if prioritisation is None:
+        return None, 0
+    weights = prioritisation['weights']
+    if not _has_weights(weights):
+        # Every score is 0 and no criterion defines a front
+        return np.array([], dtype=np.intp), 0
+    if prioritisation['mode'] == "Top by weighted score":
+        shortlisted = radar.scoring.top_k(weights, prioritisation['k'], positions)
+    else:
+        criteria = tuple(name for name in CRITERIA if weights[name] > 0)
+        shortlisted = radar.scoring.pareto_front(positions, criteria)
+    total = len(shortlisted)
+    if total > SHORTLIST_MAX:
+        scores = radar.scoring.scores(weights)[shortlisted]
+        best = np.sort(np.argpartition(-scores, SHORTLIST_MAX - 1)[:SHORTLIST_MAX])
+        shortlisted = shortlisted[best]
+    return shortlisted, total
+
+
+def _shortlist_frame(radar, shortlisted, weights):
+    """Return the shortlisted rows with their weighted score."""
+    return select_rows(radar.df, shortlisted).assign(
+        score=radar.scoring.scores(weights)[shortlisted])
+
+
+def render_shortlist(radar, shortlisted, total, prioritisation):
+    """Draw the ranked shortlist table below the radar."""
+    if shortlisted is None:
+        return
+    st.subheader("Shortlist")
+    if not _has_weights(prioritisation['weights']):
+        st.info("Set at least one weight above 0 to build a shortlist.")
+        return
+    if len(shortlisted) == 0:
+        st.info("No technologies pass the filters.")
+        return
+    kept = f"the {len(shortlisted):,} best-scoring of " if total > len(shortlisted) else ""
+    st.caption(f"{prioritisation['mode']}: {kept}{total:,} technologies, ringed on the radar")
+    table = _shortlist_frame(radar, shortlisted, prioritisation['weights'])
+    st.dataframe(table[['score'] + LIST_COLUMNS].round({'score': 3}), hide_index=True,
+                 use_container_width=True)
+
+
+def _payload_bytes(fig):
+    """Return the size of the figure JSON that ``st.plotly_chart`` sends."""
+    import plotly.io as pio
+
+    return len(pio.to_json(fig, validate=False).encode())
+
+
+def _same_rows(a, b):
+    return a is b or (a is not None and b is not None and np.array_equal(a, b))
+
+
+def _radar_figure(radar, positions, aggregated, radar_def, highlight=None, weights=None):
+    """Return the radar figure, reused while the filter result is unchanged.
+
+    The session keeps only its last ``FIGURE_HISTORY`` figures and the
+    filter index's shared ``positions``; the selected rows are taken from
+    the shared catalog just long enough to build the figure. Positions and
+    ``highlight`` (at most ``SHORTLIST_MAX`` positions) are compared by
+    value, so different filters selecting the same rows share a figure.
+    """
+    from techradar.figure import create_radar_plot
+
+    df = radar.df
+    key = (aggregated, radar_def, weights)
+    # Figures of a catalog replaced by a refresh are dropped with it
+    figures = [entry for entry in st.session_state.get('radar_figures', []) if entry[0] is df]
+    cached = next((entry for entry in figures
+                   if entry[3] == key and _same_rows(entry[1], positions)
+                   and _same_rows(entry[2], highlight)), None)
+    if cached is None:
+        with perf.stage('figure'):
+            rings = _shortlist_frame(radar, highlight, weights) if highlight is not None else None
+            fig = create_radar_plot(select_rows(df, positions), aggregate=aggregated,
+                                    radar=radar_def, highlight=rings,
+                                    size_scale=marker_scale(df, radar_def.business_to_size))
+        # Measuring the payload serializes the figure once more, so only when it is reported
+        payload = _payload_bytes(fig) if debug_enabled() or perf.PERF_LOG.path else None
+        stats = dict(traces=len(fig.data), points=len(positions), payload_bytes=payload)
+        cached = (df, positions, highlight, key, fig, stats)
+    # Most recently used first
+    others = [entry for entry in figures if entry is not cached]
+    st.session_state.radar_figures = [cached] + others[:FIGURE_HISTORY - 1]
+    perf.note(**cached[5])
+    return cached[4]
+
+
+# Selecting a bubble reruns only this fragment: the figure is reused and
+# only the detail panel above the chart changes
+@st.fragment
+@perf.run('fragment')
+def render_radar(radar, positions, filters, aggregate_large, radar_def=DEFAULT_RADAR,
+                 highlight=None, weights=None):
+    """Draw the radar chart and the detail panel of the selected technology.
+
+    ``positions`` are the catalog rows passing the filters; ``highlight``
+    are the shortlisted ones, ringed and scored with ``weights``.
+    """
+    # Create a container for the selected technology's details
+    hover_info_container = st.empty()
+
+    aggregated = aggregate_large and should_aggregate(
+        len(positions), filters['categories'], filters['trl_range'])
+    fig = _radar_figure(radar, positions, aggregated, radar_def, highlight, weights)
+
+    with perf.stage('chart'):
+        event = st.plotly_chart(fig, use_container_width=True, config=PLOT_CONFIG,
+                                key='radar', on_select='rerun', selection_mode='points')
+    if aggregated:
+        st.caption(f"Showing {len(positions):,} technologies as aggregates. Select a single "
+                   "category or a narrow TRL range to see individual technologies.")
+
+    # Show the first selected technology that is still on the radar
+    index = radar.df.index
+    for selected in selected_indices(event):
+        if selected in index and contains_position(positions, index.get_loc(selected)):
+            panel = radar.details.html(selected, radar.df, radar.descriptions)
+            hover_info_container.markdown(panel, unsafe_allow_html=True)
+            break
+
+
+def render_client_radar(radar_def):
+    """Draw the radar with its own in-browser filter controls."""
+    with perf.stage('chart'):
+        page = engine.client_page(radar_def, PLOT_CONFIG)
+        components.html(page, height=page_height(), scrolling=False)
+    perf.note(payload_bytes=len(page.encode()))
+
+
+@perf.stage('list')
+def render_technology_list(radar, positions=None, note=None):
+    """Draw the searchable, paginated "Filtered Technologies" sidebar list.
+
+    ``positions`` are the catalog rows passing the filters (all rows when
+    None); a search narrows them further and ranks the matches.
+    """
+    st.sidebar.title("Filtered Technologies")
+    if note:
+        st.sidebar.caption(note)
+    search_query = st.sidebar.text_input(
+        "Search name or description",
+        placeholder="e.g. CRISPR",
+        help="Every word must match the start of a word in the name or description. "
+             "Best matches are listed first."
+    )
+    list_view = st.sidebar.radio("View as", ["Cards", "Table"], horizontal=True)
+    listed = radar.search_index.search(search_query, positions=positions)
+
+    if len(listed) == 0:
+        st.sidebar.write("No technologies match the selected filters.")
+    elif list_view == "Table":
+        # A single dataframe element; the browser virtualizes the rows
+        st.sidebar.dataframe(select_rows(radar.df, listed)[LIST_COLUMNS], hide_index=True,
+                             use_container_width=True)
+    else:
+        # Only the current page is taken from the catalog and rendered, as one markdown element
+        page_size = st.sidebar.selectbox("Technologies per page", PAGE_SIZES, index=1)
+        num_pages = page_count(len(listed), page_size)
+        page = st.sidebar.number_input("Page", min_value=1, max_value=num_pages, value=1) if num_pages > 1 else 1
+        page_df, page = paginate(radar.df, page, page_size, positions=listed)
+        start = (page - 1) * page_size
+        st.sidebar.caption(f"Showing {start + 1}-{start + len(page_df)} of {len(listed)} technologies")
+        st.sidebar.markdown(render_cards(page_df), unsafe_allow_html=True)
+
+
+def render_history(path):
+    """Draw the movement timeline and change table for recorded versions."""
+    manifest = os.path.join(path, MANIFEST_NAME)
+    fingerprint = source_fingerprint(manifest) if os.path.exists(manifest) else None
+    store = get_history_store(path, fingerprint)
+    versions = store.versions
+
+    with st.expander("Radar History", expanded=False):
+        if len(versions) < 2:
+            st.info("Record at least two radar versions with `python -m techradar history add` "
+                    "to see how technologies moved.")
+            return
+        first, last = st.select_slider("Versions", options=versions,
+                                       value=(versions[0], versions[-1]))
+        if first == last:
+            st.info("Select two different versions to compare.")
+            return
+        labels = tuple(versions[versions.index(first):versions.index(last) + 1])
+
+        fig = get_movement_timeline(store, path, fingerprint, labels)
+        st.plotly_chart(fig, use_container_width=True, config=PLOT_CONFIG, key='history')
+
+        changes = get_version_diff(store, path, fingerprint, first, last)
+        counts = changes['status'].value_counts()
+        st.caption(f"From {first} to {last}: {counts['added']:,} added, {counts['removed']:,} "
+                   f"removed, {counts['changed']:,} changed")
+        st.dataframe(changes, hide_index=True, use_container_width=True)
+
+
+def render_perf_panel(record):
+    """Draw the timings of this run and recent percentiles, when debugging."""
+    if record is None or not debug_enabled():
+        return
+    with st.sidebar.expander("Performance", expanded=True):
+        payload = record.get('payload_bytes')
+        st.caption(f"This run: {record['total_ms']:.1f} ms"
+                   + (f", {record.get('traces', 0)} traces, {payload / 1024:,.1f} KiB sent"
+                      if payload is not None else ""))
+        st.dataframe(pd.Series(record['stages'], name='ms').round(2), use_container_width=True)
+        records = perf.PERF_LOG.records()
+        st.caption(f"Last {len(records):,} runs and fragment reruns, all sessions")
+        st.dataframe(perf.PERF_LOG.summary(records).round(2), use_container_width=True)
+
+
+def render_about(radar_def=DEFAULT_RADAR):
+    """Draw the project information box at the bottom of the sidebar."""
+    st.sidebar.markdown("---")
+    st.sidebar.title("About")
+    st.sidebar.info(ABOUT_TEXT.format(title=radar_def.title,
+                                      num_categories=len(radar_def.categories)))
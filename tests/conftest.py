@@ -0,0 +1,14 @@
+import numpy as np
+import pytest
+
+from benchmarks.common import synthetic_catalog
+
+
+@pytest.fixture
+def catalog():
+    """A random catalog with a few missing values in every enumerated column."""
+    df = synthetic_catalog(2000, seed=1, description_words=4)
+    rng = np.random.default_rng(1)
+    for column in ('category', 'business', 'time', 'desirability'):
+        df.loc[rng.choice(len(df), 20, replace=False), column] = np.nan
+    return df
@@ -0,0 +1,28 @@
+import numpy as np
+
+from techradar.cache import MemoryLRU
+
+
+class Index:
+    def __init__(self):
+        self.memo = MemoryLRU(10_000)
+
+
+def test_memo_growth_is_charged_on_hit():
+    cache = MemoryLRU(1_000_000)
+    index = cache.get_or_create('index', Index)
+    before = cache.cache_info().bytes
+    index.memo.get_or_create('a', lambda: np.zeros(1000, dtype=np.uint8))
+    assert cache.cache_info().bytes == before
+    assert cache.get_or_create('index', Index) is index
+    assert cache.cache_info().bytes == before + index.memo.nbytes >= before + 1000
+
+
+def test_memo_growth_evicts_older_entries():
+    cache = MemoryLRU(6_000)
+    cache.get_or_create('old', lambda: np.zeros(3000, dtype=np.uint8))
+    index = cache.get_or_create('index', Index)
+    index.memo.get_or_create('a', lambda: np.zeros(4000, dtype=np.uint8))
+    cache.get_or_create('index', Index)
+    assert cache.cache_info().entries == 1
+    assert cache.cache_info().bytes <= cache.max_bytes
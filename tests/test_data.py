@@ -0,0 +1,94 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from techradar.data import (
+    MISSING_TRL,
+    SAMPLE_TECHNOLOGIES,
+    load_descriptions,
+    load_technology_data,
+    source_fingerprint,
+)
+
+RAW = pd.DataFrame({
+    'name': ['A', 'B', 'C', 'D', 'E', 'F'],
+    'category': ['Cardiology', ' Oncology ', '', 'Oncology', None, 'Neurology'],
+    'trl': ['3', '', 'abc', '12', '2.5', '9'],
+    'business': ['high', 'MEDIUM', 'LOW', 'huge', 'HIGH', None],
+    'time': ['NOW', '1', '3', '5', '10', 'NEVER'],
+    'desirability': ['LOW', 'MEDIUM', 'HIGH', 'HIGH', 'LOW', 'MEDIUM'],
+    'description': ['first', None, 'third', 'fourth', 'fifth', 'sixth'],
+})
+
+
+def check_loaded(df):
+    assert list(df['trl']) == [3, MISSING_TRL, MISSING_TRL, MISSING_TRL, MISSING_TRL, 9]
+    assert df['trl'].dtype == np.int8
+    assert list(df['category'].astype(object).fillna('-')) == [
+        'Cardiology', 'Oncology', '-', 'Oncology', '-', 'Neurology']
+    assert list(df['business'].astype(object).fillna('-')) == [
+        'HIGH', 'MEDIUM', 'LOW', '-', 'HIGH', '-']
+    assert all(isinstance(df[column].dtype, pd.CategoricalDtype)
+               for column in ('category', 'business', 'time', 'desirability'))
+
+
+def test_sample_catalog():
+    df = load_technology_data()
+    assert len(df) == len(SAMPLE_TECHNOLOGIES)
+    assert (df['trl'] != MISSING_TRL).all()
+    assert list(load_descriptions()) == list(df['description'])
+
+
+@pytest.mark.parametrize('name,sep', [('catalog.csv', ','), ('catalog.tsv', '\t'),
+                                      ('CATALOG.TSV', '\t'), ('catalog.csv.gz', ',')])
+def test_text_files(tmp_path, name, sep):
+    path = tmp_path / name
+    RAW.to_csv(path, sep=sep, index=False)
+    check_loaded(load_technology_data(path, chunksize=4))
+    assert list(load_descriptions(path, chunksize=4)) == [
+        'first', '', 'third', 'fourth', 'fifth', 'sixth']
+
+
+def test_sqlite(tmp_path):
+    path = tmp_path / 'catalog.db'
+    with sqlite3.connect(path) as con:
+        RAW.to_sql('radar', con, index=False)
+    check_loaded(load_technology_data(path, table='radar', chunksize=4))
+    with pytest.raises(ValueError, match='no table'):
+        load_technology_data(path)
+
+
+def test_parquet(tmp_path):
+    pytest.importorskip('pyarrow')
+    path = tmp_path / 'catalog.parquet'
+    RAW.to_parquet(path)
+    check_loaded(load_technology_data(path, chunksize=4))
+
+
+def test_without_descriptions(tmp_path):
+    path = tmp_path / 'catalog.csv'
+    RAW.drop(columns='description').to_csv(path, index=False)
+    assert 'description' not in load_technology_data(path, descriptions=False).columns
+    assert list(load_descriptions(path)) == [''] * len(RAW)
+
+
+def test_rejects_bad_sources(tmp_path):
+    path = tmp_path / 'catalog.csv'
+    RAW.drop(columns='trl').to_csv(path, index=False)
+    with pytest.raises(ValueError, match='missing columns: trl'):
+        load_technology_data(path)
+    with pytest.raises(ValueError, match='Unsupported'):
+        load_technology_data(tmp_path / 'catalog.xlsx')
+
+
+def test_fingerprint_follows_changes(tmp_path):
+    path = tmp_path / 'catalog.csv'
+    RAW.to_csv(path, index=False)
+    before = source_fingerprint(path)
+    assert source_fingerprint(path) == before
+    RAW.iloc[:3].to_csv(path, index=False)
+    assert source_fingerprint(path) != before
+    assert source_fingerprint(path, hash_contents=True) != source_fingerprint(path)
+    assert source_fingerprint(None) is None
@@ -0,0 +1,64 @@
+import pandas as pd
+
+from techradar.details import DetailCache, render_detail, selected_indices
+
+FRAME = pd.DataFrame({
+    'name': ['Alpha', '<b>Beta</b>', 'Gamma'],
+    'category': ['Oncology', 'Cardiology', 'Neurology'],
+    'trl': [2, 5, 9],
+    'business': ['HIGH', 'LOW', 'MEDIUM'],
+    'time': ['NOW', '3', '10'],
+    'desirability': ['LOW', 'MEDIUM', 'HIGH'],
+}, index=[10, 20, 30])
+DESCRIPTIONS = ['first', 'second & more', None]
+
+
+def test_selected_indices():
+    assert selected_indices(None) == []
+    assert selected_indices({}) == []
+    assert selected_indices({'selection': {'points': []}}) == []
+    event = {'selection': {'points': [
+        {'customdata': 20},
+        {'customdata': [30, 'extra']},
+        {'customdata': -1},      # level-of-detail aggregate
+        {'customdata': []},
+        {'x': 0.1},              # trace without customdata
+        {'customdata': 10.0},
+    ]}}
+    assert selected_indices(event) == [20, 30, 10]
+
+
+def test_render_detail_escapes_and_names_phase():
+    text = render_detail(FRAME.loc[20], DESCRIPTIONS[1])
+    assert '&lt;b&gt;Beta&lt;/b&gt;' in text and '<b>Beta' not in text
+    assert 'second &amp; more' in text
+    assert '5 (Development Phase)' in text
+    assert '(Research Phase)' in render_detail(FRAME.loc[10])
+    assert '(Deployment Phase)' in render_detail(FRAME.loc[30])
+    assert '<strong>Description:</strong> </p>' in render_detail(FRAME.loc[30])
+
+
+def test_detail_cache():
+    cache = DetailCache()
+    assert cache.html(99, FRAME, DESCRIPTIONS) is None
+    panel = cache.html(20, FRAME, DESCRIPTIONS)
+    assert panel == render_detail(FRAME.loc[20], DESCRIPTIONS[1])
+    assert cache.html(20, FRAME, DESCRIPTIONS) is panel
+    assert 'second &amp; more' in panel
+    assert '<strong>Description:</strong> first' in cache.html(10, FRAME, DESCRIPTIONS)
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.entries) == (1, 2, 2)
+
+
+def test_detail_cache_reads_description_column():
+    df = FRAME.assign(description=DESCRIPTIONS)
+    assert 'second &amp; more' in DetailCache().html(20, df)
+
+
+def test_detail_cache_is_bounded():
+    cache = DetailCache(cache_bytes=4096)
+    df = pd.concat([FRAME] * 20, ignore_index=True)
+    for index in df.index:
+        cache.html(index, df)
+    info = cache.cache_info()
+    assert 0 < info.entries < len(df) and info.bytes <= 4096
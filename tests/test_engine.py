@@ -0,0 +1,62 @@
+import pytest
+
+from benchmarks.common import synthetic_catalog
+from techradar import engine
+from techradar.cache import SHARED_CACHE
+from techradar.data import source_fingerprint
+from techradar.radars import DEFAULT_RADAR
+from techradar.refresh import Refresher
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'catalog.csv'
+    synthetic_catalog(3000, description_words=3).to_csv(path, index=False)
+    SHARED_CACHE.clear()
+    yield path
+    SHARED_CACHE.clear()
+
+
+def shrink(path):
+    """Replace the catalog with its first 2000 rows and new descriptions."""
+    df = synthetic_catalog(3000, description_words=3).iloc[:2000]
+    df.assign(description='new ' + df['description']).to_csv(path, index=False)
+
+
+def old_description(index):
+    return synthetic_catalog(3000, description_words=3)['description'][index]
+
+
+def test_old_version_keeps_its_descriptions_after_swap(source, monkeypatch):
+    refresher = Refresher(interval=3600, on_swap=engine._retire_version)
+    monkeypatch.setattr(engine, 'REFRESHER', refresher)
+    radar = DEFAULT_RADAR._replace(source=source)
+    old = engine.load_radar(radar)
+    old_fingerprint = source_fingerprint(source)
+
+    shrink(source)
+    refresher.poll()
+    assert refresher.poll()
+    refresher.stop()
+
+    assert not [key for key in SHARED_CACHE._entries if old_fingerprint in key[1]]
+    assert old_description(2600) in old.details.html(2600, old.df, old.descriptions)
+    new = engine.load_radar(radar)
+    assert len(new.df) == 2000
+    assert 'new ' in new.details.html(1500, new.df, new.descriptions)
+
+
+def test_evicted_version_is_not_rebuilt_from_changed_file(source, monkeypatch):
+    monkeypatch.setattr(engine.REFRESHER, 'interval', 0)
+    radar = DEFAULT_RADAR._replace(source=source)
+    old = engine.load_radar(radar)
+    old_fingerprint = source_fingerprint(source)
+
+    shrink(source)
+    SHARED_CACHE.clear()
+
+    assert old_description(2600) in old.details.html(2600, old.df, old.descriptions)
+    with pytest.raises(engine.SourceChangedError):
+        engine._load_version(radar, old_fingerprint)
+    new = engine.load_radar(radar)
+    assert len(new.df) == len(new.descriptions) == 2000
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from techradar.config import CATEGORIES
+from techradar.export import export_snapshots, normalize_preset
+
+
+def test_normalize_fills_defaults():
+    preset = normalize_preset({'name': 'all'}, default_source='catalog.csv')
+    assert preset['source'] == 'catalog.csv'
+    assert preset['categories'] == list(CATEGORIES)
+    assert preset['trl'] == [1, 9]
+    assert preset['aggregate'] == 'auto'
+    assert normalize_preset({'name': 'x', 'source': 'own.csv', 'trl': ['4', 6]},
+                            default_source='catalog.csv')['source'] == 'own.csv'
+
+
+@pytest.mark.parametrize('name', ['', '.', '..', '../escape', 'a/b', 'a\\b', '/tmp/abs',
+                                  os.path.join('sub', 'dir')])
+def test_rejects_names_that_are_not_plain_file_names(name):
+    with pytest.raises(ValueError, match='plain file name'):
+        normalize_preset({'name': name})
+
+
+def test_rejects_bad_presets():
+    with pytest.raises(ValueError, match='missing a name'):
+        normalize_preset({'title': 'No name'})
+    with pytest.raises(ValueError, match='aggregate'):
+        normalize_preset({'name': 'x', 'aggregate': 'sometimes'})
+
+
+def test_bad_names_write_nothing(tmp_path):
+    out = tmp_path / 'out'
+    with pytest.raises(ValueError):
+        export_snapshots([{'name': 'fine'}, {'name': '../escape'}], str(out), formats=['html'])
+    with pytest.raises(ValueError, match='unique'):
+        export_snapshots([{'name': 'twice'}, {'name': 'twice'}], str(out), formats=['html'])
+    assert not out.exists()
+    assert not (tmp_path / 'escape.html').exists()
+
+
+def test_html_export_is_self_contained_and_cached(tmp_path):
+    out = str(tmp_path)
+    presets = [{'name': 'oncology', 'categories': ['Oncology'], 'title': 'Oncology'}]
+    written, skipped = export_snapshots(presets, out, formats=['html'], jobs=1)
+    assert written == [os.path.join(out, 'oncology.html')] and skipped == []
+    with open(written[0]) as handle:
+        html = handle.read()
+    assert '<script src="https://cdn.plot.ly' not in html and 'Oncology' in html
+    assert len(html) > 1_000_000
+
+    written, skipped = export_snapshots(presets, out, formats=['html'], jobs=1)
+    assert written == [] and skipped == [os.path.join(out, 'oncology.html')]
@@ -0,0 +1,79 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from techradar.config import TIME_TO_COLOR
+from techradar.figure import (
+    HOVER_COLUMNS,
+    HOVER_TEMPLATE,
+    MISSING_COLOR,
+    SCORE_TEMPLATE,
+    color_codes,
+    create_radar_plot,
+    hover_customdata,
+)
+from techradar.layout import prepare_radar_frame
+
+
+def drawn_colors(codes, marker):
+    """Look codes up in a step colorscale the way plotly.js does."""
+    scale = marker['colorscale']
+    span = marker['cmax'] - marker['cmin']
+    colors = []
+    for code in codes:
+        position = (code - marker['cmin']) / span
+        # Each color covers [i / steps, (i + 1) / steps]
+        colors.append(next(color for (low, color), (high, _) in zip(scale[::2], scale[1::2])
+                           if low <= position <= high))
+    return colors
+
+
+def test_color_codes_categorical():
+    column = pd.Categorical(['#a', '#b', None, '#a', '#c'], categories=['#a', '#b', '#c'])
+    codes, marker = color_codes(pd.Series(column))
+    assert codes.dtype == np.int8
+    assert drawn_colors(codes, marker) == ['#a', '#b', MISSING_COLOR, '#a', '#c']
+
+
+def test_color_codes_plain_and_empty():
+    column = pd.Series(['red', 'blue', 'red'])
+    codes, marker = color_codes(column)
+    assert drawn_colors(codes, marker) == list(column)
+    assert MISSING_COLOR not in [color for _, color in marker['colorscale']]
+
+    codes, marker = color_codes(pd.Series([], dtype=object))
+    assert len(codes) == 0 and marker['colorscale'][-1][1] == MISSING_COLOR
+
+
+def test_hover_customdata_matches_template():
+    df = pd.DataFrame({
+        'name': ['Alpha', 'Beta'], 'category': ['Oncology', 'Neurology'], 'trl': [3, 7],
+        'business': ['HIGH', 'LOW'], 'time': ['NOW', '5'], 'desirability': ['LOW', 'HIGH'],
+        'score': [0.5, 0.25],
+    }, index=[40, 7])
+    rows = hover_customdata(df)
+    assert rows.shape == (2, len(HOVER_COLUMNS) + 1)
+    assert list(rows[:, 0]) == [40, 7]
+    assert list(rows[1]) == [7, 'Beta', 'Neurology', 7, 'LOW', '5', 'HIGH']
+    used = {int(i) for i in re.findall(r'customdata\[(\d+)\]', HOVER_TEMPLATE)}
+    assert used == set(range(1, len(HOVER_COLUMNS) + 1))
+
+    rows = hover_customdata(df, 'score')
+    score_index = int(re.search(r'customdata\[(\d+)\]', SCORE_TEMPLATE).group(1))
+    assert list(rows[:, score_index]) == [0.5, 0.25]
+
+
+def test_bubbles_carry_codes_and_customdata():
+    df = prepare_radar_frame(pd.DataFrame({
+        'name': ['Alpha', 'Beta', 'Gamma'], 'category': ['Oncology', 'Neurology', 'Oncology'],
+        'trl': [3, 7, 9], 'business': ['HIGH', 'LOW', 'MEDIUM'],
+        'time': ['NOW', None, '10'], 'desirability': ['LOW', 'HIGH', 'MEDIUM'],
+    }))
+    fig = create_radar_plot(df)
+    bubbles = [trace for trace in fig.data if trace.customdata is not None]
+    assert len(bubbles) == 1
+    trace = bubbles[0]
+    assert [row[0] for row in trace.customdata] == list(df.index)
+    colors = drawn_colors(trace.marker.color, trace.marker.to_plotly_json())
+    assert colors == [TIME_TO_COLOR['NOW'], MISSING_COLOR, TIME_TO_COLOR['10']]
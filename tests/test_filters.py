@@ -0,0 +1,44 @@
+import numpy as np
+
+from techradar.filters import FACETS, FilterIndex
+
+
+def boolean_mask(df, categories, trl_range, business, time, desirability):
+    return (df['category'].isin(categories).to_numpy()
+            & df['trl'].between(*trl_range).to_numpy()
+            & df['business'].isin(business).to_numpy()
+            & df['time'].isin(time).to_numpy()
+            & df['desirability'].isin(desirability).to_numpy())
+
+
+def random_filters(df, rng):
+    values = [set(rng.permutation(df[facet].cat.categories)[:rng.integers(0, 4) + 1])
+              for facet in FACETS]
+    low = int(rng.integers(1, 10))
+    return values[0], (low, int(rng.integers(low, 10))), *values[1:]
+
+
+def test_positions_match_boolean_mask(catalog):
+    index = FilterIndex(catalog)
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        filters = random_filters(catalog, rng)
+        expected = np.flatnonzero(boolean_mask(catalog, *filters))
+        np.testing.assert_array_equal(index.positions(*filters), expected)
+        np.testing.assert_array_equal(index.mask(*filters), boolean_mask(catalog, *filters))
+
+
+def test_every_value_selected_excludes_only_missing(catalog):
+    filters = [set(catalog[facet].cat.categories) for facet in FACETS]
+    filters.insert(1, (1, 9))
+    expected = np.flatnonzero(catalog[list(FACETS)].notna().all(axis=1).to_numpy())
+    np.testing.assert_array_equal(FilterIndex(catalog).positions(*filters), expected)
+
+
+def test_memo_stays_under_byte_budget(catalog):
+    index = FilterIndex(catalog, cache_bytes=4 * len(catalog) * 3)
+    rng = np.random.default_rng(2)
+    for _ in range(50):
+        positions = index.positions(*random_filters(catalog, rng))
+        assert positions.dtype == np.int32
+    assert index.cache_info().bytes <= index.cache_info().max_bytes
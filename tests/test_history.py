@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from techradar.data import COLUMNS
+from techradar.history import HistoryStore, apply_delta, catalog_delta, diff_versions
+
+
+def by_name(df):
+    return df[COLUMNS].sort_values('name').reset_index(drop=True).astype(object)
+
+
+def next_version(df, seed):
+    """Change, drop and add a few technologies."""
+    rng = np.random.default_rng(seed)
+    df = df.copy()
+    changed = rng.choice(len(df), 30, replace=False)
+    df.loc[df.index[changed[:15]], 'trl'] = np.clip(df['trl'].iloc[changed[:15]] + 3, 1, 9)
+    df.loc[df.index[changed[15:]], 'time'] = 'NOW'
+    df = df.drop(df.index[rng.choice(len(df), 20, replace=False)])
+    added = df.iloc[:10].assign(name=[f'New {seed}-{i}' for i in range(10)])
+    return pd.concat([df, added], ignore_index=True)
+
+
+@pytest.fixture
+def versions(catalog):
+    catalog = catalog.assign(name=[f'Tech {i}' for i in range(len(catalog))])
+    second = next_version(catalog, 2)
+    return [catalog, second, next_version(second, 3)]
+
+
+def test_delta_round_trip(versions):
+    old, new = versions[:2]
+    upserts, removed = catalog_delta(old, new)
+    assert len(removed) == 20
+    assert len(upserts) < len(new) // 10
+    pd.testing.assert_frame_equal(by_name(apply_delta(old, upserts, removed)), by_name(new))
+
+
+def test_store_round_trip(versions, tmp_path):
+    store = HistoryStore(tmp_path)
+    for label, df in zip(['2025Q1', '2025Q2', '2025Q3'], versions):
+        store.add_version(label, df)
+    assert store.add_version('2025Q4', versions[2]) == (0, 0)
+
+    reopened = HistoryStore(tmp_path)
+    assert reopened.versions == ['2025Q1', '2025Q2', '2025Q3', '2025Q4']
+    assert reopened.version_sizes()['2025Q2'] == len(versions[1])
+    for label, df in zip(reopened.versions, versions + versions[-1:]):
+        pd.testing.assert_frame_equal(by_name(reopened.snapshot(label)), by_name(df))
+
+    # Later versions are stored as deltas, not full copies
+    sizes = sorted(path.stat().st_size for path in tmp_path.glob('*.csv'))
+    assert sizes[-2] < sizes[-1] / 10
+
+    with pytest.raises(ValueError, match='already exists'):
+        reopened.add_version('2025Q1', versions[0])
+    with pytest.raises(KeyError):
+        reopened.snapshot('2030Q1')
+
+
+def test_rejects_duplicate_names(versions, tmp_path):
+    df = versions[0]
+    with pytest.raises(ValueError, match='unique'):
+        HistoryStore(tmp_path).add_version('dup', pd.concat([df, df.iloc[:1]]))
+
+
+def test_diff_versions(versions):
+    diff = diff_versions(*versions[:2]).set_index('name')
+    counts = diff['status'].value_counts()
+    assert counts['added'] == 10 and counts['removed'] == 20
+    assert counts['added'] + counts['changed'] == len(catalog_delta(*versions[:2])[0])
+    assert (diff.loc[diff['status'] != 'changed', ['ring_shift', 'time_shift']] == 0).all().all()
+    moved = diff[(diff['status'] == 'changed') & (diff['time_new'] == 'NOW')]
+    assert (moved['time_shift'] <= 0).all()
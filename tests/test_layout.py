@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import synthetic_catalog
+from techradar.config import CATEGORIES
+from techradar.layout import (
+    ANGLE_JITTER,
+    RADIUS_JITTER,
+    category_angles,
+    compact_radar_frame,
+    compute_layout,
+    prepare_radar_frame,
+    stable_uniforms,
+    trl_to_radius,
+)
+
+
+def test_uniforms_depend_only_on_the_name():
+    names = np.array([f'Technology {i}' for i in range(100)], dtype=object)
+    high, low = stable_uniforms(names)
+    shuffled = np.random.default_rng(0).permutation(100)
+    np.testing.assert_array_equal(stable_uniforms(names[shuffled])[0], high[shuffled])
+    np.testing.assert_array_equal(stable_uniforms(names[:10])[1], low[:10])
+    assert ((high >= 0) & (high < 1) & (low >= 0) & (low < 1)).all()
+
+
+def test_uniforms_are_the_same_in_another_process():
+    code = ("from techradar.layout import stable_uniforms; "
+            "print(repr(stable_uniforms(['Liquid Biopsy', 'Advanced CGM'])[0].tolist()))")
+    for seed in ('0', '1'):
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                check=True, env={'PYTHONHASHSEED': seed, 'PYTHONPATH': '.'})
+        assert eval(output.stdout) == stable_uniforms(['Liquid Biopsy', 'Advanced CGM'])[0].tolist()
+
+
+def test_adding_rows_does_not_move_others():
+    df = synthetic_catalog(500)
+    full = compute_layout(df)
+    head = compute_layout(df.iloc[:300])
+    tail = compute_layout(df.iloc[300:])
+    pd.testing.assert_frame_equal(pd.concat([head, tail]), full)
+
+
+def test_jitter_stays_near_spoke_and_ring():
+    df = synthetic_catalog(2000)
+    layout = compute_layout(df)
+    angles = df['category'].map(category_angles()).to_numpy(dtype=float)
+    radius = np.hypot(layout['x'], layout['y'])
+    assert (np.abs(np.arctan2(layout['y'], layout['x']) - angles) <= ANGLE_JITTER + 1e-9).all()
+    assert (np.abs(radius - trl_to_radius(df['trl'])) <= RADIUS_JITTER + 1e-9).all()
+
+
+def test_ring_radius_and_spokes():
+    np.testing.assert_array_equal(trl_to_radius([1, 3, 4, 6, 7, 9]), [0.3, 0.3, 0.6, 0.6, 0.9, 0.9])
+    assert np.isnan(trl_to_radius(0))
+    angles = category_angles()
+    assert list(angles) == list(CATEGORIES) and angles[CATEGORIES[0]] == 0
+    assert max(angles.values()) < np.pi
+
+
+def test_compact_frame_is_read_only():
+    frame = compact_radar_frame(prepare_radar_frame(synthetic_catalog(100, description_words=2)))
+    assert 'description' not in frame.columns
+    assert frame['x'].dtype == np.float32 and not frame['x'].to_numpy().flags.writeable
+    assert isinstance(frame['color'].dtype, pd.CategoricalDtype)
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import synthetic_catalog
+from techradar.config import TIME_TO_COLOR
+from techradar.layout import prepare_radar_frame
+from techradar.lod import (
+    AGGREGATE_MAX_SIZE,
+    AGGREGATE_MIN_SIZE,
+    LOD_THRESHOLD,
+    aggregate_hover_text,
+    aggregate_lod,
+    should_aggregate,
+)
+
+
+def test_should_aggregate():
+    everything = (['A', 'B'], (1, 9))
+    assert not should_aggregate(LOD_THRESHOLD, *everything)
+    assert should_aggregate(LOD_THRESHOLD + 1, *everything)
+    assert not should_aggregate(LOD_THRESHOLD + 1, ['A'], (1, 9))
+    assert not should_aggregate(LOD_THRESHOLD + 1, ['A', 'B'], (4, 6))
+    assert should_aggregate(LOD_THRESHOLD + 1, ['A', 'B'], (4, 7))
+
+
+def test_aggregates_match_grouped_counts_and_means():
+    df = synthetic_catalog(3000)
+    df.loc[:99, 'trl'] = 0
+    df.loc[100:149, 'business'] = np.nan
+    frame = prepare_radar_frame(df)
+    agg = aggregate_lod(frame)
+
+    drawn = frame[frame['trl'] > 0]
+    assert agg['count'].sum() == len(drawn)
+    assert len(agg) == len(agg[['category', 'radius', 'time']].drop_duplicates())
+    expected = (drawn.assign(business_score=drawn['business'].cat.codes.replace(-1, np.nan) + 1)
+                .groupby(['category', 'radius', 'time'], observed=True)
+                .agg(count=('name', 'size'), business_score=('business_score', 'mean')))
+    merged = agg.set_index(['category', 'radius', 'time']).loc[expected.index]
+    np.testing.assert_array_equal(merged['count'], expected['count'])
+    np.testing.assert_allclose(merged['business_score'], expected['business_score'])
+
+
+def test_aggregate_markers():
+    agg = aggregate_lod(prepare_radar_frame(synthetic_catalog(3000)))
+    assert agg['size'].min() >= AGGREGATE_MIN_SIZE
+    assert agg.loc[agg['count'].idxmax(), 'size'] == AGGREGATE_MAX_SIZE
+    assert (agg['color'] == agg['time'].map(TIME_TO_COLOR).astype(object)).all()
+    assert agg['line_width'].between(1, 9).all()
+    # Aggregates stay inside their category wedge
+    angle = np.arctan2(agg['y'], agg['x'])
+    assert (np.abs(angle - agg['angle']) <= np.pi / 12 + 1e-9).all()
+
+
+def test_hover_text():
+    agg = aggregate_lod(prepare_radar_frame(synthetic_catalog(300)))
+    text = aggregate_hover_text(agg)
+    assert len(text) == len(agg)
+    first = agg.iloc[0]
+    assert text[0].startswith(f"<b>{first['count']} technologies</b>")
+    assert f"Category: {first['category']}" in text[0] and 'Ring: Research' in text[0]
+    assert len(aggregate_hover_text(agg.iloc[:0])) == 0
+
+
+def test_empty_selection():
+    agg = aggregate_lod(prepare_radar_frame(synthetic_catalog(10)).iloc[:0])
+    assert agg.empty and isinstance(agg, pd.DataFrame)
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from benchmarks.common import synthetic_catalog
+from techradar.config import BUSINESS_TO_SIZE
+from techradar.data import load_technology_data
+from techradar.figure import base_figure_spec
+from techradar.layout import prepare_radar_frame
+from techradar.packing import PIXELS_PER_UNIT, SCALE_STEP, marker_scale
+
+
+def overlapping_pairs(frame):
+    drawn = frame[np.isfinite(frame['size'])]
+    x, y = drawn['x'].to_numpy(), drawn['y'].to_numpy()
+    radius = drawn['size'].to_numpy() / 2 / PIXELS_PER_UNIT
+    gap = np.hypot(x[:, None] - x, y[:, None] - y) - (radius[:, None] + radius)
+    np.fill_diagonal(gap, np.inf)
+    return int((gap < -1e-9).sum() // 2)
+
+
+@pytest.mark.parametrize('rows', [30, 200, 2000])
+def test_packed_bubbles_do_not_overlap(rows):
+    df = load_technology_data() if rows == 30 else synthetic_catalog(rows)
+    assert overlapping_pairs(prepare_radar_frame(df, pack=True)) == 0
+
+
+def test_one_size_per_business_potential():
+    frame = prepare_radar_frame(synthetic_catalog(2000), pack=True)
+    scale = marker_scale(frame, BUSINESS_TO_SIZE)
+    assert 0 < scale < 1
+    assert np.isclose(np.log(scale) / np.log(SCALE_STEP), round(np.log(scale) / np.log(SCALE_STEP)))
+    for business, size in BUSINESS_TO_SIZE.items():
+        np.testing.assert_allclose(frame.loc[frame['business'] == business, 'size'], size * scale)
+
+
+def test_legend_shows_drawn_sizes():
+    frame = prepare_radar_frame(load_technology_data(), pack=True)
+    scale = marker_scale(frame, BUSINESS_TO_SIZE)
+    spec, _ = base_figure_spec(size_scale=scale)
+    # The Business Potential legend is the one drawn in gray
+    legend = {trace['name']: trace['marker']['size'] for trace in spec['data']
+              if trace.get('marker', {}).get('color') == 'gray'}
+    drawn = frame.groupby('business', observed=True)['size'].first()
+    for business, size in drawn.items():
+        assert legend.get(business) == pytest.approx(size)
+
+
+def test_removing_a_row_only_moves_its_own_cell():
+    df = synthetic_catalog(200)
+    removed = 57
+    before = prepare_radar_frame(df, pack=True).drop(index=removed).reset_index(drop=True)
+    after = prepare_radar_frame(df.drop(index=removed).reset_index(drop=True), pack=True)
+    moved = ~(np.isclose(before['x'], after['x']) & np.isclose(before['y'], after['y']))
+    cell = (before['category'] == df.loc[removed, 'category']) & (
+        before['radius'] == prepare_radar_frame(df).loc[removed, 'radius'])
+    assert not (moved & ~cell).any()
+
+
+def test_clear_bubbles_keep_their_hashed_position():
+    df = synthetic_catalog(60)
+    hashed = prepare_radar_frame(df)
+    packed = prepare_radar_frame(df, pack=True)
+    kept = np.isclose(hashed['x'], packed['x']) & np.isclose(hashed['y'], packed['y'])
+    assert kept.any() and not kept.all()
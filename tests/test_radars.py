@@ -0,0 +1,77 @@
+import json
+
+import numpy as np
+import pytest
+
+from benchmarks.common import synthetic_catalog
+from techradar import engine
+from techradar.figure import aggregate_traces
+from techradar.layout import compact_radar_frame, prepare_radar_frame
+from techradar.packing import PIXELS_PER_UNIT
+from techradar.radars import DEFAULT_RADAR, definition_from_dict, load_registry
+
+CUSTOM_RINGS = [['Explore', 0.25, 'red'], ['Trial', 0.5, 'green'], ['Adopt', 0.95, 'blue']]
+
+
+def test_defaults_and_overrides():
+    radar = definition_from_dict({'key': 'onc', 'time_to_color': {'NOW': '#111111'},
+                                  'business_to_size': {'HIGH': 60}})
+    assert radar.title == 'Onc Technology Radar' and radar.subtitle == ''
+    assert dict(radar.time_to_color)['NOW'] == '#111111'
+    assert dict(radar.time_to_color)['1'] == dict(DEFAULT_RADAR.time_to_color)['1']
+    # Legends follow the overridden encoding maps
+    assert dict(radar.time_legend)['NOW'] == '#111111'
+    assert dict(radar.business_legend)['HIGH'] == 60
+    assert radar.desirability_legend == DEFAULT_RADAR.desirability_legend
+
+
+@pytest.mark.parametrize('spec', [
+    {'title': 'No key'},
+    {'key': 'x', 'colour': 'red'},
+    {'key': 'x', 'rings': CUSTOM_RINGS[:2]},
+    {'key': 'x', 'rings': [CUSTOM_RINGS[1], CUSTOM_RINGS[0], CUSTOM_RINGS[2]]},
+    {'key': 'x', 'rings': [CUSTOM_RINGS[0], CUSTOM_RINGS[1], ['Adopt', 1.2, 'blue']]},
+])
+def test_rejects_invalid_definitions(spec):
+    with pytest.raises(ValueError):
+        definition_from_dict(spec)
+
+
+def test_registry_resolves_relative_sources(tmp_path):
+    path = tmp_path / 'registry.json'
+    path.write_text(json.dumps([{'key': 'a', 'source': 'a.csv'}, {'key': 'b'}]))
+    registry = load_registry(path)
+    assert registry.keys == ['a', 'b'] and registry.default.key == 'a'
+    assert registry['a'].source == str(tmp_path / 'a.csv')
+
+
+def test_custom_ring_radii_place_bubbles_in_their_rings():
+    radar = definition_from_dict({'key': 'custom', 'rings': CUSTOM_RINGS})
+    assert radar.ring_radii == (0.25, 0.5, 0.95)
+    df = synthetic_catalog(1000)
+    frame = prepare_radar_frame(df, pack=True, ring_radii=radar.ring_radii)
+    ring = (df['trl'].to_numpy() - 1) // 3
+    distance = np.hypot(frame['x'], frame['y']).to_numpy()
+    bubble = frame['size'].to_numpy() / 2 / PIXELS_PER_UNIT
+    edges = [0.125, 0.375, 0.725, 1.175]
+    for i in range(3):
+        inside = distance[ring == i]
+        assert (inside - bubble[ring == i] >= edges[i] - 1e-9).all()
+        assert (inside + bubble[ring == i] <= edges[i + 1] + 1e-9).all()
+
+
+def test_custom_rings_name_aggregates():
+    radar = definition_from_dict({'key': 'custom', 'rings': CUSTOM_RINGS})
+    frame = compact_radar_frame(prepare_radar_frame(synthetic_catalog(500),
+                                                    ring_radii=radar.ring_radii))
+    [trace] = aggregate_traces(frame, radar)
+    rings = {text.split('Ring: ')[1].split('<br>')[0] for text in trace.hovertext}
+    assert rings == {'Explore', 'Trial', 'Adopt'}
+
+
+def test_ring_radii_are_part_of_the_frame_key():
+    radar = definition_from_dict({'key': 'custom', 'rings': CUSTOM_RINGS})
+    assert engine._source_key(radar) != engine._source_key(DEFAULT_RADAR)
+    default = engine.load_radar(DEFAULT_RADAR)
+    custom = engine.load_radar(radar)
+    assert not np.allclose(default.df['radius'], custom.df['radius'])
@@ -0,0 +1,75 @@
+import collections
+
+import numpy as np
+import pytest
+
+from techradar import ui
+from techradar.scoring import CRITERIA, ScoringIndex, pareto_mask
+
+Radar = collections.namedtuple('Radar', ['scoring'])
+
+
+def brute_top_k(index, weights, k, rows):
+    scores = index.scores(weights)
+    picked = []
+    for code in range(len(index.categories)):
+        group = [row for row in rows if index._categories[row] == code]
+        picked += sorted(group, key=lambda row: (-scores[row], row))[:k]
+    return np.array(picked, dtype=np.int64)
+
+
+def brute_pareto(index, dims, rows):
+    levels = index._levels[:, dims]
+    front = []
+    for code in range(len(index.categories)):
+        group = [row for row in rows if index._categories[row] == code]
+        for row in group:
+            better = [other for other in group if np.all(levels[other] >= levels[row])
+                      and np.any(levels[other] > levels[row])]
+            if not better:
+                front.append(row)
+    return np.array(front, dtype=np.int64)
+
+
+@pytest.mark.parametrize('weights', [(1, 1, 1, 1), (0, 3, 1, 0), (0, 0, 0, 0)])
+@pytest.mark.parametrize('k', [0, 1, 5])
+def test_top_k_matches_brute_force(catalog, weights, k):
+    index = ScoringIndex(catalog)
+    positions = np.arange(0, len(catalog), 2, dtype=np.int32)
+    for rows in (None, positions):
+        expected = brute_top_k(index, weights, k, range(len(catalog)) if rows is None else rows)
+        np.testing.assert_array_equal(index.top_k(weights, k, rows), expected)
+
+
+@pytest.mark.parametrize('criteria', [CRITERIA, ('trl',), ('business', 'desirability')])
+def test_pareto_front_matches_brute_force(catalog, criteria):
+    index = ScoringIndex(catalog.iloc[:600])
+    dims = [CRITERIA.index(name) for name in criteria]
+    np.testing.assert_array_equal(index.pareto_front(criteria=criteria),
+                                  brute_pareto(index, dims, range(600)))
+
+
+def test_pareto_front_with_levels_above_fifteen(catalog):
+    df = catalog.iloc[:600].assign(trl=np.random.default_rng(3).integers(1, 40, 600))
+    index = ScoringIndex(df)
+    np.testing.assert_array_equal(index.pareto_front(criteria=('trl', 'time')),
+                                  brute_pareto(index, [0, 2], range(600)))
+
+
+def test_pareto_mask_keeps_undominated_points():
+    points = np.array([[1, 2], [2, 1], [1, 1], [0, 3], [2, 1]])
+    np.testing.assert_array_equal(pareto_mask(np.unique(points, axis=0)), [True, False, True, True])
+
+
+def test_shortlist_keeps_best_scoring_of_front(catalog, monkeypatch):
+    monkeypatch.setattr(ui, 'SHORTLIST_MAX', 7)
+    index = ScoringIndex(catalog)
+    weights = dict(zip(CRITERIA, (1, 2, 0, 1)))
+    prioritisation = dict(mode='Pareto front', weights=weights)
+    shortlisted, total = ui.shortlist(Radar(index), None, prioritisation)
+
+    front = brute_pareto(index, [0, 1, 3], range(len(catalog)))
+    assert total == len(front) > 7
+    scores = index.scores(weights)
+    assert set(shortlisted) <= set(front) and len(shortlisted) == 7
+    assert scores[shortlisted].min() >= np.sort(scores[front])[-7]
@@ -0,0 +1,45 @@
+import numpy as np
+
+from techradar.search import MIN_PREFIX, SearchIndex, tokenize
+
+QUERIES = ['', 'a', 'as', 'Sens', 'lat flo', 'te', 'term1', 'term12 bio', 'technology 12', 'zzz']
+
+
+def naive_search(df, query):
+    """Rows where every query term starts a token of the name or description."""
+    terms = tokenize(query)
+    matches = []
+    for row, (name, description) in enumerate(zip(df['name'], df['description'])):
+        tokens = tokenize(name) + tokenize(description)
+        if all(any(token == term or (len(term) >= MIN_PREFIX and token.startswith(term))
+                   for token in tokens) for term in terms):
+            matches.append(row)
+    return np.array(matches, dtype=np.int64)
+
+
+def test_matches_naive_search(catalog):
+    index = SearchIndex(catalog)
+    for query in QUERIES:
+        np.testing.assert_array_equal(np.sort(index.search(query)), naive_search(catalog, query))
+
+
+def test_positions_restrict_results(catalog):
+    index = SearchIndex(catalog)
+    positions = np.arange(0, len(catalog), 3)
+    for query in QUERIES:
+        expected = np.intersect1d(naive_search(catalog, query), positions)
+        np.testing.assert_array_equal(np.sort(index.search(query, positions=positions)), expected)
+
+
+def test_limit_returns_best_matches(catalog):
+    index = SearchIndex(catalog)
+    for query in ('sens', 'te', 'term1'):
+        ranked = index.search(query)
+        np.testing.assert_array_equal(index.search(query, limit=10), ranked[:10])
+
+
+def test_separate_descriptions(catalog):
+    index = SearchIndex(catalog.drop(columns='description'),
+                        descriptions=catalog['description'].to_numpy())
+    for query in QUERIES:
+        np.testing.assert_array_equal(np.sort(index.search(query)), naive_search(catalog, query))